@@ -1,32 +1,65 @@
 from __future__ import annotations
 
-import glob
+import hashlib
 import logging
-from collections.abc import Callable
+import threading
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from enum import StrEnum
+from functools import partial
 from pathlib import Path
 
 import typer
+from git import Repo
 from pydantic import BaseModel
 
 from path_sync import sections
 from path_sync._internal import cmd_options, git_ops, header, prompt_utils, verify
 from path_sync._internal.auto_merge import PRRef, handle_auto_merge
-from path_sync._internal.file_utils import ensure_parents_write_text
+from path_sync._internal.copy_plan import CopyPlan, build_plan, load_plan, manifest_from_plan, write_plan
+from path_sync._internal.dir_cache import DirCache, iter_files
+from path_sync._internal.file_state import FileState
+from path_sync._internal.file_utils import (
+    DEFAULT_STREAM_THRESHOLD,
+    MIB,
+    CompareStats,
+    decode_text,
+)
+from path_sync._internal.file_writer import FileWriter
+from path_sync._internal.git_exec import GIT_STATS
+from path_sync._internal.incremental import SourceChanges, compute_source_changes
 from path_sync._internal.log_capture import capture_log
+from path_sync._internal.merge_cache import MergeCache, merge_key
+from path_sync._internal.mirror_cache import MirrorCache
 from path_sync._internal.models import (
+    CloneFilter,
     Destination,
     PathMapping,
+    SourceFiles,
     SrcConfig,
     SyncMode,
     find_repo_root,
     pr_already_synced,
     resolve_config_path,
 )
+from path_sync._internal.ordered_pool import run_ordered
+from path_sync._internal.path_table import PathTable
 from path_sync._internal.repo_utils import ensure_repo, resolve_repo_path
+from path_sync._internal.sparse import cone_dirs, minimal_cone, parent_dirs
+from path_sync._internal.src_manifest import SourceManifest, iter_mapping_entries
+from path_sync._internal.src_reader import FILE_READER, GitTreeReader, SourceReader
+from path_sync._internal.src_scanner import SourceEntry
+from path_sync._internal.synced_manifest import (
+    SyncedManifest,
+    build_synced_manifest,
+    load_synced_manifest,
+    write_synced_manifest,
+)
+from path_sync._internal.transform_cache import TransformCache, TransformKey
 from path_sync._internal.typer_app import app
 from path_sync._internal.verify import StepFailure, VerifyResult, VerifyStatus
-from path_sync._internal.yaml_utils import load_yaml_model
+from path_sync._internal.yaml_utils import load_yaml_model, parse_yaml_model
 
 logger = logging.getLogger(__name__)
 
@@ -39,11 +72,69 @@ EXIT_ERROR = 2
 class SyncResult:
     content_changes: int = 0
     orphans_deleted: int = 0
-    synced_paths: set[Path] = field(default_factory=set)
+    manifest_updated: bool = False
+    bytes_skipped: int = 0
+    incremental_base: str = ""
+    files_unchanged: int = 0
+    synced_paths: PathTable = field(default_factory=PathTable)
+    written: list[Path] = field(default_factory=list)
+    deleted: list[Path] = field(default_factory=list)
 
     @property
     def total(self) -> int:
-        return self.content_changes + self.orphans_deleted
+        return self.content_changes + self.orphans_deleted + int(self.manifest_updated)
+
+
+@dataclass
+class CopyRun:
+    """Run-scoped state shared by all destinations."""
+
+    manifest: SourceManifest
+    transforms: TransformCache = field(default_factory=TransformCache)
+    merge_cache: MergeCache | None = None
+    reader: SourceReader = FILE_READER
+    src_sha: str = ""
+    src_ref: str = ""
+    src_repo: Repo | None = None
+    plan: CopyPlan | None = None
+    mirror_cache: MirrorCache | None = None
+    _source_changes: dict[str, SourceChanges | None] = field(default_factory=dict, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def source_changes(self, base_sha: str) -> SourceChanges | None:
+        """Source changes since base_sha, computed once per sha and shared by destinations."""
+        with self._lock:
+            if base_sha not in self._source_changes:
+                changes = None
+                if self.src_repo is not None:
+                    changes = compute_source_changes(self.src_repo, self.manifest.src_root, base_sha, self.src_ref)
+                self._source_changes[base_sha] = changes
+            return self._source_changes[base_sha]
+
+
+@dataclass(frozen=True)
+class DestSync:
+    """Settings and services of the sync of one destination, built once by `_sync_paths` for all its file copies.
+
+    `changed` limits the copies to these source files (incremental sync), None copies every file.
+    """
+
+    dest: Destination
+    src_root: Path
+    dest_root: Path
+    config_name: str
+    dry_run: bool = False
+    force_overwrite: bool = False
+    wrap_synced_files: bool = False
+    stream_threshold: int = DEFAULT_STREAM_THRESHOLD
+    file_jobs: int = 1
+    reader: SourceReader = FILE_READER
+    writer: FileWriter = field(default_factory=FileWriter)
+    stats: CompareStats = field(default_factory=CompareStats)
+    transforms: TransformCache | None = None
+    merge_cache: MergeCache | None = None
+    synced_manifest: SyncedManifest | None = None
+    changed: frozenset[Path] | None = None
 
 
 class CopyOptions(BaseModel):
@@ -59,6 +150,21 @@ class CopyOptions(BaseModel):
     no_wait: bool = False
     no_auto_merge: bool = False
     work_dir: str = ""
+    jobs: int = 1
+    file_jobs: int = 1
+    stream_threshold: int = DEFAULT_STREAM_THRESHOLD
+    no_cache: bool = False
+    incremental: bool = False
+    src_ref: str = ""
+    source_files: SourceFiles | None = None
+    fsync: bool = False
+    dir_cache: bool = False
+    clone_depth: int = 0
+    clone_filter: CloneFilter | None = None
+    single_branch: bool = False
+    mirror_cache: str = ""
+    sparse: bool = False
+    plan_out: str = ""
     pr_title: str = ""
     labels: list[str] | None = None
     reviewers: list[str] | None = None
@@ -81,6 +187,95 @@ def copy(
     ),
     dest_filter: str = typer.Option("", "-d", "--dest", help="Filter destinations (comma-separated)"),
     work_dir: str = typer.Option("", "--work-dir", help="Clone repos here (overrides dest_path_relative)"),
+    jobs: int = typer.Option(
+        1,
+        "-j",
+        "--jobs",
+        min=1,
+        help="Sync up to N destinations in parallel (requires --no-prompt)",
+    ),
+    file_jobs: int = typer.Option(
+        1,
+        "--file-jobs",
+        min=1,
+        help="Process up to N files of a destination in parallel (logs keep the sequential order)",
+    ),
+    stream_threshold_mb: int = typer.Option(
+        DEFAULT_STREAM_THRESHOLD // MIB,
+        "--stream-threshold-mb",
+        min=0,
+        help="Stream binary files of at least N MiB instead of loading them in memory",
+    ),
+    src_ref: str = typer.Option(
+        "",
+        "--src-ref",
+        help="Read source files from this commit/branch/tag in the git object store instead of the working tree",
+    ),
+    source_files: str = typer.Option(
+        "",
+        "--source-files",
+        help="Enumerate sources by filesystem walk, git-tracked files or tracked + unignored: "
+        "walk|tracked|unignored (default: config)",
+    ),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental",
+        help="Only sync source files changed since the last synced source commit",
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Don't use the on-disk cache of unchanged section merges",
+    ),
+    git_backend: str = cmd_options.git_backend_option(),
+    clone_depth: int = typer.Option(
+        0,
+        "--clone-depth",
+        min=0,
+        help="Clone missing destinations with at most N commits of history (overrides dest clone.depth)",
+    ),
+    clone_filter: str = typer.Option(
+        "",
+        "--clone-filter",
+        help="Partial clone of missing destinations: none|blobless|treeless (overrides dest clone.filter)",
+    ),
+    single_branch: bool = typer.Option(
+        False,
+        "--single-branch",
+        help="Clone only the default branch of missing destinations (other branches are fetched when needed)",
+    ),
+    mirror_cache: str = typer.Option(
+        "",
+        "--mirror-cache",
+        envvar="PATH_SYNC_MIRROR_CACHE",
+        help="Keep bare mirrors of destination repos in DIR, fetched incrementally; missing destinations "
+        "are cloned with --reference to them",
+    ),
+    sparse: bool = typer.Option(
+        False,
+        "--sparse",
+        help="Check out only the directories written by each destination's mappings (cone mode, also dest sparse)",
+    ),
+    dir_cache: bool = typer.Option(
+        False,
+        "--dir-cache",
+        help="Reuse on-disk listings of directories unchanged since the last run (source walk, orphan scan)",
+    ),
+    fsync: bool = typer.Option(
+        False,
+        "--fsync",
+        help="Flush written files to disk in one batch at the end of each destination",
+    ),
+    plan_out: str = typer.Option(
+        "",
+        "--plan-out",
+        help="Write the resolved plan (source files, per-destination mappings, writes and deletes) as JSON",
+    ),
+    plan_in: str = typer.Option(
+        "",
+        "--plan-in",
+        help="Apply a plan written by --plan-out instead of scanning the source (replaces --name/--config-path)",
+    ),
     dry_run: bool = typer.Option(False, "--dry-run", help="Preview without writing"),
     force_overwrite: bool = typer.Option(
         False,
@@ -149,21 +344,30 @@ def copy(
     ),
 ) -> None:
     """Copy files from SRC to DEST repositories."""
+    error_code = EXIT_ERROR if detailed_exit_code else 1
+    if plan_in and (name or config_path_opt):
+        logger.error("Cannot use --plan-in with --name or --config-path (the plan contains the config)")
+        raise typer.Exit(error_code)
     if name and config_path_opt:
         logger.error("Cannot use both --name and --config-path")
-        raise typer.Exit(EXIT_ERROR if detailed_exit_code else 1)
-    if not name and not config_path_opt:
+        raise typer.Exit(error_code)
+    if not name and not config_path_opt and not plan_in:
         logger.error("Either --name or --config-path is required")
-        raise typer.Exit(EXIT_ERROR if detailed_exit_code else 1)
+        raise typer.Exit(error_code)
+    if jobs > 1 and not no_prompt:
+        logger.error("--jobs > 1 requires --no-prompt")
+        raise typer.Exit(error_code)
+    cmd_options.select_git_backend(git_backend, error_code)
+    _check_choice("--source-files", source_files, SourceFiles, error_code)
+    _check_choice("--clone-filter", clone_filter, CloneFilter, error_code)
 
     src_root = Path(src_root_opt) if src_root_opt else find_repo_root(Path.cwd())
-    config_path = Path(config_path_opt) if config_path_opt else resolve_config_path(src_root, name)
-
-    if not config_path.exists():
-        logger.error(f"Config not found: {config_path}")
-        raise typer.Exit(EXIT_ERROR if detailed_exit_code else 1)
-
-    config = load_yaml_model(config_path, SrcConfig)
+    plan = load_plan(Path(plan_in)) if plan_in else None
+    if plan is not None:
+        config = plan.config
+        src_ref = src_ref or plan.src_ref
+    else:
+        config = _load_config(src_root, name, config_path_opt, src_ref, error_code)
 
     opts = CopyOptions(
         dry_run=dry_run,
@@ -178,6 +382,21 @@ def copy(
         no_wait=no_wait,
         no_auto_merge=no_auto_merge,
         work_dir=work_dir,
+        jobs=jobs,
+        file_jobs=file_jobs,
+        stream_threshold=stream_threshold_mb * MIB,
+        no_cache=no_cache,
+        incremental=incremental,
+        src_ref=src_ref,
+        source_files=SourceFiles(source_files) if source_files else None,
+        fsync=fsync,
+        dir_cache=dir_cache,
+        clone_depth=clone_depth,
+        clone_filter=CloneFilter(clone_filter) if clone_filter else None,
+        single_branch=single_branch,
+        mirror_cache=mirror_cache,
+        sparse=sparse,
+        plan_out=plan_out,
         pr_title=pr_title or config.pr_defaults.title,
         labels=cmd_options.split_csv(pr_labels) or config.pr_defaults.labels,
         reviewers=cmd_options.split_csv(pr_reviewers) or config.pr_defaults.reviewers,
@@ -185,7 +404,7 @@ def copy(
     )
 
     try:
-        total_changes = _run_copy(config, src_root, dest_filter, opts)
+        total_changes = _run_copy(config, src_root, dest_filter, opts, plan)
     except Exception as e:
         if detailed_exit_code:
             logger.error(f"Copy failed: {e}")
@@ -196,27 +415,64 @@ def copy(
         raise typer.Exit(EXIT_CHANGES if total_changes > 0 else EXIT_NO_CHANGES)
 
 
-def _run_copy(config: SrcConfig, src_root: Path, dest_filter: str, opts: CopyOptions) -> int:
+def _check_choice(option: str, value: str, choices: type[StrEnum], error_code: int) -> None:
+    if value and value not in choices:
+        logger.error(f"Invalid {option} {value!r}, expected one of: {', '.join(choices)}")
+        raise typer.Exit(error_code)
+
+
+def _load_config(src_root: Path, name: str, config_path_opt: str, src_ref: str, error_code: int) -> SrcConfig:
+    config_path = Path(config_path_opt) if config_path_opt else resolve_config_path(src_root, name)
+    if src_ref and not config_path_opt:
+        # the config is part of the pinned snapshot, also works for bare repos without a working tree
+        rel_config = config_path.relative_to(src_root).as_posix()
+        config_text = git_ops.read_blob_at_ref(git_ops.get_repo(src_root), rel_config, src_ref)
+        if config_text is None:
+            logger.error(f"Config not found: {rel_config} at {src_ref}")
+            raise typer.Exit(error_code)
+        return parse_yaml_model(config_text, SrcConfig)
+    if not config_path.exists():
+        logger.error(f"Config not found: {config_path}")
+        raise typer.Exit(error_code)
+    return load_yaml_model(config_path, SrcConfig)
+
+
+def _run_copy(
+    config: SrcConfig, src_root: Path, dest_filter: str, opts: CopyOptions, plan: CopyPlan | None = None
+) -> int:
+    GIT_STATS.reset()
     src_repo = git_ops.get_repo(src_root)
-    current_sha = git_ops.get_current_sha(src_repo)
-    commit_ts = git_ops.get_commit_timestamp(src_repo)
+    current_sha = git_ops.get_current_sha(src_repo, opts.src_ref or "HEAD")
+    commit_ts = git_ops.get_commit_timestamp(src_repo, opts.src_ref or "HEAD")
     src_repo_url = git_ops.get_remote_url(src_repo, config.git_remote)
+    if plan is not None and plan.src_sha != current_sha:
+        raise ValueError(f"Plan was computed for source {plan.src_sha[:8]}, but the source is at {current_sha[:8]}")
 
-    destinations = config.destinations
+    destinations = plan.planned_destinations() if plan is not None else config.destinations
     if dest_filter:
         filter_names = [n.strip() for n in dest_filter.split(",")]
         destinations = [d for d in destinations if d.name in filter_names]
 
-    total_changes = 0
-    pr_refs: list[PRRef] = []
-    for dest in destinations:
-        with capture_log(dest.name) as read_log:
-            changes, pr_ref = _sync_destination(
-                config, dest, src_root, current_sha, commit_ts, src_repo_url, opts, read_log
-            )
-        total_changes += changes
-        if pr_ref:
-            pr_refs.append(pr_ref)
+    run = _start_run(config, src_root, destinations, src_repo, current_sha, opts, plan)
+    try:
+        results = _sync_destinations(config, destinations, src_root, run, current_sha, commit_ts, src_repo_url, opts)
+    finally:
+        if run.merge_cache is not None:
+            logger.info(f"Merge cache: {run.merge_cache.hits} hits, {run.merge_cache.misses} misses")
+            run.merge_cache.save()
+        if run.manifest.dir_cache is not None:
+            cache = run.manifest.dir_cache
+            logger.info(f"Directory cache: {cache.hits} hits, {cache.misses} misses")
+            cache.save()
+        if run.mirror_cache is not None:
+            logger.info(f"Mirror cache: {run.mirror_cache.summary()}")
+        logger.info(f"Git: {GIT_STATS.summary()}")
+    if run.plan is not None and opts.plan_out:
+        write_plan(Path(opts.plan_out), run.plan)
+    if opts.jobs > 1:
+        _print_run_summary(destinations, results)
+    total_changes = sum(changes for changes, _ in results)
+    pr_refs = [pr_ref for _, pr_ref in results if pr_ref]
 
     if config.auto_merge and pr_refs and not opts.no_auto_merge:
         handle_auto_merge(pr_refs, config.auto_merge, no_wait=opts.no_wait)
@@ -224,6 +480,84 @@ def _run_copy(config: SrcConfig, src_root: Path, dest_filter: str, opts: CopyOpt
     return total_changes
 
 
+def _start_run(
+    config: SrcConfig,
+    src_root: Path,
+    destinations: list[Destination],
+    src_repo: Repo,
+    current_sha: str,
+    opts: CopyOptions,
+    plan: CopyPlan | None,
+) -> CopyRun:
+    reader: SourceReader = FILE_READER
+    listing: Sequence[tuple[str, int | None]] | None = None
+    source_files = opts.source_files or config.source_files
+    if opts.src_ref:
+        tree_reader = GitTreeReader(src_repo, src_root, current_sha, opts.stream_threshold)
+        logger.info(f"Reading {len(tree_reader)} source files from {opts.src_ref} ({current_sha[:8]})")
+        reader, listing = tree_reader, tree_reader.paths
+    elif plan is None and source_files != SourceFiles.WALK:
+        listing = _index_listing(src_repo, src_root, untracked=source_files == SourceFiles.UNIGNORED)
+        logger.info(f"Matching {len(listing)} {source_files} source files from the git index")
+    if plan is not None:
+        manifest = manifest_from_plan(plan, src_root)
+    else:
+        dir_cache = DirCache.load(src_root) if opts.dir_cache and listing is None else None
+        manifest = SourceManifest.build(config, src_root, destinations, listing, dir_cache)
+    src_ref = current_sha if opts.src_ref else ""
+    if opts.plan_out:
+        plan = build_plan(config, manifest, destinations, reader, current_sha, src_ref)
+    return CopyRun(
+        manifest=manifest,
+        transforms=TransformCache(reader=reader),
+        merge_cache=None if opts.no_cache else MergeCache.load(config.name),
+        reader=reader,
+        src_sha=current_sha,
+        src_ref=src_ref,
+        src_repo=src_repo,
+        plan=plan if opts.plan_out else None,
+        mirror_cache=MirrorCache(Path(opts.mirror_cache)) if opts.mirror_cache else None,
+    )
+
+
+def _index_listing(src_repo: Repo, src_root: Path, untracked: bool) -> list[tuple[str, int | None]]:
+    """Files from the git index below src_root, sizes are stat'ed later for matched files only."""
+    paths = git_ops.list_files(src_repo, untracked=untracked)
+    prefix = git_ops.worktree_prefix(src_repo, src_root)
+    return [(path.removeprefix(prefix), None) for path in paths if path.startswith(prefix)]
+
+
+def _sync_destinations(
+    config: SrcConfig,
+    destinations: list[Destination],
+    src_root: Path,
+    run: CopyRun,
+    current_sha: str,
+    commit_ts: str,
+    src_repo_url: str,
+    opts: CopyOptions,
+) -> list[tuple[int, PRRef | None]]:
+    """Sync each destination, in parallel when opts.jobs > 1. Results are returned in config order."""
+
+    def sync_one(dest: Destination) -> tuple[int, PRRef | None]:
+        with capture_log(dest.name) as read_log:
+            return _sync_destination(config, dest, src_root, run, current_sha, commit_ts, src_repo_url, opts, read_log)
+
+    if opts.jobs <= 1 or len(destinations) <= 1:
+        return [sync_one(dest) for dest in destinations]
+
+    workers = min(opts.jobs, len(destinations))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="path-sync") as executor:
+        futures = [executor.submit(sync_one, dest) for dest in destinations]
+        try:
+            # first failure in config order wins, regardless of completion order
+            return [future.result() for future in futures]
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+
 def _close_stale_pr(dest_root: Path, copy_branch: str, opts: CopyOptions, config: SrcConfig) -> None:
     if opts.dry_run or opts.skip_commit or opts.no_pr or config.keep_pr_on_no_changes:
         return
@@ -249,6 +583,7 @@ def _sync_destination(
     config: SrcConfig,
     dest: Destination,
     src_root: Path,
+    run: CopyRun,
     current_sha: str,
     commit_ts: str,
     src_repo_url: str,
@@ -256,7 +591,11 @@ def _sync_destination(
     read_log: Callable[[], str],
 ) -> tuple[int, PRRef | None]:
     dest_root = resolve_repo_path(dest, src_root, opts.work_dir)
-    dest_repo = ensure_repo(dest, dest_root, dry_run=opts.dry_run)
+    clone = dest.clone.with_overrides(opts.clone_depth, opts.clone_filter, opts.single_branch)
+    sparse = opts.sparse or dest.sparse
+    dest_repo = ensure_repo(
+        dest, dest_root, dry_run=opts.dry_run, clone=clone, mirror_cache=run.mirror_cache, sparse=sparse
+    )
     copy_branch = dest.resolved_copy_branch(config.name)
     _print_dest_header(dest)
 
@@ -265,13 +604,16 @@ def _sync_destination(
         return 0, None
 
     if not opts.no_checkout and prompt_utils.prompt_confirm(f"Switch {dest.name} to {copy_branch}?", opts.no_prompt):
+        sparse_dirs = _set_sparse_checkout(config, dest, run, dest_repo) if sparse else None
         git_ops.prepare_copy_branch(
             repo=dest_repo,
             default_branch=dest.default_branch,
             copy_branch=copy_branch,
             from_default=opts.checkout_from_default,
         )
-    result = _sync_paths(config, dest, src_root, dest_root, opts)
+        if sparse_dirs is not None:
+            _extend_sparse_to_synced_files(dest_repo, dest_root, config.name, sparse_dirs)
+    result = _sync_paths(config, dest, run, dest_root, opts)
     _print_sync_summary(result)
 
     if result.total == 0:
@@ -309,6 +651,25 @@ def _sync_destination(
 SEPARATOR_WIDTH = 40
 
 
+def _set_sparse_checkout(config: SrcConfig, dest: Destination, run: CopyRun, dest_repo: Repo) -> list[str] | None:
+    """Limit the checkout to the dirs of dest's mappings and its verify sparse_paths, None if all are needed."""
+    extra = dest.resolve_verify(config.verify).sparse_paths
+    dirs = cone_dirs(run.manifest.resolve(config, dest), extra)
+    if dirs is None:
+        logger.info(f"{dest.name}: a mapping can write anywhere in the destination, keeping the full checkout")
+        return None
+    git_ops.set_sparse_checkout(dest_repo, dirs)
+    return dirs
+
+
+def _extend_sparse_to_synced_files(dest_repo: Repo, dest_root: Path, config_name: str, dirs: list[str]) -> None:
+    """Files synced before (possibly by removed mappings) must be checked out to be found as orphans."""
+    if (synced_manifest := load_synced_manifest(dest_root, config_name)) is None:
+        return
+    if (extended := minimal_cone([*dirs, *parent_dirs(synced_manifest.files)])) != dirs:
+        git_ops.set_sparse_checkout(dest_repo, extended)
+
+
 def _print_dest_header(dest: Destination) -> None:
     line = "─" * SEPARATOR_WIDTH
     typer.echo(f"\n{line}", err=True)
@@ -316,225 +677,316 @@ def _print_dest_header(dest: Destination) -> None:
     typer.echo(line, err=True)
 
 
+def _print_run_summary(destinations: list[Destination], results: list[tuple[int, PRRef | None]]) -> None:
+    line = "─" * SEPARATOR_WIDTH
+    typer.echo(f"\n{line}", err=True)
+    typer.echo(" Summary", err=True)
+    typer.echo(line, err=True)
+    for dest, (changes, pr_ref) in zip(destinations, results, strict=True):
+        status = f"{changes} changes" if changes else "no changes"
+        if pr_ref:
+            status += f" ({pr_ref.branch_or_url})"
+        typer.echo(f"  {dest.name}: {status}", err=True)
+    typer.echo(f"  [{GIT_STATS.summary()}]", err=True)
+
+
 def _print_sync_summary(result: SyncResult) -> None:
     if result.content_changes > 0:
         typer.echo(f"  [{result.content_changes} files synced]", err=True)
     if result.orphans_deleted > 0:
         typer.echo(f"  [-] {result.orphans_deleted} orphans deleted", err=True)
+    if result.manifest_updated:
+        typer.echo("  [synced manifest updated]", err=True)
+    if result.incremental_base:
+        typer.echo(
+            f"  [incremental since {result.incremental_base[:8]}: {result.files_unchanged} unchanged files skipped]",
+            err=True,
+        )
+    if result.bytes_skipped > 0:
+        typer.echo(f"  [{_format_bytes(result.bytes_skipped)} not read by size-first comparison]", err=True)
     if result.total > 0:
         typer.echo(f"  {result.total} changes ready.", err=True)
 
 
+def _format_bytes(size: int) -> str:
+    if size < 1024:
+        return f"{size} B"
+    value = size / 1024
+    for unit in ("KiB", "MiB"):
+        if value < 1024:
+            return f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GiB"
+
+
 def _sync_paths(
     config: SrcConfig,
     dest: Destination,
-    src_root: Path,
+    run: CopyRun,
     dest_root: Path,
     opts: CopyOptions,
 ) -> SyncResult:
     result = SyncResult()
-    for mapping in config.resolve_paths(dest):
-        changes, paths = _sync_path(
-            mapping,
-            src_root,
+    synced_manifest = load_synced_manifest(dest_root, config.name)
+    source_changes = _resolve_source_changes(config, dest, run, synced_manifest, opts)
+    sync = DestSync(
+        dest,
+        run.manifest.src_root,
+        dest_root,
+        config.name,
+        dry_run=opts.dry_run,
+        force_overwrite=opts.force_overwrite,
+        wrap_synced_files=config.wrap_synced_files,
+        stream_threshold=opts.stream_threshold,
+        file_jobs=opts.file_jobs,
+        reader=run.reader,
+        writer=FileWriter(fsync=opts.fsync),
+        transforms=run.transforms,
+        merge_cache=run.merge_cache,
+        synced_manifest=synced_manifest,
+        changed=source_changes.changed if source_changes else None,
+    )
+    # tasks of all mappings go through one pool so files overlap across mappings too
+    tasks: list[_FileTask] = []
+    for mapping, entries in run.manifest.resolve(config, dest):
+        tasks += _file_tasks(mapping, entries, sync, result.synced_paths)
+        if sync.changed is not None:
+            result.files_unchanged += sum(entry.src_path not in sync.changed for entry in entries)
+    result.content_changes = _run_file_tasks(tasks, sync.file_jobs, result.written)
+    result.bytes_skipped = sync.stats.bytes_skipped
+    if source_changes:
+        result.incremental_base = source_changes.base_sha
+
+    # without deleted/renamed source files an incremental run can't produce orphans
+    skip_orphans = opts.skip_orphan_cleanup or (source_changes is not None and not source_changes.deleted)
+    if not skip_orphans:
+        result.orphans_deleted = _cleanup_orphans(
             dest_root,
-            dest,
             config.name,
+            result.synced_paths,
             opts.dry_run,
-            opts.force_overwrite,
-            config.wrap_synced_files,
+            sync.synced_manifest,
+            result.deleted,
+            opts.dir_cache,
         )
-        result.content_changes += changes
-        result.synced_paths.update(paths)
-
-    if not opts.skip_orphan_cleanup:
-        result.orphans_deleted = _cleanup_orphans(dest_root, config.name, result.synced_paths, opts.dry_run)
+    if not opts.dry_run:
+        new_manifest = build_synced_manifest(
+            dest_root,
+            config.name,
+            result.synced_paths,
+            sync.synced_manifest,
+            {path.relative_to(dest_root).as_posix() for path in result.written},
+            keep_missing=skip_orphans,
+            src_sha=run.src_sha,
+            config_digest=_config_digest(config, dest),
+        )
+        result.manifest_updated = write_synced_manifest(dest_root, new_manifest)
+        sync.writer.sync()
+    if run.plan is not None:
+        run.plan.destination(dest.name).record(dest_root, result.written, result.deleted)
     return result
 
 
-def _iter_sync_files(
-    mapping: PathMapping,
-    src_root: Path,
-    dest_root: Path,
-):
-    src_pattern = src_root / mapping.src_path
-
-    if "*" in mapping.src_path:
-        glob_prefix = mapping.src_path.split("*")[0].rstrip("/")
-        dest_base = mapping.dest_path or glob_prefix
-        matches = glob.glob(str(src_pattern), recursive=True)
-        if not matches:
-            logger.warning(f"Glob matched no files: {mapping.src_path}")
-        for src_file in matches:
-            src_path = Path(src_file)
-            if src_path.is_file() and not mapping.is_excluded(src_path):
-                rel = src_path.relative_to(src_root / glob_prefix)
-                dest_key = str(Path(dest_base) / rel)
-                yield src_path, dest_key, dest_root / dest_base / rel
-    elif src_pattern.is_dir():
-        dest_base = mapping.resolved_dest_path()
-        for src_file in src_pattern.rglob("*"):
-            if src_file.is_file() and not mapping.is_excluded(src_file):
-                rel = src_file.relative_to(src_pattern)
-                dest_key = str(Path(dest_base) / rel)
-                yield src_file, dest_key, dest_root / dest_base / rel
-    elif src_pattern.is_file():
-        dest_base = mapping.resolved_dest_path()
-        yield src_pattern, dest_base, dest_root / dest_base
-    else:
-        logger.warning(f"Source not found: {mapping.src_path}")
+def _resolve_source_changes(
+    config: SrcConfig,
+    dest: Destination,
+    run: CopyRun,
+    synced_manifest: SyncedManifest | None,
+    opts: CopyOptions,
+) -> SourceChanges | None:
+    """Source changes since the last sync of dest, or None for a full sync."""
+    if not opts.incremental:
+        return None
+    if synced_manifest is None or not synced_manifest.src_sha:
+        logger.info(f"{dest.name}: no previously synced source commit, running a full sync")
+        return None
+    if synced_manifest.config_digest != _config_digest(config, dest):
+        logger.info(f"{dest.name}: config changed since the last sync, running a full sync")
+        return None
+    base_sha = synced_manifest.src_sha
+    changes = run.source_changes(base_sha)
+    if changes is None:
+        return None
+    logger.info(f"{dest.name}: incremental sync since {base_sha[:8]} ({len(changes.changed)} changed source files)")
+    return changes
 
 
-def _sync_path(
-    mapping: PathMapping,
-    src_root: Path,
-    dest_root: Path,
-    dest: Destination,
-    config_name: str,
-    dry_run: bool,
-    force_overwrite: bool,
-    wrap_synced_files: bool = False,
-) -> tuple[int, set[Path]]:
-    changes = 0
-    synced: set[Path] = set()
+def _config_digest(config: SrcConfig, dest: Destination) -> str:
+    """Digest of the settings deciding what is synced to dest, the config file may live anywhere (or in a plan)."""
+    settings = config.model_dump_json(exclude={"destinations"}) + dest.model_dump_json()
+    return hashlib.sha256(settings.encode()).hexdigest()
 
-    should_wrap = mapping.should_wrap(wrap_synced_files)
-    for src_path, dest_key, dest_path in _iter_sync_files(mapping, src_root, dest_root):
-        if dest.is_skipped(dest_key):
-            continue
-        changes += _copy_file(
-            src_path,
-            dest_path,
-            dest,
-            dest_key,
-            config_name,
-            mapping.sync_mode,
-            dry_run,
-            force_overwrite,
-            should_wrap,
-        )
-        synced.add(dest_path)
 
-    return changes, synced
+_FileTask = tuple[Path, Callable[[], int]]
 
 
-def _copy_file(
-    src: Path,
-    dest_path: Path,
-    dest: Destination,
-    dest_key: str,
-    config_name: str,
-    sync_mode: SyncMode,
-    dry_run: bool,
-    force_overwrite: bool = False,
-    should_wrap: bool = False,
-) -> int:
-    try:
-        src_content = header.remove_header(src.read_text())
-    except UnicodeDecodeError:
-        return _copy_binary_file(src, dest_path, sync_mode, dry_run)
+def _file_tasks(
+    mapping: PathMapping, entries: list[SourceEntry] | None, sync: DestSync, synced: PathTable
+) -> list[_FileTask]:
+    """One (dest path, copy) task per file of the mapping that needs syncing; all its dest keys are added to synced."""
+    if entries is None:
+        entries = list(iter_mapping_entries(mapping, sync.src_root))
+    skip_matcher = sync.dest.skip_matcher()
+    tasks: list[_FileTask] = []
+    for entry in entries:
+        dest_key = entry.dest_key
+        if skip_matcher.matches(dest_key):
+            continue
+        synced.add(dest_key)
+        if sync.changed is not None and entry.src_path not in sync.changed:
+            continue
+        tasks.append((sync.dest_root / dest_key, partial(_copy_file, entry.src_path, dest_key, mapping, sync)))
+    return tasks
+
+
+def _run_file_tasks(tasks: list[_FileTask], file_jobs: int, written: list[Path] | None = None) -> int:
+    """Run copies (overlapping up to file_jobs files), results and logs are handled in task order."""
+    changes = 0
+    results = run_ordered([copy for _, copy in tasks], file_jobs)
+    for (dest_path, _), file_changes in zip(tasks, results, strict=True):
+        if file_changes and written is not None:
+            written.append(dest_path)
+        changes += file_changes
+    return changes
+
+
+def _copy_file(src: Path, dest_key: str, mapping: PathMapping, sync: DestSync) -> int:
+    dest_path = sync.dest_root / dest_key
+    sync_mode = mapping.sync_mode
+    key = TransformKey(src, dest_key, mapping.should_wrap(sync.wrap_synced_files), sync_mode, mapping.binary_hint(src))
+    state = FileState(key, dest_path, sync.transforms, sync.reader)
+    if sync_mode == SyncMode.SCAFFOLD and state.dest_exists:
+        return 0  # never touched, the source isn't read
+    if state.transform().is_binary:
+        return _copy_binary_file(state, sync)
 
     match sync_mode:
         case SyncMode.SCAFFOLD:
-            return _handle_scaffold(src_content, dest_path, dry_run)
+            return _write_file(dest_path, state.transform().rendered or b"", sync)
         case SyncMode.REPLACE:
-            return _handle_replace(src_content, dest_path, dry_run)
+            return _handle_replace(state, sync)
         case SyncMode.SYNC:
-            skip_list = dest.skip_sections.get(dest_key, [])
-            return _handle_sync(src_content, dest_path, skip_list, config_name, dry_run, force_overwrite, should_wrap)
+            return _handle_sync(state, sync.dest.skip_sections.get(dest_key, []), sync)
 
 
-def _copy_binary_file(src: Path, dest_path: Path, sync_mode: SyncMode, dry_run: bool) -> int:
-    src_bytes = src.read_bytes()
-    match sync_mode:
+def _copy_binary_file(state: FileState, sync: DestSync) -> int:
+    match state.key.sync_mode:
         case SyncMode.SCAFFOLD:
-            if dest_path.exists():
+            if state.dest_exists:
                 return 0
         case SyncMode.REPLACE | SyncMode.SYNC:
-            if dest_path.exists() and dest_path.read_bytes() == src_bytes:
+            if state.dest_equals_src(sync.stats):
                 return 0
-    return _write_binary_file(dest_path, src_bytes, dry_run)
+    return _write_binary_file(state, sync)
 
 
-def _write_binary_file(dest_path: Path, content: bytes, dry_run: bool) -> int:
-    if dry_run:
+def _write_binary_file(state: FileState, sync: DestSync) -> int:
+    dest_path = state.dest_path
+    if sync.dry_run:
         logger.info(f"[DRY RUN] Would write binary: {dest_path}")
         return 1
-    dest_path.parent.mkdir(parents=True, exist_ok=True)
-    dest_path.write_bytes(content)
+    if state.reader.size(state.src) >= sync.stream_threshold:
+        sync.writer.copy_from(state.reader, state.src, dest_path)
+    else:
+        sync.writer.write_bytes(dest_path, state.reader.read_bytes(state.src))
     logger.info(f"Wrote binary: {dest_path}")
     return 1
 
 
-def _handle_scaffold(content: str, dest_path: Path, dry_run: bool) -> int:
-    if dest_path.exists():
+def _handle_replace(state: FileState, sync: DestSync) -> int:
+    content = state.transform().rendered or b""
+    if state.dest_text_equals(content, sync.stats):
         return 0
-    return _write_file(dest_path, content, dry_run)
-
+    return _write_file(state.dest_path, content, sync)
 
-def _handle_replace(content: str, dest_path: Path, dry_run: bool) -> int:
-    if dest_path.exists() and dest_path.read_text() == content:
-        return 0
-    return _write_file(dest_path, content, dry_run)
 
-
-def _handle_sync(
-    src_content: str,
-    dest_path: Path,
-    skip_list: list[str],
-    config_name: str,
-    dry_run: bool,
-    force_overwrite: bool,
-    should_wrap: bool = False,
-) -> int:
+def _handle_sync(state: FileState, skip_list: list[str], sync: DestSync) -> int:
+    dest_path = state.dest_path
     if not header.has_known_comment_prefix(dest_path):
         logger.warning(f"No comment config for {dest_path.suffix!r}, cannot sync sections/headers for: {dest_path}")
         return 0
 
-    if sections.has_sections(src_content, dest_path):
-        return _handle_sync_sections(src_content, dest_path, skip_list, config_name, dry_run, force_overwrite)
+    merge_cache = sync.merge_cache
+    transform = state.transform()
+    dest_bytes = state.dest_bytes()
+    cache_key = None
+    if merge_cache is not None and dest_bytes is not None:
+        dest_digest = hashlib.sha256(dest_bytes).hexdigest()
+        cache_key = merge_key(
+            transform.merge_digest(),
+            dest_digest,
+            skip_list,
+            state.key.should_wrap,
+            sync.config_name,
+            dest_path.name,
+            sync.force_overwrite,
+        )
+        if merge_cache.is_unchanged(cache_key):
+            return 0
+
+    existing = decode_text(dest_bytes) if dest_bytes is not None else None
+    if transform.section_content is not None and transform.src_sections is not None:
+        new_content = _merge_sync_sections(
+            transform.section_content,
+            transform.src_sections,
+            existing,
+            dest_path,
+            skip_list,
+            sync.config_name,
+            sync.force_overwrite,
+        )
+    else:
+        new_content = _merge_sync_plain(
+            transform.content or "", existing, dest_path, sync.config_name, sync.force_overwrite
+        )
+
+    if new_content is None:
+        if merge_cache is not None and cache_key is not None:
+            merge_cache.add_unchanged(cache_key)
+        return 0
+    return _write_file(dest_path, new_content, sync)
 
-    if should_wrap:
-        wrapped = sections.wrap_in_synced_section(src_content, dest_path)
-        return _handle_sync_sections(wrapped, dest_path, skip_list, config_name, dry_run, force_overwrite)
 
-    if dest_path.exists():
-        existing = dest_path.read_text()
+def _merge_sync_plain(
+    src_content: str, existing: str | None, dest_path: Path, config_name: str, force_overwrite: bool
+) -> str | None:
+    """Return the content to write, or None when dest is up to date or opted out."""
+    if existing is not None:
         has_hdr = header.has_header(existing)
         if not has_hdr and not force_overwrite:
             logger.info(f"Skipping {dest_path} (header removed - opted out)")
-            return 0
+            return None
         if header.remove_header(existing) == src_content and has_hdr:
-            return 0
-
-    new_content = header.add_header(src_content, dest_path, config_name)
-    return _write_file(dest_path, new_content, dry_run)
+            return None
+    return header.add_header(src_content, dest_path, config_name)
 
 
-def _write_file(dest_path: Path, content: str, dry_run: bool) -> int:
-    if dry_run:
+def _write_file(dest_path: Path, content: str | bytes, sync: DestSync) -> int:
+    if sync.dry_run:
         logger.info(f"[DRY RUN] Would write: {dest_path}")
         return 1
-    ensure_parents_write_text(dest_path, content)
+    if isinstance(content, bytes):
+        sync.writer.write_bytes(dest_path, content)
+    else:
+        sync.writer.write_text(dest_path, content)
     logger.info(f"Wrote: {dest_path}")
     return 1
 
 
-def _handle_sync_sections(
+def _merge_sync_sections(
     src_content: str,
+    src_sections: list[sections.Section],
+    existing: str | None,
     dest_path: Path,
     skip_list: list[str],
     config_name: str,
-    dry_run: bool,
     force_overwrite: bool,
-) -> int:
-    src_sections = sections.parse_sections(src_content, dest_path)
-
-    if dest_path.exists():
-        existing = dest_path.read_text()
+) -> str | None:
+    """Return the content to write, or None when dest is up to date or opted out."""
+    if existing is not None:
         if not header.has_header(existing) and not force_overwrite:
             logger.info(f"Skipping {dest_path} (header removed - opted out)")
-            return 0
+            return None
         dest_body = header.remove_header(existing)
         new_body = sections.replace_sections(dest_body, src_sections, dest_path, skip_list)
     elif skip_list:
@@ -544,39 +996,83 @@ def _handle_sync_sections(
         new_body = src_content
 
     new_content = header.add_header(new_body, dest_path, config_name)
-
-    if dest_path.exists() and dest_path.read_text() == new_content:
-        return 0
-
-    return _write_file(dest_path, new_content, dry_run)
+    return None if new_content == existing else new_content
 
 
 def _cleanup_orphans(
     dest_root: Path,
     config_name: str,
-    synced_paths: set[Path],
+    synced_paths: PathTable,
     dry_run: bool,
+    synced_manifest: SyncedManifest | None = None,
+    deleted_paths: list[Path] | None = None,
+    use_dir_cache: bool = False,
 ) -> int:
     deleted = 0
-    for path in _find_files_with_config(dest_root, config_name):
-        if path not in synced_paths:
-            if dry_run:
-                logger.info(f"[DRY RUN] Would delete orphan: {path}")
-            else:
-                path.unlink()
-                logger.info(f"Deleted orphan: {path}")
-            deleted += 1
+    for path in _find_orphans(dest_root, config_name, synced_paths, synced_manifest, use_dir_cache):
+        if dry_run:
+            logger.info(f"[DRY RUN] Would delete orphan: {path}")
+        else:
+            path.unlink()
+            logger.info(f"Deleted orphan: {path}")
+        deleted += 1
+        if deleted_paths is not None:
+            deleted_paths.append(path)
     return deleted
 
 
-def _find_files_with_config(dest_root: Path, config_name: str) -> list[Path]:
-    result = []
-    for path in dest_root.rglob("*"):
-        if ".git" in path.parts:
-            continue
-        if header.file_get_config_name(path) == config_name:
-            result.append(path)
-    return result
+def _find_orphans(
+    dest_root: Path,
+    config_name: str,
+    synced_paths: PathTable,
+    synced_manifest: SyncedManifest | None,
+    use_dir_cache: bool = False,
+) -> list[Path]:
+    """Previously synced files that were not synced this run.
+
+    Uses the synced manifest when available, only files still carrying this config's header are returned
+    (opted-out and scaffold/replace files are kept). Falls back to a header scan of the destination.
+    """
+    if synced_manifest is None:
+        return _find_files_with_config(dest_root, config_name, synced_paths, use_dir_cache)
+    return _unsynced_with_config(dest_root, config_name, synced_manifest.files, synced_paths)
+
+
+def _find_files_with_config(
+    dest_root: Path, config_name: str, synced_paths: PathTable | None = None, use_dir_cache: bool = False
+) -> list[Path]:
+    candidates = _iter_orphan_candidates(dest_root, use_dir_cache)
+    return _unsynced_with_config(dest_root, config_name, candidates, synced_paths or PathTable())
+
+
+def _unsynced_with_config(
+    dest_root: Path, config_name: str, keys: Iterable[str], synced_paths: PathTable
+) -> list[Path]:
+    """Paths of the keys not synced this run whose header names config_name; only those become `Path`s."""
+    paths = (dest_root / key for key in keys if key not in synced_paths)
+    return [path for path in paths if header.file_get_config_name(path) == config_name]
+
+
+def _iter_orphan_candidates(dest_root: Path, use_dir_cache: bool = False) -> Iterator[str]:
+    """Relative keys of files that may carry a path-sync header, filtered by known comment extension.
+
+    In a git repo only tracked files plus untracked, non-ignored files are listed, so ignored trees
+    (node_modules, .venv, build output) and submodule contents are never walked.
+    Otherwise the tree is walked, with use_dir_cache reusing listings of directories unchanged since the last walk.
+    """
+    dir_cache: DirCache | None = None
+    if git_ops.is_git_repo(dest_root):
+        repo = git_ops.get_repo(dest_root)
+        candidates: Iterable[str] = git_ops.list_files(repo, untracked=True)
+    else:
+        dir_cache = DirCache.load(dest_root) if use_dir_cache else None
+        files = iter_files(dest_root, frozenset({".git"}), dir_cache)
+        candidates = (path.relative_to(dest_root).as_posix() for path in files)
+    for key in candidates:
+        if header.has_known_comment_prefix(key):
+            yield key
+    if dir_cache is not None:
+        dir_cache.save()
 
 
 def _push_and_pr(
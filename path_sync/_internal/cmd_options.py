@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
+import logging
+
 import typer
 
+from path_sync._internal.git_backend import GitBackendName, select_backend
+
+logger = logging.getLogger(__name__)
+
 
 def pr_reviewers_option() -> str:
     return typer.Option("", "--pr-reviewers", help="Comma-separated PR reviewers")
@@ -17,6 +23,23 @@ def pr_labels_option() -> str:
     return typer.Option("", "--pr-labels", help="Comma-separated PR labels")
 
 
+def git_backend_option() -> str:
+    return typer.Option(
+        GitBackendName.CLI,
+        "--git-backend",
+        envvar="PATH_SYNC_GIT_BACKEND",
+        help="Git implementation for ref/blob reads, status and commits: cli|libgit2 (in process, needs pygit2)",
+    )
+
+
+def select_git_backend(name: str, error_code: int = 1) -> None:
+    try:
+        select_backend(name)
+    except ValueError as e:
+        logger.error(f"Invalid --git-backend {name!r}: {e}")
+        raise typer.Exit(error_code)
+
+
 def split_csv(value: str) -> list[str] | None:
     """Split comma-separated string, returns None if empty."""
     return [v.strip() for v in value.split(",")] if value else None
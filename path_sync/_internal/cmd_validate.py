@@ -5,7 +5,7 @@ from pathlib import Path
 
 import typer
 
-from path_sync._internal import git_ops
+from path_sync._internal import cmd_options, git_ops
 from path_sync._internal.models import find_repo_root
 from path_sync._internal.typer_app import app
 from path_sync._internal.validation import parse_skip_sections, validate_no_unauthorized_changes
@@ -32,8 +32,10 @@ def validate_no_changes(
         "--src-root",
         help="Source repo root (default: find git root from cwd)",
     ),
+    git_backend: str = cmd_options.git_backend_option(),
 ) -> None:
     """Validate no unauthorized changes to synced files."""
+    cmd_options.select_git_backend(git_backend)
     repo_root = Path(src_root_opt) if src_root_opt else find_repo_root(Path.cwd())
     repo = git_ops.get_repo(repo_root)
 
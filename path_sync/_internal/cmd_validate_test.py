@@ -25,6 +25,7 @@ def test_validate_no_changes_passes_branch_to_validation(tmp_path: Path):
             branch="develop",
             skip_sections_opt="",
             src_root_opt=str(tmp_path),
+            git_backend="cli",
         )
 
         validate_fn.assert_called_once()
@@ -48,6 +49,7 @@ def test_validate_no_changes_skips_when_on_sync_branch(tmp_path: Path):
             branch="main",
             skip_sections_opt="",
             src_root_opt=str(tmp_path),
+            git_backend="cli",
         )
 
         validate_fn.assert_not_called()
@@ -68,6 +70,7 @@ def test_validate_no_changes_skips_when_on_base_branch(tmp_path: Path):
             branch="main",
             skip_sections_opt="",
             src_root_opt=str(tmp_path),
+            git_backend="cli",
         )
 
         validate_fn.assert_not_called()
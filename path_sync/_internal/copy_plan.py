@@ -0,0 +1,162 @@
+"""Serializable copy plan: `copy --plan-out` writes it, `copy --plan-in` applies it without scanning the source."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+
+from path_sync._internal.file_utils import STREAM_CHUNK_SIZE, ensure_parents_write_text
+from path_sync._internal.models import Destination, PathMapping, SrcConfig
+from path_sync._internal.src_manifest import SourceManifest
+from path_sync._internal.src_reader import SourceReader
+from path_sync._internal.src_scanner import SourceEntry
+
+logger = logging.getLogger(__name__)
+
+PLAN_FORMAT = 1
+
+
+class PlanEntry(BaseModel):
+    """One source file; `src` is relative to the source root, `sha256` hashes its content."""
+
+    src: str
+    dest_key: str
+    size: int
+    sha256: str
+
+
+class PlanSource(BaseModel):
+    """The expanded files of one mapping: `config.paths[index]`, or `config.path_groups[group][index]`."""
+
+    group: str = ""
+    index: int
+    src_path: str
+    entries: list[PlanEntry] = Field(default_factory=list)
+
+
+class DestinationPlan(BaseModel):
+    """Effective settings of one destination and, once synced, the destination paths written and deleted."""
+
+    name: str
+    sources: list[int] = Field(default_factory=list)
+    skip_file_patterns: list[str] = Field(default_factory=list)
+    skip_sections: dict[str, list[str]] = Field(default_factory=dict)
+    synced: bool = False
+    writes: list[str] = Field(default_factory=list)
+    deletes: list[str] = Field(default_factory=list)
+
+    def record(self, dest_root: Path, written: Iterable[Path], deleted: Iterable[Path]) -> None:
+        self.synced = True
+        self.writes = sorted(path.relative_to(dest_root).as_posix() for path in written)
+        self.deletes = sorted(path.relative_to(dest_root).as_posix() for path in deleted)
+
+
+class CopyPlan(BaseModel):
+    """Fully resolved sync of one config at one source commit.
+
+    `sources` lists every mapping used by the planned destinations with its expanded files,
+    each destination refers to them by index in `SrcConfig.resolve_paths` order.
+    """
+
+    format: int = PLAN_FORMAT
+    src_sha: str
+    src_ref: str = ""
+    config: SrcConfig
+    sources: list[PlanSource] = Field(default_factory=list)
+    destinations: list[DestinationPlan] = Field(default_factory=list)
+
+    def mapping(self, source: PlanSource) -> PathMapping:
+        mappings = self.config.path_groups[source.group] if source.group else self.config.paths
+        return mappings[source.index]
+
+    def destination(self, name: str) -> DestinationPlan:
+        for dest in self.destinations:
+            if dest.name == name:
+                return dest
+        raise ValueError(f"Destination not in plan: {name}")
+
+    def planned_destinations(self) -> list[Destination]:
+        return [self.config.find_destination(dest.name) for dest in self.destinations]
+
+
+def _mapping_refs(config: SrcConfig) -> dict[int, tuple[str, int]]:
+    refs = {id(m): ("", i) for i, m in enumerate(config.paths)}
+    for group, mappings in config.path_groups.items():
+        refs.update({id(m): (group, i) for i, m in enumerate(mappings)})
+    return refs
+
+
+def _content_sha256(reader: SourceReader, path: Path) -> str:
+    digest = hashlib.sha256()
+    with reader.open(path) as f:
+        while chunk := f.read(STREAM_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def build_plan(
+    config: SrcConfig,
+    manifest: SourceManifest,
+    destinations: Sequence[Destination],
+    reader: SourceReader,
+    src_sha: str,
+    src_ref: str = "",
+) -> CopyPlan:
+    """Plan the sources of destinations; writes and deletes are recorded per destination while syncing."""
+    refs = _mapping_refs(config)
+    plan = CopyPlan(src_sha=src_sha, src_ref=src_ref, config=config)
+    source_index: dict[int, int] = {}
+    for dest in destinations:
+        dest_plan = DestinationPlan(
+            name=dest.name,
+            skip_file_patterns=sorted(dest.skip_file_patterns),
+            skip_sections=dest.skip_sections,
+        )
+        for mapping, entries in manifest.resolve(config, dest):
+            if id(mapping) not in source_index:
+                group, index = refs[id(mapping)]
+                source_index[id(mapping)] = len(plan.sources)
+                plan.sources.append(
+                    PlanSource(
+                        group=group,
+                        index=index,
+                        src_path=mapping.src_path,
+                        entries=[_plan_entry(manifest.src_root, entry, reader) for entry in entries],
+                    )
+                )
+            dest_plan.sources.append(source_index[id(mapping)])
+        plan.destinations.append(dest_plan)
+    return plan
+
+
+def _plan_entry(src_root: Path, entry: SourceEntry, reader: SourceReader) -> PlanEntry:
+    return PlanEntry(
+        src=entry.src_path.relative_to(src_root).as_posix(),
+        dest_key=entry.dest_key,
+        size=entry.size,
+        sha256=_content_sha256(reader, entry.src_path),
+    )
+
+
+def manifest_from_plan(plan: CopyPlan, src_root: Path) -> SourceManifest:
+    manifest = SourceManifest(src_root)
+    for source in plan.sources:
+        entries = [SourceEntry(src_root / e.src, e.dest_key, e.size, 0) for e in source.entries]
+        manifest.add_entries(plan.mapping(source), entries)
+    return manifest
+
+
+def load_plan(path: Path) -> CopyPlan:
+    plan = CopyPlan.model_validate_json(path.read_text())
+    if plan.format != PLAN_FORMAT:
+        raise ValueError(f"Unsupported plan format {plan.format} in {path}, expected {PLAN_FORMAT}")
+    return plan
+
+
+def write_plan(path: Path, plan: CopyPlan) -> None:
+    ensure_parents_write_text(path, plan.model_dump_json(indent=2) + "\n")
+    logger.info(f"Wrote plan: {path}")
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+from path_sync._internal import src_manifest
+from path_sync._internal.copy_plan import build_plan, load_plan, manifest_from_plan, write_plan
+from path_sync._internal.models import Destination, PathMapping, SrcConfig
+from path_sync._internal.src_manifest import SourceManifest
+from path_sync._internal.src_reader import FILE_READER
+
+
+def _config() -> SrcConfig:
+    return SrcConfig(
+        name="test",
+        paths=[PathMapping(src_path="docs", dest_path="site", exclude_file_patterns={"b.*", "a.tmp"})],
+        path_groups={"tools": [PathMapping(src_path="justfile")]},
+        destinations=[
+            Destination(name="d1", dest_path_relative="../d1", skip_file_patterns={"site/z.md", "site/y.md"}),
+            Destination(name="d2", dest_path_relative="../d2", include_groups=["tools"]),
+        ],
+    )
+
+
+def _write_sources(src_root: Path) -> None:
+    (src_root / "docs").mkdir(parents=True)
+    (src_root / "docs/a.md").write_text("a")
+    (src_root / "justfile").write_text("build:\n")
+
+
+def test_build_plan_shares_sources_between_destinations(tmp_path: Path):
+    _write_sources(tmp_path)
+    config = _config()
+    manifest = SourceManifest.build(config, tmp_path, config.destinations)
+
+    plan = build_plan(config, manifest, config.destinations, FILE_READER, "abc123")
+
+    assert [(s.group, s.index, [e.src for e in s.entries]) for s in plan.sources] == [
+        ("", 0, ["docs/a.md"]),
+        ("tools", 0, ["justfile"]),
+    ]
+    assert plan.sources[0].entries[0].sha256 == hashlib.sha256(b"a").hexdigest()
+    assert [(d.name, d.sources) for d in plan.destinations] == [("d1", [0]), ("d2", [0, 1])]
+    assert plan.destination("d1").skip_file_patterns == ["site/y.md", "site/z.md"]
+    assert not plan.destination("d1").synced
+
+
+def test_plan_round_trip_applies_without_scanning(tmp_path: Path):
+    src_root = tmp_path / "src"
+    _write_sources(src_root)
+    config = _config()
+    plan = build_plan(
+        config, SourceManifest.build(config, src_root, config.destinations), config.destinations, FILE_READER, "abc"
+    )
+    dest_root = tmp_path / "d1"
+    plan.destination("d1").record(dest_root, [dest_root / "site/a.md"], [dest_root / "old.md"])
+    path = tmp_path / "out/plan.json"
+    write_plan(path, plan)
+    # sets are dumped sorted so plans diff cleanly
+    assert json.loads(path.read_text())["config"]["paths"][0]["exclude_file_patterns"] == ["a.tmp", "b.*"]
+
+    loaded = load_plan(path)
+    assert loaded == plan
+    with patch.object(src_manifest, "scan_sources") as mock_scan:
+        manifest = manifest_from_plan(loaded, src_root)
+        resolved = manifest.resolve(loaded.config, loaded.config.find_destination("d2"))
+    mock_scan.assert_not_called()
+    assert [[e.dest_key for e in entries] for _, entries in resolved] == [["site/a.md"], ["justfile"]]
+    assert loaded.destination("d1").writes == ["site/a.md"]
+    assert loaded.destination("d1").deletes == ["old.md"]
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Protocol
+
+from path_sync._internal.merge_cache import default_cache_dir
+
+logger = logging.getLogger(__name__)
+
+CACHE_FORMAT = 1
+# a directory changed within this window may change again without a new mtime, its listing is not cached
+RACY_WINDOW_NS = 2_000_000_000
+
+_DIR = "d"
+_DIR_LINK = "D"
+_FILE = "f"
+_OTHER = "o"
+
+
+class DirEntryLike(Protocol):
+    """The `os.DirEntry` subset used by the scanners."""
+
+    @property
+    def name(self) -> str: ...
+
+    def is_dir(self, *, follow_symlinks: bool = True) -> bool: ...
+
+    def is_file(self) -> bool: ...
+
+    def stat(self) -> os.stat_result: ...
+
+
+def scandir_sorted(path: Path) -> list[DirEntryLike]:
+    with os.scandir(path) as it:
+        return sorted(it, key=lambda e: e.name)
+
+
+class CachedEntry:
+    __slots__ = ("kind", "name", "path")
+
+    def __init__(self, directory: Path, name: str, kind: str) -> None:
+        self.path = directory / name
+        self.name = name
+        self.kind = kind
+
+    def is_dir(self, *, follow_symlinks: bool = True) -> bool:
+        return self.kind == _DIR or (follow_symlinks and self.kind == _DIR_LINK)
+
+    def is_file(self) -> bool:
+        return self.kind == _FILE
+
+    def stat(self) -> os.stat_result:
+        return os.stat(self.path)
+
+
+def _kind(entry: os.DirEntry[str]) -> str:
+    if entry.is_dir(follow_symlinks=False):
+        return _DIR
+    if entry.is_dir():
+        return _DIR_LINK
+    return _FILE if entry.is_file() else _OTHER
+
+
+class DirCache:
+    """On-disk directory listings of one tree, reused while a directory's mtime and inode are unchanged.
+
+    Adding, removing or renaming an entry updates the directory's mtime, so an unchanged directory has
+    the same listing; file contents are not cached (matched files are still stat'ed).
+    Only directories listed during this run are saved.
+    """
+
+    def __init__(self, root: Path, path: Path) -> None:
+        self.root = root
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._dirs: dict[str, tuple[int, int, list[tuple[str, str]]]] = {}
+        self._seen: dict[str, tuple[int, int, list[tuple[str, str]]]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, root: Path, cache_dir: Path | None = None) -> DirCache:
+        digest = hashlib.sha256(str(root.resolve()).encode()).hexdigest()[:16]
+        cache = cls(root, (cache_dir or default_cache_dir()) / f"dirs-{digest}.json")
+        try:
+            data = json.loads(cache.path.read_text())
+        except FileNotFoundError:
+            return cache
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable directory cache {cache.path}: {e}")
+            return cache
+        if isinstance(data, dict) and data.get("format") == CACHE_FORMAT and isinstance(data.get("dirs"), dict):
+            cache._dirs = {
+                rel: (value[0], value[1], [(name, kind) for name, kind in value[2]])
+                for rel, value in data["dirs"].items()
+            }
+        return cache
+
+    def scandir(self, path: Path) -> list[DirEntryLike]:
+        """Sorted entries of path, like `scandir_sorted`."""
+        st = os.stat(path)
+        rel = os.path.relpath(path, self.root)
+        with self._lock:
+            cached = self._dirs.get(rel)
+        hit = cached is not None and cached[:2] == (st.st_mtime_ns, st.st_ino)
+        if cached is not None and hit:
+            listing = cached[2]
+        else:
+            with os.scandir(path) as it:
+                listing = sorted((entry.name, _kind(entry)) for entry in it)
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+            if hit or time.time_ns() - st.st_mtime_ns >= RACY_WINDOW_NS:
+                self._seen[rel] = (st.st_mtime_ns, st.st_ino, listing)
+        return [CachedEntry(path, name, kind) for name, kind in listing]
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._seen or (self.misses == 0 and self._seen.keys() == self._dirs.keys()):
+                return
+            content = json.dumps({"format": CACHE_FORMAT, "dirs": self._seen}, separators=(",", ":"))
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp.write_text(content)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.warning(f"Failed to write directory cache {self.path}: {e}")
+
+
+def iter_files(
+    root: Path, skip_dirs: frozenset[str] = frozenset(), dir_cache: DirCache | None = None
+) -> Iterator[Path]:
+    """Files below root (symlinked dirs are not followed), skipping directories named in skip_dirs."""
+    scandir = dir_cache.scandir if dir_cache is not None else scandir_sorted
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = scandir(directory)
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in skip_dirs:
+                    stack.append(directory / entry.name)
+            elif entry.is_file():
+                yield directory / entry.name
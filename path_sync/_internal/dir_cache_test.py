@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from path_sync._internal.dir_cache import DirCache, iter_files
+from path_sync._internal.models import PathMapping
+from path_sync._internal.src_scanner import scan_sources
+
+_OLD_NS = 1_000_000_000_000_000_000
+
+
+def _make_tree(root: Path) -> Path:
+    tree = root / "tree"
+    for rel in ["a.py", "sub/b.py", "sub/deep/c.md", ".git/config"]:
+        (tree / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tree / rel).write_text(rel)
+    _age_dirs(tree)
+    return tree
+
+
+def _age_dirs(tree: Path) -> None:
+    """Move directory mtimes out of the racy window, as if the tree was written long ago."""
+    for directory in [tree, *(p for p in tree.rglob("*") if p.is_dir())]:
+        os.utime(directory, ns=(_OLD_NS, _OLD_NS))
+
+
+def _files(tree: Path, cache: DirCache | None) -> list[str]:
+    return sorted(p.relative_to(tree).as_posix() for p in iter_files(tree, frozenset({".git"}), cache))
+
+
+def _seen_after_walk(tree: Path, cache_dir: Path) -> set[str]:
+    cache = DirCache.load(tree, cache_dir)
+    _files(tree, cache)
+    return set(cache._seen)
+
+
+def test_iter_files_reuses_unchanged_listings(tmp_path: Path):
+    tree = _make_tree(tmp_path)
+    expected = ["a.py", "sub/b.py", "sub/deep/c.md"]
+    first = DirCache.load(tree, tmp_path / "cache")
+    assert _files(tree, first) == expected
+    assert (first.hits, first.misses) == (0, 3)
+    first.save()
+
+    second = DirCache.load(tree, tmp_path / "cache")
+    assert _files(tree, second) == expected
+    assert (second.hits, second.misses) == (3, 0)
+
+
+def test_changed_directory_is_listed_again(tmp_path: Path):
+    tree = _make_tree(tmp_path)
+    first = DirCache.load(tree, tmp_path / "cache")
+    _files(tree, first)
+    first.save()
+
+    (tree / "sub/new.py").write_text("new")
+    (tree / "sub/deep/c.md").unlink()
+    _age_dirs(tree)
+    os.utime(tree / "sub", ns=(_OLD_NS + 1, _OLD_NS + 1))
+    os.utime(tree / "sub/deep", ns=(_OLD_NS + 1, _OLD_NS + 1))
+
+    second = DirCache.load(tree, tmp_path / "cache")
+    assert _files(tree, second) == ["a.py", "sub/b.py", "sub/new.py"]
+    assert (second.hits, second.misses) == (1, 2)
+
+
+def test_recently_modified_directory_is_not_cached(tmp_path: Path):
+    tree = _make_tree(tmp_path)
+    os.utime(tree / "sub")  # now: may still change within the same mtime tick
+    first = DirCache.load(tree, tmp_path / "cache")
+    _files(tree, first)
+    first.save()
+
+    second = DirCache.load(tree, tmp_path / "cache")
+    _files(tree, second)
+    assert (second.hits, second.misses) == (2, 1)
+    with patch("path_sync._internal.dir_cache.RACY_WINDOW_NS", 0):
+        assert "sub" in _seen_after_walk(tree, tmp_path / "cache")
+
+
+def test_corrupt_cache_is_ignored(tmp_path: Path):
+    tree = _make_tree(tmp_path)
+    cache = DirCache.load(tree, tmp_path / "cache")
+    cache.path.parent.mkdir(parents=True)
+    cache.path.write_text("not json")
+    reloaded = DirCache.load(tree, tmp_path / "cache")
+    assert _files(tree, reloaded) == ["a.py", "sub/b.py", "sub/deep/c.md"]
+    assert reloaded.hits == 0
+
+
+def test_scan_sources_with_cache_matches_plain_scan(tmp_path: Path):
+    tree = _make_tree(tmp_path)
+    mappings = [PathMapping(src_path="**/*.py"), PathMapping(src_path="sub/deep/*.md")]
+
+    def scan(cache: DirCache | None) -> list[tuple[int, str, int]]:
+        return [(m.mapping_index, m.entry.dest_key, m.entry.size) for m in scan_sources(tree, mappings, cache)]
+
+    expected = scan(None)
+    first = DirCache.load(tree, tmp_path / "cache")
+    assert scan(first) == expected
+    first.save()
+    second = DirCache.load(tree, tmp_path / "cache")
+    assert scan(second) == expected
+    assert second.misses == 0
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import io
+import os
+from pathlib import Path
+
+from path_sync._internal.file_utils import CompareStats, decode_text, stream_equals_file
+from path_sync._internal.src_reader import FILE_READER, SourceReader
+from path_sync._internal.transform_cache import SourceTransform, TransformCache, TransformKey, build_transform
+
+
+class FileState:
+    """One source -> destination pair of the copy pipeline, shared by the sync-mode handlers.
+
+    Handlers pull only what they need: the destination is stat'ed and read at most once, and the source
+    transform is built (or taken from the run's TransformCache) only on first use, so SCAFFOLD never reads
+    the source of an existing destination. Not valid anymore once the destination is written.
+    """
+
+    def __init__(
+        self,
+        key: TransformKey,
+        dest_path: Path,
+        transforms: TransformCache | None = None,
+        reader: SourceReader = FILE_READER,
+    ) -> None:
+        self.key = key
+        self.dest_path = dest_path
+        self.reader = reader
+        self._transforms = transforms
+        self._transform: SourceTransform | None = None
+        self._dest_checked = False
+        self._dest_size: int | None = None
+        self._dest_read = False
+        self._dest_bytes: bytes | None = None
+
+    @property
+    def src(self) -> Path:
+        return self.key.src_path
+
+    def transform(self) -> SourceTransform:
+        if self._transform is None:
+            if self._transforms is not None:
+                self._transform = self._transforms.get(self.key, self.dest_path)
+            else:
+                self._transform = build_transform(self.key, self.dest_path, self.reader)
+        return self._transform
+
+    def dest_size(self) -> int | None:
+        """Size of the destination, None when it doesn't exist."""
+        if not self._dest_checked:
+            try:
+                self._dest_size = os.stat(self.dest_path).st_size
+            except FileNotFoundError:
+                self._dest_size = None
+            self._dest_checked = True
+        return self._dest_size
+
+    @property
+    def dest_exists(self) -> bool:
+        return self.dest_size() is not None
+
+    def dest_bytes(self) -> bytes | None:
+        """Destination content, None when it doesn't exist. Opens the file directly, without a stat."""
+        if not self._dest_read:
+            if not self._dest_checked or self._dest_size is not None:
+                try:
+                    self._dest_bytes = self.dest_path.read_bytes()
+                except FileNotFoundError:
+                    self._dest_bytes = None
+            self._dest_size = None if self._dest_bytes is None else len(self._dest_bytes)
+            self._dest_checked = self._dest_read = True
+        return self._dest_bytes
+
+    def _sizes_match(self, size: int, stats: CompareStats | None) -> bool:
+        dest_size = self.dest_size()
+        if dest_size is None:
+            return False
+        if dest_size != size:
+            if stats:
+                stats.skipped(dest_size)
+            return False
+        return True
+
+    def dest_equals(self, content: bytes, stats: CompareStats | None = None) -> bool:
+        """Compare content with the destination, size first, then chunked unless already read."""
+        if not self._sizes_match(len(content), stats):
+            return False
+        if self._dest_read:
+            return self._dest_bytes == content
+        return stream_equals_file(io.BytesIO(content), len(content), self.dest_path, stats)
+
+    def dest_text_equals(self, content: bytes, stats: CompareStats | None = None) -> bool:
+        """`dest_equals` for rendered text, with newlines normalized like `Path.read_text`.
+
+        A destination checked out with CRLF (or CR) newlines is not rewritten. Only a destination at most
+        one byte per line larger than content can differ by newlines alone, others keep the size-first skip.
+        """
+        dest_size = self.dest_size()
+        if dest_size is not None and len(content) <= dest_size <= len(content) + content.count(b"\n"):
+            dest = self.dest_bytes()
+            if dest is not None and b"\r" in dest:
+                try:
+                    return decode_text(dest) == content.decode()
+                except UnicodeDecodeError:
+                    return False
+        return self.dest_equals(content, stats)
+
+    def dest_equals_src(self, stats: CompareStats | None = None) -> bool:
+        """Compare the raw source with the destination without loading either in memory."""
+        size = self.reader.size(self.src)
+        if not self._sizes_match(size, stats):
+            return False
+        with self.reader.open(self.src) as f:
+            return stream_equals_file(f, size, self.dest_path, stats)
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from path_sync._internal import file_state
+from path_sync._internal.file_state import FileState
+from path_sync._internal.file_utils import CompareStats
+from path_sync._internal.models import SyncMode
+from path_sync._internal.transform_cache import TransformKey, build_transform
+
+
+def _state(tmp_path: Path, sync_mode: SyncMode = SyncMode.SYNC) -> FileState:
+    src = tmp_path / "src.py"
+    src.write_text("print('hi')\n")
+    return FileState(TransformKey(src, "dest.py", False, sync_mode), tmp_path / "dest.py")
+
+
+def test_file_state_reads_dest_once_without_stat(tmp_path: Path):
+    state = _state(tmp_path)
+    state.dest_path.write_text("existing\n")
+
+    with (
+        patch.object(file_state.os, "stat", wraps=os.stat) as mock_stat,
+        patch.object(Path, "read_bytes", autospec=True, side_effect=Path.read_bytes) as mock_read,
+    ):
+        assert state.dest_bytes() == b"existing\n"
+        assert state.dest_bytes() == b"existing\n"
+        assert state.dest_exists
+        assert state.dest_size() == 9
+        assert state.dest_equals(b"existing\n")
+
+    mock_stat.assert_not_called()
+    assert mock_read.call_count == 1
+
+
+def test_file_state_missing_dest_is_stat_once(tmp_path: Path):
+    state = _state(tmp_path)
+
+    with patch.object(file_state.os, "stat", wraps=os.stat) as mock_stat:
+        assert not state.dest_exists
+        assert state.dest_bytes() is None
+        assert not state.dest_equals(b"")
+
+    assert mock_stat.call_count == 1
+
+
+def test_file_state_dest_equals_size_mismatch_skips_read(tmp_path: Path):
+    state = _state(tmp_path, SyncMode.REPLACE)
+    state.dest_path.write_bytes(b"x" * 100)
+    stats = CompareStats()
+
+    with patch.object(Path, "open", autospec=True, side_effect=Path.open) as mock_open:
+        assert not state.dest_equals(b"short", stats)
+        assert not state.dest_equals_src(stats)
+
+    mock_open.assert_not_called()
+    assert stats.bytes_skipped == 200
+
+
+def test_file_state_builds_transform_lazily_once(tmp_path: Path):
+    state = _state(tmp_path)
+
+    with patch.object(file_state, "build_transform", wraps=build_transform) as mock_build:
+        assert state.dest_size() is None
+        mock_build.assert_not_called()
+        assert state.transform() is state.transform()
+
+    assert mock_build.call_count == 1
+
+
+def test_file_state_dest_text_equals_ignores_crlf_checkout(tmp_path: Path):
+    content = b"line 1\nline 2\n"
+    for dest, expected in [
+        (b"line 1\r\nline 2\r\n", True),
+        (b"line 1\r\nline 3\r\n", False),
+        (b"line 1\nline 2\n", True),
+        (b"line 1\r\nline 2\r\n\r\n", False),
+    ]:
+        state = _state(tmp_path, SyncMode.REPLACE)
+        state.dest_path.write_bytes(dest)
+        assert state.dest_text_equals(content) is expected
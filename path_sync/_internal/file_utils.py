@@ -1,7 +1,186 @@
+import errno
+import os
+import secrets
+import stat
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import BinaryIO
+
+MIB = 1024 * 1024
+COMPARE_CHUNK_SIZE = MIB
+STREAM_CHUNK_SIZE = MIB
+DEFAULT_STREAM_THRESHOLD = 8 * MIB
+SNIFF_SIZE = 8192
+# errors meaning "this copy method isn't supported here", not a real I/O failure
+_KERNEL_COPY_FALLBACK_ERRNOS = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP}
 
 
 def ensure_parents_write_text(path: Path | str, text: str) -> None:
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(text)
+
+
+def read_text_or_none(path: Path, binary_hint: bool | None = None) -> str | None:
+    """Read path as text in one pass, returning None for binary content.
+
+    Binary is detected from a NUL byte in the first SNIFF_SIZE bytes (or invalid UTF-8) without reading the rest.
+    `binary_hint` (e.g. from the file extension) skips sniffing: True never opens the file, False always decodes.
+    Newlines are normalized like `Path.read_text`.
+    """
+    if binary_hint:
+        return None
+    with path.open("rb") as f:
+        return read_stream_text_or_none(f, binary_hint)
+
+
+def read_stream_text_or_none(f: BinaryIO, binary_hint: bool | None = None) -> str | None:
+    """`read_text_or_none` for an open binary stream."""
+    if binary_hint:
+        return None
+    prefix = f.read(SNIFF_SIZE)
+    if binary_hint is None and b"\0" in prefix:
+        return None
+    try:
+        return decode_text(prefix + f.read())
+    except UnicodeDecodeError:
+        return None
+
+
+def decode_text(data: bytes) -> str:
+    """Decode UTF-8 with universal newlines, matching `Path.read_text`."""
+    return data.decode().replace("\r\n", "\n").replace("\r", "\n")
+
+
+@dataclass
+class CompareStats:
+    """Bytes that did not need to be read compared to loading both sides whole, safe to share between threads."""
+
+    bytes_skipped: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def skipped(self, size: int) -> None:
+        with self._lock:
+            self.bytes_skipped += size
+
+
+def stream_equals_file(src: BinaryIO, size: int, dest: Path, stats: CompareStats | None = None) -> bool:
+    """Compare an open stream with a file of the same size chunk by chunk."""
+    offset = 0
+    with dest.open("rb") as fd:
+        while chunk := src.read(COMPARE_CHUNK_SIZE):
+            offset += len(chunk)
+            if fd.read(len(chunk)) != chunk:
+                if stats:
+                    stats.skipped(size - offset)
+                return False
+    return True
+
+
+def _copy_range(src_fd: int, dest_fd: int, offset: int) -> int:
+    return os.copy_file_range(src_fd, dest_fd, STREAM_CHUNK_SIZE, offset, offset)
+
+
+def _sendfile(src_fd: int, dest_fd: int, offset: int) -> int:
+    os.lseek(dest_fd, offset, os.SEEK_SET)
+    return os.sendfile(dest_fd, src_fd, offset, STREAM_CHUNK_SIZE)
+
+
+def _read_write(src_fd: int, dest_fd: int, offset: int) -> int:
+    chunk = os.pread(src_fd, STREAM_CHUNK_SIZE, offset)
+    os.lseek(dest_fd, offset, os.SEEK_SET)
+    view = memoryview(chunk)
+    while view:
+        view = view[os.write(dest_fd, view) :]
+    return len(chunk)
+
+
+def _copy_methods() -> list[Callable[[int, int, int], int]]:
+    methods: list[Callable[[int, int, int], int]] = []
+    if hasattr(os, "copy_file_range"):
+        methods.append(_copy_range)
+    if hasattr(os, "sendfile"):
+        methods.append(_sendfile)
+    methods.append(_read_write)
+    return methods
+
+
+def copy_fd(src_fd: int, dest_fd: int) -> int:
+    """Copy src_fd to dest_fd in bounded chunks, kernel-side when supported. Returns bytes copied."""
+    copied = 0
+    for method in _copy_methods():
+        try:
+            while n := method(src_fd, dest_fd, copied):
+                copied += n
+            return copied
+        except OSError as e:
+            if method is _read_write or e.errno not in _KERNEL_COPY_FALLBACK_ERRNOS:
+                raise
+    return copied
+
+
+@contextmanager
+def _atomic_dest_fd(dest: Path) -> Iterator[int]:
+    """Yield the fd of a temp file next to dest that replaces dest on success.
+
+    An existing dest keeps its permission bits, a new one gets the default mode (umask applied).
+    A symlink to an existing file is written through: its target is replaced, the link is kept.
+    The parent directory must exist (see `FileWriter`).
+    """
+    if dest.is_symlink() and dest.exists():
+        dest = dest.resolve()
+    tmp = dest.with_name(f".{dest.name}.{secrets.token_hex(4)}.tmp")
+    try:
+        existing_mode = stat.S_IMODE(os.stat(dest).st_mode)
+    except FileNotFoundError:
+        existing_mode = None
+    try:
+        dest_fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        try:
+            yield dest_fd
+            if existing_mode is not None:
+                os.fchmod(dest_fd, existing_mode)
+        finally:
+            os.close(dest_fd)
+        os.replace(tmp, dest)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def atomic_write_bytes(dest: Path, content: bytes) -> int:
+    """Write content to a temp file next to dest and rename it over dest."""
+    view = memoryview(content)
+    with _atomic_dest_fd(dest) as dest_fd:
+        while view:
+            view = view[os.write(dest_fd, view) :]
+    return len(content)
+
+
+def stream_copy_file(src: Path, dest: Path) -> int:
+    """Copy src to dest without loading it in memory, atomically replacing dest.
+
+    The data goes to a temp file next to dest which is renamed over it, so readers never see a partial file.
+    Returns the number of bytes copied.
+    """
+    src_fd = os.open(src, os.O_RDONLY)
+    try:
+        with _atomic_dest_fd(dest) as dest_fd:
+            return copy_fd(src_fd, dest_fd)
+    finally:
+        os.close(src_fd)
+
+
+def stream_write_file(src: BinaryIO, dest: Path) -> int:
+    """`stream_copy_file` for a source stream that has no file descriptor (e.g. a git blob)."""
+    copied = 0
+    with _atomic_dest_fd(dest) as dest_fd:
+        while chunk := src.read(STREAM_CHUNK_SIZE):
+            view = memoryview(chunk)
+            while view:
+                view = view[os.write(dest_fd, view) :]
+            copied += len(chunk)
+    return copied
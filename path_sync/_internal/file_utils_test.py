@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import errno
+import io
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from path_sync._internal import file_utils
+from path_sync._internal.file_utils import CompareStats, stream_copy_file, stream_equals_file
+
+
+def test_stream_equals_file_stops_at_first_differing_chunk(tmp_path: Path):
+    dest = tmp_path / "dest.bin"
+    dest.write_bytes(b"b" + b"a" * 9)
+    stats = CompareStats()
+
+    with patch.object(file_utils, "COMPARE_CHUNK_SIZE", 4):
+        assert not stream_equals_file(io.BytesIO(b"a" * 10), 10, dest, stats)
+        assert stream_equals_file(io.BytesIO(dest.read_bytes()), 10, dest, stats)
+    assert stats.bytes_skipped == 6
+
+
+def test_stream_copy_file_replaces_atomically_and_keeps_mode(tmp_path: Path):
+    src, dest = tmp_path / "src.bin", tmp_path / "out" / "dest.bin"
+    content = os.urandom(3000)
+    src.write_bytes(content)
+    dest.parent.mkdir()
+    dest.write_bytes(b"old")
+    dest.chmod(0o750)
+
+    with patch.object(file_utils, "STREAM_CHUNK_SIZE", 1024):
+        assert stream_copy_file(src, dest) == 3000
+
+    assert dest.read_bytes() == content
+    assert dest.stat().st_mode & 0o777 == 0o750
+    assert list(dest.parent.iterdir()) == [dest]
+
+
+def test_stream_copy_file_falls_back_to_chunked_copy(tmp_path: Path):
+    src, dest = tmp_path / "src.bin", tmp_path / "dest.bin"
+    content = os.urandom(2500)
+    src.write_bytes(content)
+
+    def unsupported(*_):
+        raise OSError(errno.EXDEV, "cross-device")
+
+    with (
+        patch.object(file_utils, "STREAM_CHUNK_SIZE", 1024),
+        patch.object(file_utils.os, "copy_file_range", unsupported, create=True),
+        patch.object(file_utils.os, "sendfile", unsupported, create=True),
+    ):
+        assert stream_copy_file(src, dest) == 2500
+    assert dest.read_bytes() == content
+
+
+def test_stream_copy_file_cleans_up_on_error(tmp_path: Path):
+    src, dest = tmp_path / "src.bin", tmp_path / "dest.bin"
+    src.write_bytes(b"data")
+    dest.write_bytes(b"old")
+
+    with patch.object(file_utils, "copy_fd", side_effect=OSError(errno.ENOSPC, "full")), pytest.raises(OSError):
+        stream_copy_file(src, dest)
+    assert dest.read_bytes() == b"old"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["dest.bin", "src.bin"]
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from path_sync._internal import file_writer
+from path_sync._internal.file_writer import FileWriter
+
+
+def test_file_writer_creates_each_dir_once(tmp_path: Path):
+    writer = FileWriter()
+    paths = [tmp_path / "a/b" / f"{i}.txt" for i in range(5)] + [tmp_path / "a/c/x.txt", tmp_path / "top.txt"]
+
+    with patch.object(file_writer.os, "mkdir", wraps=os.mkdir) as mock_mkdir:
+        for path in paths:
+            writer.write_text(path, f"{path.name}\n")
+
+    # a/b (missing parent), a, a/b again, a/c, tmp_path (exists): 5 calls for 7 files
+    assert mock_mkdir.call_count == 5
+    assert all(path.read_text() == f"{path.name}\n" for path in paths)
+    assert sorted(p.name for p in (tmp_path / "a/b").iterdir()) == [f"{i}.txt" for i in range(5)]
+
+
+def test_file_writer_replaces_existing_file_keeping_mode(tmp_path: Path):
+    path = tmp_path / "script.sh"
+    path.write_text("old")
+    path.chmod(0o755)
+
+    FileWriter().write_bytes(path, b"new")
+
+    assert path.read_bytes() == b"new"
+    assert path.stat().st_mode & 0o777 == 0o755
+    assert [p.name for p in tmp_path.iterdir()] == ["script.sh"]
+
+
+def test_file_writer_writes_through_symlink(tmp_path: Path):
+    target = tmp_path / "shared/config.toml"
+    target.parent.mkdir()
+    target.write_text("old")
+    link = tmp_path / "config.toml"
+    link.symlink_to(target)
+
+    FileWriter().write_bytes(link, b"new")
+
+    assert link.is_symlink()
+    assert target.read_bytes() == b"new"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["config.toml", "shared"]
+
+
+def test_file_writer_defers_fsync_to_sync(tmp_path: Path):
+    writer = FileWriter(fsync=True)
+    with patch.object(file_writer.os, "fsync") as mock_fsync:
+        writer.write_text(tmp_path / "new/a.txt", "a")
+        writer.write_text(tmp_path / "new/b.txt", "b")
+        assert mock_fsync.call_count == 0
+        assert writer.sync() == 2
+    # 2 files, the new dir and tmp_path holding it
+    assert mock_fsync.call_count == 4
+    assert writer.sync() == 0
+
+    assert FileWriter().sync() == 0
@@ -0,0 +1,237 @@
+"""Git operations that can run in process: the GitPython/CLI backend (default) or libgit2 via `pygit2`."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from contextlib import suppress
+from datetime import datetime, timedelta, timezone
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any, Protocol
+
+from git import GitCommandError, Repo
+
+from path_sync._internal.git_exec import read_blob
+
+if TYPE_CHECKING:
+    import pygit2
+
+logger = logging.getLogger(__name__)
+
+BOT_NAME = "path-sync[bot]"
+BOT_EMAIL = "path-sync[bot]@users.noreply.github.com"
+
+
+class GitBackendName(StrEnum):
+    CLI = "cli"
+    LIBGIT2 = "libgit2"
+
+
+class GitBackend(Protocol):
+    """Read and commit operations of `git_ops`; all take the GitPython repo, which locates the repository."""
+
+    name: GitBackendName
+
+    def commit_sha(self, repo: Repo, ref: str) -> str: ...
+
+    def commit_timestamp(self, repo: Repo, ref: str) -> str: ...
+
+    def has_commit(self, repo: Repo, sha: str) -> bool: ...
+
+    def trees_equal(self, repo: Repo, ref: str, other_ref: str) -> bool:
+        """True if both refs exist and point at the same tree."""
+        ...
+
+    def read_blob(self, repo: Repo, ref: str, rel_path: str) -> bytes | None: ...
+
+    def is_dirty(self, repo: Repo) -> bool:
+        """Changes to tracked files (staged or not) or untracked files that are not ignored."""
+        ...
+
+    def commit_all(self, repo: Repo, message: str) -> bool:
+        """Stage everything (`add -A`) and commit if the index differs from HEAD. Returns True if committed."""
+        ...
+
+
+def ensure_git_user(repo: Repo) -> None:
+    """Configure git user if not already set."""
+    try:
+        repo.config_reader().get_value("user", "name")
+    except Exception:
+        repo.config_writer().set_value("user", "name", BOT_NAME).release()
+        repo.config_writer().set_value("user", "email", BOT_EMAIL).release()
+
+
+class CliBackend:
+    """GitPython, spawning `git` for anything GitPython doesn't read itself."""
+
+    name = GitBackendName.CLI
+
+    def commit_sha(self, repo: Repo, ref: str) -> str:
+        return repo.commit(ref).hexsha
+
+    def commit_timestamp(self, repo: Repo, ref: str) -> str:
+        return repo.commit(ref).committed_datetime.isoformat()
+
+    def has_commit(self, repo: Repo, sha: str) -> bool:
+        with suppress(GitCommandError):
+            repo.git.cat_file("-e", f"{sha}^{{commit}}")
+            return True
+        return False
+
+    def trees_equal(self, repo: Repo, ref: str, other_ref: str) -> bool:
+        with suppress(GitCommandError):
+            tree, other_tree = repo.git.rev_parse(f"{ref}^{{tree}}", f"{other_ref}^{{tree}}").split()
+            return tree == other_tree
+        return False
+
+    def read_blob(self, repo: Repo, ref: str, rel_path: str) -> bytes | None:
+        return read_blob(repo, f"{ref}:{rel_path}")
+
+    def is_dirty(self, repo: Repo) -> bool:
+        return repo.is_dirty(submodules=False) or len(repo.untracked_files) > 0
+
+    def commit_all(self, repo: Repo, message: str) -> bool:
+        repo.git.add("-A")
+        if not repo.is_dirty(submodules=False):
+            return False
+        ensure_git_user(repo)
+        repo.git.commit("-m", message)
+        return True
+
+
+class Libgit2Backend:
+    """libgit2 via `pygit2`, no git process is spawned. Requires the `libgit2` extra.
+
+    libgit2 ignores sparse checkouts (files outside the cone look deleted), status and commits of sparse
+    working trees go through the CLI backend. It also never fetches the objects a partial clone (`--filter`)
+    left out: trees and blobs missing from a partial clone are read through the CLI backend, which fetches them.
+    """
+
+    name = GitBackendName.LIBGIT2
+
+    def __init__(self) -> None:
+        import pygit2
+
+        self._pygit2 = pygit2
+        self._repos: dict[str, pygit2.Repository] = {}
+        self._cli = CliBackend()
+        # a pygit2 Repository must not be used from several threads at once
+        self._lock = threading.RLock()
+
+    def _open(self, repo: Repo) -> pygit2.Repository:
+        git_dir = str(repo.git_dir)
+        if (opened := self._repos.get(git_dir)) is None:
+            opened = self._repos[git_dir] = self._pygit2.Repository(git_dir)
+        return opened
+
+    def _is_sparse(self, repository: pygit2.Repository) -> bool:
+        try:
+            return repository.config.get_bool("core.sparseCheckout")
+        except KeyError:
+            return False
+
+    def _is_partial(self, repository: pygit2.Repository) -> bool:
+        return any(entry.name.endswith(".promisor") and entry.value == "true" for entry in repository.config)
+
+    def _peel(self, repo: Repo, ref: str, kind: type[Any]) -> Any:
+        """The object ref resolves to, peeled to kind; None when ref doesn't resolve."""
+        try:
+            return self._open(repo).revparse_single(ref).peel(kind)
+        except (KeyError, ValueError, self._pygit2.GitError):
+            return None
+
+    def _commit(self, repo: Repo, ref: str) -> pygit2.Commit:
+        with self._lock:
+            if (commit := self._peel(repo, ref, self._pygit2.Commit)) is None:
+                raise ValueError(f"Unknown revision: {ref}")
+            return commit
+
+    def commit_sha(self, repo: Repo, ref: str) -> str:
+        return str(self._commit(repo, ref).id)
+
+    def commit_timestamp(self, repo: Repo, ref: str) -> str:
+        commit = self._commit(repo, ref)
+        tz = timezone(timedelta(minutes=commit.commit_time_offset))
+        return datetime.fromtimestamp(commit.commit_time, tz).isoformat()
+
+    def has_commit(self, repo: Repo, sha: str) -> bool:
+        with self._lock:
+            try:
+                obj = self._open(repo).get(sha)
+            except ValueError:
+                return False
+            return isinstance(obj, self._pygit2.Commit)
+
+    def trees_equal(self, repo: Repo, ref: str, other_ref: str) -> bool:
+        with self._lock:
+            tree = self._peel(repo, ref, self._pygit2.Tree)
+            other_tree = self._peel(repo, other_ref, self._pygit2.Tree)
+            if tree is not None and other_tree is not None:
+                return tree.id == other_tree.id
+            if not self._is_partial(self._open(repo)):
+                return False
+        return self._cli.trees_equal(repo, ref, other_ref)
+
+    def read_blob(self, repo: Repo, ref: str, rel_path: str) -> bytes | None:
+        with self._lock:
+            obj = None
+            if (tree := self._peel(repo, ref, self._pygit2.Tree)) is not None:
+                with suppress(KeyError):
+                    obj = self._open(repo)[tree[rel_path].id]
+            if obj is not None or not self._is_partial(self._open(repo)):
+                return obj.data if isinstance(obj, self._pygit2.Blob) else None
+        # outside the lock: the CLI may fetch the missing object from the promisor remote
+        return self._cli.read_blob(repo, ref, rel_path)
+
+    def is_dirty(self, repo: Repo) -> bool:
+        current = self._pygit2.enums.FileStatus.CURRENT
+        with self._lock:
+            if self._is_sparse(repository := self._open(repo)):
+                return self._cli.is_dirty(repo)
+            return any(flags != current for flags in repository.status().values())
+
+    def commit_all(self, repo: Repo, message: str) -> bool:
+        with self._lock:
+            repository = self._open(repo)
+            if self._is_sparse(repository):
+                return self._cli.commit_all(repo, message)
+            index = repository.index
+            index.read()
+            index.add_all()
+            index.write()
+            tree_id = index.write_tree()
+            head = None if repository.head_is_unborn else repository.head.peel(self._pygit2.Commit)
+            if head is not None and head.tree_id == tree_id:
+                return False
+            parents = [head.id] if head is not None else []
+            ensure_git_user(repo)
+            try:
+                signature = repository.default_signature
+            except KeyError:  # config written above, not seen by an already opened repository
+                signature = self._pygit2.Signature(BOT_NAME, BOT_EMAIL)
+            repository.create_commit("HEAD", signature, signature, message, tree_id, parents)
+            return True
+
+
+_backend: GitBackend = CliBackend()
+
+
+def get_backend() -> GitBackend:
+    return _backend
+
+
+def select_backend(name: GitBackendName | str) -> GitBackend:
+    """Use the named backend for the git operations of this process (one CLI run)."""
+    global _backend
+    name = GitBackendName(name)
+    if _backend.name != name:
+        if name == GitBackendName.LIBGIT2:
+            try:
+                _backend = Libgit2Backend()
+            except ImportError as e:
+                raise ValueError("pygit2 is not installed: pip install 'path-sync[libgit2]'") from e
+        else:
+            _backend = CliBackend()
+        logger.info(f"Using git backend: {name}")
+    return _backend
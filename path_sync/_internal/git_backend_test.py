@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+from git import Repo
+
+from path_sync._internal.git_backend import (
+    CliBackend,
+    GitBackend,
+    GitBackendName,
+    Libgit2Backend,
+    get_backend,
+    select_backend,
+)
+from path_sync._internal.git_ops import set_sparse_checkout
+
+
+@pytest.fixture(params=list(GitBackendName))
+def backend(request: pytest.FixtureRequest) -> GitBackend:
+    if request.param == GitBackendName.LIBGIT2:
+        pytest.importorskip("pygit2")
+        return Libgit2Backend()
+    return CliBackend()
+
+
+def _commit_file(repo: Repo, rel: str, content: str) -> str:
+    path = Path(repo.working_dir) / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    repo.index.add([rel])
+    return repo.index.commit(f"add {rel}").hexsha
+
+
+def test_resolves_commits(backend: GitBackend, tmp_repo: Path):
+    repo = Repo(tmp_repo)
+    sha = _commit_file(repo, "a.txt", "a")
+    assert backend.commit_sha(repo, "HEAD") == sha
+    assert backend.commit_sha(repo, "HEAD~1") == repo.commit("HEAD~1").hexsha
+    assert backend.commit_timestamp(repo, "HEAD") == repo.commit(sha).committed_datetime.isoformat()
+    assert backend.has_commit(repo, sha)
+    assert not backend.has_commit(repo, "0" * 40)
+    assert not backend.has_commit(repo, repo.commit(sha).tree.hexsha)
+
+
+def test_reads_blobs(backend: GitBackend, tmp_repo: Path):
+    repo = Repo(tmp_repo)
+    _commit_file(repo, "dir/a.txt", "line\n")
+    (tmp_repo / "dir/a.txt").write_text("changed in worktree\n")
+    assert backend.read_blob(repo, "HEAD", "dir/a.txt") == b"line\n"
+    assert backend.read_blob(repo, "HEAD~1", "dir/a.txt") is None
+    assert backend.read_blob(repo, "HEAD", "missing.txt") is None
+    assert backend.read_blob(repo, "HEAD", "dir") is None
+    assert backend.read_blob(repo, "no-such-ref", "dir/a.txt") is None
+
+
+def _blobless_clone(tmp_path: Path) -> Repo:
+    """A blobless clone without checkout: no blob of the source is in its object database."""
+    src = Repo.init(tmp_path / "src", initial_branch="main")
+    _commit_file(src, "dir/a.txt", "v1\n")
+    _commit_file(src, "dir/a.txt", "v2\n")
+    src.git.config("uploadpack.allowFilter", "true")
+    return Repo.clone_from((tmp_path / "src").as_uri(), tmp_path / "clone", filter="blob:none", no_checkout=True)
+
+
+def test_reads_blobs_missing_from_partial_clone(backend: GitBackend, tmp_path: Path):
+    repo = _blobless_clone(tmp_path)
+    assert backend.read_blob(repo, "HEAD~1", "dir/a.txt") == b"v1\n"
+    assert backend.read_blob(repo, "HEAD", "dir/a.txt") == b"v2\n"
+    assert backend.read_blob(repo, "HEAD", "missing.txt") is None
+    assert not backend.trees_equal(repo, "HEAD", "HEAD~1")
+
+
+def test_compares_trees(backend: GitBackend, tmp_repo: Path):
+    repo = Repo(tmp_repo)
+    repo.create_head("same")
+    _commit_file(repo, "a.txt", "a")
+    repo.create_head("after")
+    assert backend.trees_equal(repo, "HEAD", "after")
+    assert not backend.trees_equal(repo, "HEAD", "same")
+    assert not backend.trees_equal(repo, "HEAD", "missing")
+
+
+def test_status_and_commit(backend: GitBackend, tmp_repo: Path):
+    repo = Repo(tmp_repo)
+    (tmp_repo / ".gitignore").write_text("ignored/\n")
+    _commit_file(repo, ".gitignore", "ignored/\n")
+    (tmp_repo / "ignored").mkdir()
+    (tmp_repo / "ignored/file.txt").write_text("x")
+    assert not backend.is_dirty(repo)
+    assert not backend.commit_all(repo, "nothing")
+
+    (tmp_repo / "new.txt").write_text("new")
+    assert backend.is_dirty(repo)
+    assert backend.commit_all(repo, "add new")
+    assert not backend.is_dirty(repo)
+    head = repo.head.commit
+    assert head.message.strip() == "add new"
+    assert set(head.stats.files) == {"new.txt"}
+
+    (tmp_repo / "new.txt").unlink()
+    assert backend.is_dirty(repo)
+    assert backend.commit_all(repo, "remove new")
+    assert "new.txt" not in [item.path for item in repo.head.commit.tree.traverse()]  # pyright: ignore
+
+
+def test_commit_in_sparse_checkout_keeps_files_outside_cone(backend: GitBackend, tmp_repo: Path):
+    repo = Repo(tmp_repo)
+    _commit_file(repo, "inside/a.txt", "a")
+    _commit_file(repo, "outside/b.txt", "b")
+    repo.git.update_index("--refresh")  # stat info not written by GitPython, sparse-checkout keeps "modified" files
+    set_sparse_checkout(repo, ["inside"])
+    assert not (tmp_repo / "outside").exists()
+    assert not backend.is_dirty(repo)
+
+    (tmp_repo / "inside/a.txt").write_text("changed")
+    assert backend.commit_all(repo, "change inside")
+    assert set(repo.head.commit.stats.files) == {"inside/a.txt"}
+    assert backend.read_blob(repo, "HEAD", "outside/b.txt") == b"b"
+
+
+def test_select_backend(monkeypatch: pytest.MonkeyPatch):
+    assert select_backend("cli").name == GitBackendName.CLI
+    assert get_backend().name == GitBackendName.CLI
+    with pytest.raises(ValueError, match="not a valid"):
+        select_backend("svn")
+    monkeypatch.setitem(sys.modules, "pygit2", None)
+    with pytest.raises(ValueError, match="pygit2 is not installed"):
+        select_backend("libgit2")
+    assert get_backend().name == GitBackendName.CLI
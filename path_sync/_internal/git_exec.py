@@ -0,0 +1,87 @@
+"""Counted git execution: every spawned git process goes through `CountingGit`, object reads through its batch process."""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from git import Repo
+from git.cmd import Git
+
+
+@dataclass
+class GitStats:
+    """Git processes spawned and object reads served by a long-lived `cat-file --batch` process."""
+
+    processes: int = 0
+    seconds: float = 0.0
+    batch_reads: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def add_process(self, seconds: float) -> None:
+        with self._lock:
+            self.processes += 1
+            self.seconds += seconds
+
+    def add_batch_read(self, seconds: float) -> None:
+        with self._lock:
+            self.batch_reads += 1
+            self.seconds += seconds
+
+    def reset(self) -> None:
+        with self._lock:
+            self.processes = self.batch_reads = 0
+            self.seconds = 0.0
+
+    def summary(self) -> str:
+        return f"{self.processes} git processes, {self.batch_reads} batched object reads, {self.seconds:.2f}s in git"
+
+
+GIT_STATS = GitStats()
+
+
+class CountingGit(Git):
+    """`Git` counting each spawned process in GIT_STATS.
+
+    A command run to completion is timed until it exits; persistent processes (`cat-file --batch`)
+    are counted once when started and each read through `read_blob` is timed on its own.
+    GitPython's persistent processes are not thread safe, `read_blob` serializes them per instance.
+    """
+
+    def __init__(self, working_dir: Any = None) -> None:
+        super().__init__(working_dir)
+        self.batch_lock = threading.Lock()
+
+    def execute(self, command: Any, *args: Any, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return super().execute(command, *args, **kwargs)
+        finally:
+            GIT_STATS.add_process(time.perf_counter() - start)
+
+
+class CountingRepo(Repo):
+    GitCommandWrapperType = CountingGit
+
+
+_FALLBACK_LOCK = threading.Lock()
+
+
+def read_blob(repo: Repo, spec: str) -> bytes | None:
+    """Content of the blob named by spec (e.g. `ref:path`), None when it doesn't exist or is no blob.
+
+    Served by the repo's long-lived `cat-file --batch` process instead of one `git show` per call.
+    """
+    git = repo.git
+    lock = git.batch_lock if isinstance(git, CountingGit) else _FALLBACK_LOCK
+    start = time.perf_counter()
+    try:
+        with lock:
+            _, obj_type, _, data = git.get_object_data(spec)
+    except ValueError:  # missing or ambiguous
+        return None
+    finally:
+        GIT_STATS.add_batch_read(time.perf_counter() - start)
+    return data if obj_type in (b"blob", "blob") else None
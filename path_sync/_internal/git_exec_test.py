@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from git import Repo
+
+from path_sync._internal import git_ops
+from path_sync._internal.git_exec import GIT_STATS, read_blob
+
+
+def test_reads_share_one_batch_process(tmp_repo: Path):
+    repo = Repo(tmp_repo)
+    for name in ["a.txt", "b.txt"]:
+        (tmp_repo / name).write_text(f"{name}\n")
+    repo.index.add(["a.txt", "b.txt"])
+    repo.index.commit("add")
+
+    counted = git_ops.get_repo(tmp_repo)
+    GIT_STATS.reset()
+    assert git_ops.read_blob_at_ref(counted, "a.txt", "HEAD") == "a.txt\n"
+    assert git_ops.get_file_content_at_ref(counted, tmp_repo / "b.txt", "HEAD") == "b.txt\n"
+    assert git_ops.read_blob_at_ref(counted, "missing.txt", "HEAD") is None
+    assert (GIT_STATS.processes, GIT_STATS.batch_reads) == (1, 3)
+
+
+def test_read_blob_works_without_counting_repo(tmp_repo: Path):
+    assert read_blob(Repo(tmp_repo), "HEAD:.gitkeep") == b""
+    assert read_blob(Repo(tmp_repo), "HEAD:nope") is None
+    assert read_blob(Repo(tmp_repo), "HEAD") is None  # a commit
+
+
+def test_commands_are_counted(tmp_repo: Path):
+    repo = git_ops.get_repo(tmp_repo)
+    GIT_STATS.reset()
+    repo.git.status()
+    repo.git.rev_parse("HEAD")
+    assert GIT_STATS.processes == 2
+    assert GIT_STATS.seconds > 0
+    assert "2 git processes" in GIT_STATS.summary()
+
+
+def test_stage_and_commit_stages_paths_in_one_call(tmp_repo: Path):
+    for name in ["a.py", "b.py", "skip.py"]:
+        (tmp_repo / name).write_text(name)
+    repo = git_ops.get_repo(tmp_repo)
+    GIT_STATS.reset()
+    assert git_ops.stage_and_commit(repo, ["a.py", "b.py", "skip.py", "!skip.py"], "add files")
+    assert GIT_STATS.processes == 4  # add, reset, diff --cached, commit
+    assert set(repo.git.ls_files().split()) == {".gitkeep", "a.py", "b.py"}
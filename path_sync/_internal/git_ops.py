@@ -4,16 +4,25 @@ import logging
 import os
 import re
 import subprocess
+from configparser import NoOptionError, NoSectionError
 from contextlib import suppress
 from pathlib import Path
+from typing import NamedTuple, TypedDict
 
-from git import GitCommandError, InvalidGitRepositoryError, NoSuchPathError, Repo
+from git import GitCommandError, InvalidGitRepositoryError, NoSuchPathError, Reference, Repo
+
+from path_sync._internal.git_backend import ensure_git_user, get_backend
+from path_sync._internal.git_exec import CountingRepo
+from path_sync._internal.models import CloneConfig, CloneFilter
 
 logger = logging.getLogger(__name__)
 
 GH_PR_BODY_MAX_CHARS = 64536  # real limit is 65536, but we leave some buffer
 _TRUNCATION_NOTICE = "\n\n... (truncated, output too long for PR body)"
 _CODE_FENCE_RE = re.compile(r"^`{3,}", re.MULTILINE)
+_CLONE_FILTERS = {CloneFilter.BLOBLESS: "blob:none", CloneFilter.TREELESS: "tree:0"}
+_ALL_HEADS_REFSPEC = "+refs/heads/*:refs/remotes/origin/*"
+_MIRROR_REFSPECS = ("+refs/heads/*:refs/heads/*", "+refs/tags/*:refs/tags/*")
 
 
 def _truncate_body(body: str) -> str:
@@ -38,7 +47,7 @@ def _auth_url(url: str) -> str:
 
 def get_repo(path: Path) -> Repo:
     try:
-        return Repo(path)
+        return CountingRepo(path)
     except InvalidGitRepositoryError as e:
         raise ValueError(f"Not a git repository: {path}") from e
 
@@ -65,10 +74,121 @@ def fetch_and_reset_to_default(repo: Repo, default_branch: str) -> None:
     repo.git.reset("--hard", f"origin/{default_branch}")
 
 
-def clone_repo(url: str, dest: Path) -> Repo:
-    logger.info(f"Cloning {url} to {dest}")
+def clone_repo(
+    url: str, dest: Path, clone: CloneConfig | None = None, reference: Path | None = None, sparse: bool = False
+) -> Repo:
+    """Clone url to dest; with reference (a local mirror) objects it has are borrowed instead of fetched.
+
+    A sparse clone only checks out the files at the root, see `set_sparse_checkout`.
+    """
+    clone = clone or CloneConfig()
+    details = [_describe_clone(clone)] if clone.is_reduced else []
+    kwargs = _clone_kwargs(clone)
+    if reference is not None:
+        details.append(f"reference {reference}")
+        kwargs["reference"] = str(reference)
+    if sparse:
+        details.append("sparse")
+        kwargs["sparse"] = True
+    logger.info(f"Cloning {url} to {dest}" + (f" ({', '.join(details)})" if details else ""))
     dest.parent.mkdir(parents=True, exist_ok=True)
-    return Repo.clone_from(_auth_url(url), str(dest))
+    return CountingRepo.clone_from(_auth_url(url), str(dest), **kwargs)
+
+
+def init_mirror(path: Path) -> None:
+    """Empty bare repo for `fetch_mirror`. Objects are never pruned: clones borrowing them must not lose any."""
+    repo = CountingRepo.init(path, bare=True)
+    with repo.config_writer() as writer:
+        writer.set_value("gc", "pruneExpire", "never")
+
+
+def fetch_mirror(path: Path, url: str) -> None:
+    """Fetch all branches and tags of url into the bare mirror at path, dropping deleted ones.
+
+    The (authenticated) url is passed on each fetch and never stored in the mirror's config.
+    """
+    CountingRepo(path).git.fetch("--prune", "--quiet", _auth_url(url), *_MIRROR_REFSPECS)
+
+
+def maintain_mirror(path: Path) -> None:
+    """Repack when loose objects/packs pile up and rewrite the commit-graph for fast history walks."""
+    git = CountingRepo(path).git
+    git.gc("--auto", "--quiet")
+    git.commit_graph("write", "--reachable")
+
+
+class _CloneKwargs(TypedDict, total=False):
+    """`git clone` options passed through `Repo.clone_from`."""
+
+    depth: int
+    no_single_branch: bool
+    single_branch: bool
+    filter: str
+    reference: str
+    sparse: bool
+
+
+def _clone_kwargs(clone: CloneConfig) -> _CloneKwargs:
+    kwargs: _CloneKwargs = {}
+    if clone.depth:
+        kwargs["depth"] = clone.depth
+        if not clone.single_branch:
+            kwargs["no_single_branch"] = True  # --depth implies --single-branch
+    if clone.single_branch:
+        kwargs["single_branch"] = True
+    if clone.filter != CloneFilter.NONE:
+        kwargs["filter"] = _CLONE_FILTERS[clone.filter]
+    return kwargs
+
+
+def _describe_clone(clone: CloneConfig) -> str:
+    parts = [f"depth={clone.depth}"] if clone.depth else []
+    if clone.filter != CloneFilter.NONE:
+        parts.append(clone.filter.value)
+    if clone.single_branch:
+        parts.append("single-branch")
+    return ", ".join(parts)
+
+
+def _is_shallow(repo: Repo) -> bool:
+    return (Path(repo.git_dir) / "shallow").exists()
+
+
+def is_reduced_clone(repo: Repo) -> bool:
+    """Shallow, or only fetching some branches of origin: other branches must be fetched explicitly."""
+    if _is_shallow(repo):
+        return True
+    try:
+        refspecs = repo.config_reader().get_values('remote "origin"', "fetch")
+    except (NoSectionError, NoOptionError):
+        return False
+    return _ALL_HEADS_REFSPEC not in refspecs
+
+
+def fetch_remote_branch(repo: Repo, branch: str) -> bool:
+    """Make origin/{branch} available in a reduced clone. Returns True if the branch exists on origin.
+
+    A full clone already has all branches from the last fetch, nothing is fetched.
+    """
+    if Reference(repo, f"refs/remotes/origin/{branch}").is_valid():
+        return True
+    if not is_reduced_clone(repo):
+        return False
+    args = ["--depth=1"] if _is_shallow(repo) else []
+    try:
+        repo.git.fetch(*args, "origin", f"+refs/heads/{branch}:refs/remotes/origin/{branch}")
+    except GitCommandError:
+        return False  # not on origin (yet)
+    logger.info(f"Fetched origin/{branch} into reduced clone")
+    return True
+
+
+def set_sparse_checkout(repo: Repo, dirs: list[str]) -> None:
+    """Check out only dirs (recursively) and the files at the root, in cone mode. Also enables sparse checkout."""
+    logger.info(
+        f"Sparse checkout of {len(dirs)} directories: {', '.join(dirs[:5])}" + (", ..." if len(dirs) > 5 else "")
+    )
+    repo.git.sparse_checkout("set", "--cone", *dirs)
 
 
 def checkout_branch(repo: Repo, branch: str) -> None:
@@ -79,7 +199,11 @@ def checkout_branch(repo: Repo, branch: str) -> None:
     try:
         repo.git.checkout(branch)
     except GitCommandError:
-        repo.git.checkout("-b", branch)
+        if is_reduced_clone(repo) and fetch_remote_branch(repo, branch):
+            # checkout only guesses (and tracks) remote branches covered by the fetch refspec, push sets upstream
+            repo.git.checkout("-b", branch, f"origin/{branch}")
+        else:
+            repo.git.checkout("-b", branch)
 
 
 def prepare_copy_branch(repo: Repo, default_branch: str, copy_branch: str, from_default: bool = False) -> None:
@@ -108,12 +232,12 @@ def prepare_copy_branch(repo: Repo, default_branch: str, copy_branch: str, from_
         checkout_branch(repo, copy_branch)
 
 
-def get_current_sha(repo: Repo) -> str:
-    return repo.head.commit.hexsha
+def get_current_sha(repo: Repo, ref: str = "HEAD") -> str:
+    return get_backend().commit_sha(repo, ref)
 
 
-def get_commit_timestamp(repo: Repo) -> str:
-    return repo.head.commit.committed_datetime.isoformat()
+def get_commit_timestamp(repo: Repo, ref: str = "HEAD") -> str:
+    return get_backend().commit_timestamp(repo, ref)
 
 
 def get_remote_url(repo: Repo, remote_name: str = "origin") -> str:
@@ -124,14 +248,11 @@ def get_remote_url(repo: Repo, remote_name: str = "origin") -> str:
 
 
 def has_changes(repo: Repo) -> bool:
-    return repo.is_dirty(submodules=False) or len(repo.untracked_files) > 0
+    return get_backend().is_dirty(repo)
 
 
 def commit_changes(repo: Repo, message: str) -> None:
-    repo.git.add("-A")
-    if repo.is_dirty(submodules=False):
-        _ensure_git_user(repo)
-        repo.git.commit("-m", message)
+    if get_backend().commit_all(repo, message):
         logger.info(f"Committed: {message}")
 
 
@@ -139,34 +260,23 @@ def stage_and_commit(repo: Repo, add_paths: list[str], message: str) -> bool:
     """Stage specified paths and commit if there are changes. Returns True if a commit was made."""
     include = [p for p in add_paths if not p.startswith("!")]
     exclude = [p[1:] for p in add_paths if p.startswith("!")]
-    for path in include:
-        repo.git.add(path)
-    for path in exclude:
-        repo.git.reset("HEAD", "--", path)
+    if include:
+        repo.git.add("--", *include)
+    if exclude:
+        repo.git.reset("HEAD", "--", *exclude)
     if not repo.is_dirty(index=True, submodules=False):
         return False
-    _ensure_git_user(repo)
+    ensure_git_user(repo)
     repo.git.commit("-m", message)
     logger.info(f"Committed: {message}")
     return True
 
 
-def _ensure_git_user(repo: Repo) -> None:
-    """Configure git user if not already set."""
-    try:
-        repo.config_reader().get_value("user", "name")
-    except Exception:
-        repo.config_writer().set_value("user", "name", "path-sync[bot]").release()
-        repo.config_writer().set_value("user", "email", "path-sync[bot]@users.noreply.github.com").release()
-
-
 def remote_branch_has_same_content(repo: Repo, branch: str) -> bool:
     """Check if origin/{branch} has identical file content (tree) as local {branch}."""
-    with suppress(GitCommandError):
-        local_tree = repo.git.rev_parse(f"{branch}^{{tree}}")
-        remote_tree = repo.git.rev_parse(f"origin/{branch}^{{tree}}")
-        return local_tree == remote_tree
-    return False
+    if not fetch_remote_branch(repo, branch):
+        return False
+    return get_backend().trees_equal(repo, branch, f"origin/{branch}")
 
 
 def push_branch(repo: Repo, branch: str, force: bool = True) -> bool:
@@ -309,8 +419,84 @@ def get_changed_files(repo: Repo, base_ref: str = "HEAD") -> list[Path]:
     return [repo_root / p for p in diff.strip().split("\n")]
 
 
+def worktree_prefix(repo: Repo, path: Path) -> str:
+    """path relative to the repo root with a trailing `/`, "" for the repo root itself."""
+    prefix = path.resolve().relative_to(Path(repo.working_dir).resolve()).as_posix()
+    return "" if prefix == "." else f"{prefix}/"
+
+
+def list_files(repo: Repo, tracked: bool = True, untracked: bool = False) -> list[str]:
+    """Tracked files and/or untracked files that are not ignored, from one `ls-files` call.
+
+    Paths are relative to the repo root; ignored directories are pruned by git without being listed.
+    """
+    args = ["-z"]
+    if tracked:
+        args.append("--cached")
+    if untracked:
+        args += ["--others", "--exclude-standard"]
+    output = repo.git.ls_files(*args)
+    # unmerged paths are listed once per stage
+    return list(dict.fromkeys(p for p in output.split("\0") if p))
+
+
+def has_commit(repo: Repo, sha: str) -> bool:
+    return get_backend().has_commit(repo, sha)
+
+
+def diff_name_status(repo: Repo, base_ref: str, target_ref: str = "") -> list[tuple[str, str, str]]:
+    """Changes from base_ref to target_ref (default: the working tree, tracked files) with rename detection.
+
+    Returns (status letter, old path, new path) tuples, paths relative to the repo root.
+    For non-renames/copies old path == new path.
+    """
+    refs = [base_ref, target_ref] if target_ref else [base_ref]
+    output = repo.git.diff("--name-status", "-z", "-M", *refs)
+    fields = [f for f in output.split("\0") if f]
+    changes: list[tuple[str, str, str]] = []
+    i = 0
+    while i < len(fields):
+        status = fields[i][0]
+        if status in "RC":
+            changes.append((status, fields[i + 1], fields[i + 2]))
+            i += 3
+        else:
+            changes.append((status, fields[i + 1], fields[i + 1]))
+            i += 2
+    return changes
+
+
+class TreeEntry(NamedTuple):
+    mode: str
+    sha: str
+    size: int
+    path: str
+
+
+def list_tree(repo: Repo, ref: str) -> list[TreeEntry]:
+    """List the blobs (recursively) in the tree of ref, paths relative to the repo root."""
+    output = repo.git.ls_tree("-r", "-z", "--long", ref)
+    entries: list[TreeEntry] = []
+    for record in output.split("\0"):
+        if not record:
+            continue
+        meta, path = record.split("\t", 1)
+        mode, obj_type, sha, size = meta.split()
+        if obj_type == "blob":
+            entries.append(TreeEntry(mode, sha, int(size), path))
+    return entries
+
+
+def read_blob_at_ref(repo: Repo, rel_path: str, ref: str) -> str | None:
+    """Read a file from a commit, works in bare repos. None when missing or not utf-8 text."""
+    data = get_backend().read_blob(repo, ref, rel_path)
+    if data is None:
+        return None
+    try:
+        return data.decode()
+    except UnicodeDecodeError:
+        return None
+
+
 def get_file_content_at_ref(repo: Repo, file_path: Path, ref: str) -> str | None:
-    rel_path = str(file_path.relative_to(repo.working_dir))
-    with suppress(GitCommandError):
-        return repo.git.show(f"{ref}:{rel_path}")
-    return None
+    return read_blob_at_ref(repo, file_path.relative_to(repo.working_dir).as_posix(), ref)
@@ -2,14 +2,24 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
 from git import Repo
 
+from path_sync._internal.git_backend import GitBackendName, select_backend
 from path_sync._internal.git_ops import (
     GH_PR_BODY_MAX_CHARS,
     _truncate_body,
+    checkout_branch,
+    clone_repo,
+    diff_name_status,
+    get_file_content_at_ref,
+    has_commit,
+    is_reduced_clone,
+    list_files,
     push_branch,
     remote_branch_has_same_content,
 )
+from path_sync._internal.models import CloneConfig, CloneFilter
 
 
 def test_truncate_body_short_unchanged():
@@ -131,3 +141,97 @@ def test_push_branch_pushes_when_content_differs(tmp_path: Path):
     clone.index.commit("second")
 
     assert push_branch(clone, "feature", force=True)
+
+
+def test_diff_name_status_detects_renames_and_worktree_changes(tmp_repo: Path):
+    repo = Repo(tmp_repo)
+    (tmp_repo / "old.txt").write_text("some content that is long enough to detect a rename\n" * 5)
+    (tmp_repo / "edit.txt").write_text("v1")
+    repo.git.add("-A")
+    base = repo.index.commit("base").hexsha
+
+    repo.git.mv("old.txt", "new.txt")
+    repo.index.commit("rename")
+    (tmp_repo / "edit.txt").write_text("v2")
+    (tmp_repo / ".gitkeep").unlink()
+
+    assert sorted(diff_name_status(repo, base)) == [
+        ("D", ".gitkeep", ".gitkeep"),
+        ("M", "edit.txt", "edit.txt"),
+        ("R", "old.txt", "new.txt"),
+    ]
+    assert has_commit(repo, base)
+    assert not has_commit(repo, "0" * 40)
+
+
+def test_list_files_skips_ignored(tmp_repo: Path):
+    repo = Repo(tmp_repo)
+    (tmp_repo / ".gitignore").write_text("dist/\n")
+    (tmp_repo / "src").mkdir()
+    (tmp_repo / "src/a.py").write_text("a")
+    repo.git.add("-A")
+    repo.index.commit("add")
+    (tmp_repo / "dist").mkdir()
+    (tmp_repo / "dist/bundle.js").write_text("x")
+    (tmp_repo / "src/new.py").write_text("new")
+
+    assert sorted(list_files(repo)) == [".gitignore", ".gitkeep", "src/a.py"]
+    assert sorted(list_files(repo, untracked=True)) == [".gitignore", ".gitkeep", "src/a.py", "src/new.py"]
+    assert list_files(repo, tracked=False, untracked=True) == ["src/new.py"]
+
+
+def _remote_with_history(tmp_path: Path) -> str:
+    """A bare remote (allowing partial clones) with 3 commits on main and a `sync/test` branch, as file:// URL."""
+    bare, clone = _init_repo_with_remote(tmp_path)
+    bare.git.config("uploadpack.allowFilter", "true")
+    for n in range(2):
+        (Path(clone.working_dir) / "file.txt").write_text(f"v{n}")
+        clone.index.add(["file.txt"])
+        clone.index.commit(f"commit {n}")
+    clone.git.push("origin", "main")
+    clone.git.checkout("-b", "sync/test")
+    clone.git.commit("--allow-empty", "-m", "sync")
+    clone.git.push("origin", "sync/test")
+    return (tmp_path / "remote.git").as_uri()
+
+
+def test_full_clone_is_not_reduced(tmp_path: Path):
+    repo = clone_repo(_remote_with_history(tmp_path), tmp_path / "dest")
+    assert not is_reduced_clone(repo)
+    assert repo.git.rev_list("--count", "HEAD") == "3"
+
+
+def test_shallow_single_branch_clone_fetches_branches_on_demand(tmp_path: Path):
+    url = _remote_with_history(tmp_path)
+    repo = clone_repo(url, tmp_path / "dest", CloneConfig(depth=1, single_branch=True))
+    assert is_reduced_clone(repo)
+    assert repo.git.rev_list("--count", "HEAD") == "1"
+    assert "origin/sync/test" not in [ref.name for ref in repo.remotes.origin.refs]
+
+    checkout_branch(repo, "sync/test")
+    assert repo.head.commit.message.strip() == "sync"
+    assert remote_branch_has_same_content(repo, "sync/test")
+    assert not remote_branch_has_same_content(repo, "missing-branch")
+
+
+@pytest.mark.parametrize("backend", list(GitBackendName))
+def test_blobless_clone_reads_blobs_on_demand(tmp_path: Path, backend: GitBackendName):
+    if backend == GitBackendName.LIBGIT2:
+        pytest.importorskip("pygit2")
+    url = _remote_with_history(tmp_path)
+    repo = clone_repo(url, tmp_path / "dest", CloneConfig(filter=CloneFilter.BLOBLESS))
+    assert repo.git.config("remote.origin.partialclonefilter") == "blob:none"
+    select_backend(backend)
+    try:
+        assert get_file_content_at_ref(repo, Path(repo.working_dir) / "file.txt", "HEAD~2") == "initial"
+    finally:
+        select_backend(GitBackendName.CLI)
+
+
+def test_clone_config_overrides():
+    configured = CloneConfig(depth=5, filter=CloneFilter.TREELESS)
+    assert configured.with_overrides() == configured
+    assert configured.with_overrides(depth=1, filter=CloneFilter.NONE, single_branch=True) == CloneConfig(
+        depth=1, single_branch=True
+    )
+    assert not CloneConfig().is_reduced
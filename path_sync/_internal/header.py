@@ -58,7 +58,7 @@ def remove_header(content: str) -> str:
     return lines[1] if len(lines) > 1 else ""
 
 
-def has_known_comment_prefix(path: Path) -> bool:
+def has_known_comment_prefix(path: Path | str) -> bool:
     try:
         get_comment_config(path)
         return True
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+
+from git import Repo
+
+from path_sync._internal import git_ops
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SourceChanges:
+    """Source files changed since a previously synced commit, as absolute paths under src_root.
+
+    `changed` holds added/modified/renamed-to files (including untracked ones), `deleted` removed and renamed-from files.
+    """
+
+    base_sha: str
+    changed: frozenset[Path]
+    deleted: frozenset[Path]
+
+    def touches(self, path: Path) -> bool:
+        return path in self.changed or path in self.deleted
+
+
+def compute_source_changes(repo: Repo, src_root: Path, base_sha: str, target_ref: str = "") -> SourceChanges | None:
+    """Changes from base_sha to target_ref, or to the working tree (including untracked files) without target_ref.
+
+    Returns None when base_sha is unknown to the source repo (e.g. shallow clone), callers then sync everything.
+    """
+    if not git_ops.has_commit(repo, base_sha):
+        logger.warning(f"Source commit {base_sha[:8]} not found, incremental sync not possible")
+        return None
+    prefix = git_ops.worktree_prefix(repo, src_root)
+
+    def below_src_root(paths: list[str]) -> set[Path]:
+        # git lists paths relative to the repo root, src_root may be a subdirectory of it
+        return {src_root / path.removeprefix(prefix) for path in paths if path.startswith(prefix)}
+
+    changed: list[str] = []
+    deleted: list[str] = []
+    for status, old_path, new_path in git_ops.diff_name_status(repo, base_sha, target_ref):
+        if status in "DR":
+            deleted.append(old_path)
+        if status != "D":
+            changed.append(new_path)
+    if not target_ref:
+        changed.extend(git_ops.list_files(repo, tracked=False, untracked=True))
+    return SourceChanges(base_sha, frozenset(below_src_root(changed)), frozenset(below_src_root(deleted)))
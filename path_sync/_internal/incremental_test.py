@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from git import Repo
+
+from path_sync._internal.incremental import compute_source_changes
+
+
+def _commit(repo: Repo, files: dict[str, str], message: str) -> str:
+    root = Path(repo.working_dir)
+    for rel, content in files.items():
+        (root / rel).parent.mkdir(parents=True, exist_ok=True)
+        (root / rel).write_text(content)
+    repo.index.add(list(files))
+    return repo.index.commit(message).hexsha
+
+
+def test_compute_source_changes_with_src_root_subdirectory(tmp_path: Path):
+    repo = Repo.init(tmp_path)
+    base_sha = _commit(repo, {"sub/a.txt": "a", "sub/gone.txt": "g", "other/b.txt": "b"}, "initial")
+    _commit(repo, {"sub/a.txt": "a2", "other/b.txt": "b2"}, "update")
+    repo.index.remove(["sub/gone.txt"], working_tree=True)
+    repo.index.commit("remove")
+    (tmp_path / "sub/new.txt").write_text("untracked")
+    (tmp_path / "other/new.txt").write_text("untracked")
+    src_root = tmp_path / "sub"
+
+    changes = compute_source_changes(repo, src_root, base_sha)
+
+    assert changes is not None
+    assert changes.changed == {src_root / "a.txt", src_root / "new.txt"}
+    assert changes.deleted == {src_root / "gone.txt"}
+    committed = compute_source_changes(repo, src_root, base_sha, "HEAD")
+    assert committed is not None
+    assert committed.changed == {src_root / "a.txt"}
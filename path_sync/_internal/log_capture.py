@@ -2,17 +2,36 @@ from __future__ import annotations
 
 import logging
 import tempfile
+import threading
 from collections.abc import Callable, Generator
 from contextlib import contextmanager
 from pathlib import Path
 
 LOG_FORMAT = "%(message)s"
+LOGGER_NAME = "path_sync"
+
+_thread_buffers = threading.local()
+_install_lock = threading.Lock()
+
+
+class _OwnerThreadFilter(logging.Filter):
+    """Only accept records emitted from the thread that opened the capture."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.owner = threading.get_ident()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return threading.get_ident() == self.owner
 
 
 @contextmanager
 def capture_log(name: str) -> Generator[Callable[[], str]]:
     """Capture path_sync logger output to a temp file.
 
+    Only records emitted from the calling thread are captured, so parallel
+    destinations each get an isolated log.
+
     Args:
         name: Used for temp file naming (e.g., repo name for debugging).
 
@@ -24,7 +43,8 @@ def capture_log(name: str) -> Generator[Callable[[], str]]:
         file_handler = logging.FileHandler(log_path, mode="w")
         file_handler.setLevel(logging.INFO)
         file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
-        root_logger = logging.getLogger("path_sync")
+        file_handler.addFilter(_OwnerThreadFilter())
+        root_logger = logging.getLogger(LOGGER_NAME)
         root_logger.addHandler(file_handler)
         try:
 
@@ -36,3 +56,57 @@ def capture_log(name: str) -> Generator[Callable[[], str]]:
         finally:
             file_handler.close()
             root_logger.removeHandler(file_handler)
+
+
+class _ThreadBufferFilter(logging.Filter):
+    """Divert records of threads inside `buffer_thread_logs` to their buffer instead of the handlers."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        records: list[logging.LogRecord] | None = getattr(_thread_buffers, "records", None)
+        if records is None:
+            return True
+        records.append(record)
+        return False
+
+
+_BUFFER_FILTER = _ThreadBufferFilter()
+
+
+_installed_for = 0
+
+
+def _install_buffer_filter() -> None:
+    # logger filters only see records created on that logger, so every path_sync logger gets one
+    global _installed_for
+    loggers = logging.Logger.manager.loggerDict
+    if len(loggers) == _installed_for:
+        return
+    with _install_lock:
+        items = list(loggers.items())
+        for name, logger in items:
+            if not isinstance(logger, logging.Logger) or _BUFFER_FILTER in logger.filters:
+                continue
+            if name == LOGGER_NAME or name.startswith(f"{LOGGER_NAME}."):
+                logger.addFilter(_BUFFER_FILTER)
+        _installed_for = len(items)
+
+
+@contextmanager
+def buffer_thread_logs() -> Generator[list[logging.LogRecord]]:
+    """Collect path_sync log records of the calling thread instead of emitting them.
+
+    Meant for worker threads: pass the records to `replay_logs` in the thread that owns the output
+    (e.g. the one inside `capture_log`), in a deterministic order.
+    """
+    _install_buffer_filter()
+    records: list[logging.LogRecord] = []
+    _thread_buffers.records = records
+    try:
+        yield records
+    finally:
+        _thread_buffers.records = None
+
+
+def replay_logs(records: list[logging.LogRecord]) -> None:
+    for record in records:
+        logging.getLogger(record.name).handle(record)
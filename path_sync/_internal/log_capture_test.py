@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import threading
 
 from path_sync._internal.log_capture import capture_log
 
@@ -29,3 +30,17 @@ def test_capture_log_read_after_flush_includes_all():
     assert "before flush" in content1
     assert "before flush" in content2
     assert "after first read" in content2
+
+
+def test_capture_log_ignores_other_threads():
+    test_logger = logging.getLogger("path_sync.test3")
+
+    with capture_log("test3") as read_log:
+        worker = threading.Thread(target=test_logger.info, args=("from worker",))
+        worker.start()
+        worker.join()
+        test_logger.info("from owner")
+        content = read_log()
+
+    assert "from owner" in content
+    assert "from worker" not in content
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Sequence
+from importlib import metadata
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_ENV = "PATH_SYNC_CACHE_DIR"
+CACHE_FORMAT = 1
+DEFAULT_MAX_BYTES = 8 * 1024 * 1024
+# serialized size of one entry: 64 hex chars, quotes, separators and a 10 digit timestamp
+ENTRY_SIZE = 80
+
+
+def _package_version() -> str:
+    try:
+        return metadata.version("path-sync")
+    except metadata.PackageNotFoundError:
+        return "dev"
+
+
+# merge output depends on the path-sync version (header/section formats), so it is part of every key
+_PACKAGE_VERSION = _package_version()
+
+
+def default_cache_dir() -> Path:
+    if env_dir := os.environ.get(CACHE_DIR_ENV):
+        return Path(env_dir)
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg) if xdg else Path.home() / ".cache"
+    return base / "path-sync"
+
+
+def merge_key(
+    src_digest: str,
+    dest_digest: str,
+    skip_list: Sequence[str],
+    should_wrap: bool,
+    config_name: str,
+    dest_name: str,
+    force_overwrite: bool,
+) -> str:
+    """Hash every input of a SYNC merge; the dest file name selects the comment style."""
+    parts = [
+        _PACKAGE_VERSION,
+        src_digest,
+        dest_digest,
+        sorted(skip_list),
+        should_wrap,
+        config_name,
+        dest_name,
+        force_overwrite,
+    ]
+    return hashlib.sha256(json.dumps(parts).encode()).hexdigest()
+
+
+class MergeCache:
+    """On-disk set of SYNC merges known to leave the destination unchanged, one JSON file per config.
+
+    Only "no change" verdicts are stored: a hit means the merge can be skipped entirely,
+    a miss means it runs as usual. Entries are evicted least-recently-used once the file
+    would exceed max_bytes.
+    """
+
+    def __init__(self, path: Path, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, int] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, config_name: str, cache_dir: Path | None = None, max_bytes: int = DEFAULT_MAX_BYTES) -> MergeCache:
+        cache = cls((cache_dir or default_cache_dir()) / f"merge-{config_name}.json", max_bytes)
+        try:
+            data = json.loads(cache.path.read_text())
+        except FileNotFoundError:
+            return cache
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable merge cache {cache.path}: {e}")
+            return cache
+        if isinstance(data, dict) and data.get("format") == CACHE_FORMAT and isinstance(data.get("entries"), dict):
+            cache._entries = {k: v for k, v in data["entries"].items() if isinstance(v, int)}
+        return cache
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def is_unchanged(self, key: str) -> bool:
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return False
+            self.hits += 1
+            self._entries[key] = int(time.time())
+            self._dirty = True
+            return True
+
+    def add_unchanged(self, key: str) -> None:
+        with self._lock:
+            self._entries[key] = int(time.time())
+            self._dirty = True
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            max_entries = self.max_bytes // ENTRY_SIZE
+            if len(self._entries) > max_entries:
+                newest = sorted(self._entries.items(), key=lambda item: item[1], reverse=True)[:max_entries]
+                self._entries = dict(newest)
+            content = json.dumps({"format": CACHE_FORMAT, "entries": self._entries}, separators=(",", ":"))
+            self._dirty = False
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp.write_text(content)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.warning(f"Failed to write merge cache {self.path}: {e}")
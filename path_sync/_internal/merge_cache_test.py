@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from path_sync._internal.merge_cache import ENTRY_SIZE, MergeCache, default_cache_dir, merge_key
+
+
+def _key(n: int) -> str:
+    return merge_key(f"src{n}", "dest", [], False, "cfg", "file.py", False)
+
+
+def test_merge_key_depends_on_all_inputs():
+    base = ("src", "dest", ["b", "a"], False, "cfg", "file.py", False)
+    assert merge_key(*base) == merge_key("src", "dest", ["a", "b"], False, "cfg", "file.py", False)
+    variants = [
+        ("src2", *base[1:]),
+        (*base[:2], ["a"], *base[3:]),
+        (*base[:3], True, *base[4:]),
+        (*base[:4], "other", *base[5:]),
+        (*base[:5], "file.md", base[6]),
+        (*base[:6], True),
+    ]
+    assert len({merge_key(*base), *(merge_key(*v) for v in variants)}) == len(variants) + 1
+
+
+def test_merge_cache_roundtrip_and_lru_eviction(tmp_path: Path):
+    cache = MergeCache.load("cfg", tmp_path, max_bytes=2 * ENTRY_SIZE)
+    for n in range(3):
+        cache.add_unchanged(_key(n))
+        cache._entries[_key(n)] = n  # deterministic "last used" timestamps
+    cache.save()
+
+    reloaded = MergeCache.load("cfg", tmp_path)
+    assert len(reloaded) == 2
+    assert not reloaded.is_unchanged(_key(0))
+    assert reloaded.is_unchanged(_key(2))
+    assert (reloaded.hits, reloaded.misses) == (1, 1)
+
+
+def test_merge_cache_ignores_corrupt_file(tmp_path: Path):
+    (tmp_path / "merge-cfg.json").write_text("{not json")
+    cache = MergeCache.load("cfg", tmp_path)
+    assert len(cache) == 0
+    cache.add_unchanged(_key(1))
+    cache.save()
+    assert MergeCache.load("cfg", tmp_path).is_unchanged(_key(1))
+
+
+def test_default_cache_dir_env(monkeypatch, tmp_path: Path):
+    monkeypatch.setenv("PATH_SYNC_CACHE_DIR", str(tmp_path / "custom"))
+    assert default_cache_dir() == tmp_path / "custom"
+    monkeypatch.delenv("PATH_SYNC_CACHE_DIR")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    assert default_cache_dir() == tmp_path / "xdg" / "path-sync"
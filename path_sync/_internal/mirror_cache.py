@@ -0,0 +1,131 @@
+"""Bare mirrors of destination repos shared by runs on one machine, working clones borrow their objects."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+import shutil
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from git import GitCommandError
+
+from path_sync._internal import git_ops
+
+try:
+    import fcntl
+except ImportError:  # Windows: concurrent runs sharing a mirror are not serialized
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+MAINTENANCE_INTERVAL_S = 7 * 24 * 3600
+MAINTENANCE_MARKER = "path-sync-maintenance"
+
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+def mirror_name(url: str) -> str:
+    """Directory name of the mirror of url: readable repo name + digest of the url (with or without `.git`)."""
+    normalized = url.rstrip("/").removesuffix(".git")
+    stem = _UNSAFE_CHARS.sub("-", normalized.rsplit("/", 1)[-1]) or "repo"
+    return f"{stem}-{hashlib.sha256(normalized.encode()).hexdigest()[:12]}.git"
+
+
+@contextmanager
+def _file_lock(path: Path) -> Iterator[None]:
+    """Exclusive lock shared with other processes (and threads, each opens its own file description)."""
+    if fcntl is None:
+        yield
+        return
+    with path.open("a") as f:
+        try:
+            fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            logger.info(f"Waiting for {path}")
+            fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+class MirrorCache:
+    """One bare mirror per repo url below root, created on first use and fetched once per run.
+
+    Working clones are made with `--reference` to the mirror: objects are read through the clone's
+    alternates instead of being fetched and copied, only objects newer than the mirror are transferred.
+    Mirrors never prune objects (a clone may still borrow them) and get `gc --auto` + commit-graph
+    maintenance at most every maintenance_interval seconds.
+    """
+
+    def __init__(self, root: Path, maintenance_interval: float = MAINTENANCE_INTERVAL_S) -> None:
+        self.root = root
+        self.maintenance_interval = maintenance_interval
+        self.created = 0
+        self.fetched = 0
+        self.maintained = 0
+        self._refreshed: set[str] = set()
+        self._lock = threading.Lock()
+
+    def mirror_path(self, url: str) -> Path:
+        return self.root / mirror_name(url)
+
+    def ensure_mirror(self, url: str) -> Path:
+        """Path of the up-to-date mirror of url. A failed fetch of an existing mirror only logs a warning."""
+        path = self.mirror_path(url)
+        self.root.mkdir(parents=True, exist_ok=True)
+        with _file_lock(path.with_name(f"{path.name}.lock")):
+            with self._lock:
+                if path.name in self._refreshed:
+                    return path
+            if path.exists():
+                self._fetch(path, url)
+            else:
+                self._create(path, url)
+            self._maintain_if_due(path)
+            with self._lock:
+                self._refreshed.add(path.name)
+        return path
+
+    def _create(self, path: Path, url: str) -> None:
+        logger.info(f"Creating mirror of {url} in {path}")
+        tmp = path.with_name(f"{path.name}.tmp")
+        shutil.rmtree(tmp, ignore_errors=True)  # left by an interrupted run
+        git_ops.init_mirror(tmp)
+        git_ops.fetch_mirror(tmp, url)
+        tmp.rename(path)
+        with self._lock:
+            self.created += 1
+
+    def _fetch(self, path: Path, url: str) -> None:
+        try:
+            git_ops.fetch_mirror(path, url)
+        except GitCommandError as e:
+            logger.warning(f"Failed to fetch mirror {path}, using it as is: {e}")
+            return
+        with self._lock:
+            self.fetched += 1
+
+    def _maintain_if_due(self, path: Path) -> None:
+        marker = path / MAINTENANCE_MARKER
+        try:
+            if time.time() - marker.stat().st_mtime < self.maintenance_interval:
+                return
+        except FileNotFoundError:
+            pass
+        try:
+            git_ops.maintain_mirror(path)
+        except GitCommandError as e:
+            logger.warning(f"Maintenance of mirror {path} failed: {e}")
+            return
+        marker.touch()
+        with self._lock:
+            self.maintained += 1
+
+    def summary(self) -> str:
+        return f"{self.created} created, {self.fetched} fetched, {self.maintained} maintained"
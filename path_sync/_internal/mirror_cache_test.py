@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from git import Repo
+
+from path_sync._internal.mirror_cache import MAINTENANCE_MARKER, MirrorCache, mirror_name
+from path_sync._internal.models import Destination
+from path_sync._internal.repo_utils import ensure_repo
+
+
+def _remote(tmp_path: Path) -> tuple[Repo, str]:
+    """A work repo pushing main and `sync/test` to a bare remote, returned with the remote's file:// URL."""
+    bare = Repo.init(tmp_path / "remote.git", bare=True)
+    bare.git.symbolic_ref("HEAD", "refs/heads/main")
+    work = Repo.init(tmp_path / "work", initial_branch="main")
+    work.index.commit("initial")
+    work.create_remote("origin", str(bare.git_dir))
+    work.git.push("origin", "main", "main:sync/test")
+    return work, Path(bare.git_dir).as_uri()
+
+
+def _commit_and_push(work: Repo, message: str) -> str:
+    work.index.commit(message)
+    work.git.push("origin", "main")
+    return work.head.commit.hexsha
+
+
+def _branches(mirror: Path) -> list[str]:
+    return Repo(mirror).git.for_each_ref("--format=%(refname)", "refs/heads").split()
+
+
+def test_mirror_name_ignores_git_suffix():
+    assert mirror_name("https://github.com/org/repo.git") == mirror_name("https://github.com/org/repo/")
+    assert mirror_name("https://github.com/org/repo").startswith("repo-")
+    assert mirror_name("https://github.com/org/repo") != mirror_name("https://github.com/other/repo")
+
+
+def test_mirror_is_created_then_fetched_once_per_run(tmp_path: Path):
+    work, url = _remote(tmp_path)
+    cache = MirrorCache(tmp_path / "mirrors")
+    mirror = cache.ensure_mirror(url)
+    assert _branches(mirror) == ["refs/heads/main", "refs/heads/sync/test"]
+    assert (mirror / MAINTENANCE_MARKER).exists()
+    assert Repo(mirror).git.config("gc.pruneExpire") == "never"
+    assert url not in (mirror / "config").read_text()
+
+    new_sha = _commit_and_push(work, "second")
+    work.git.push("origin", "--delete", "sync/test")
+    assert cache.ensure_mirror(url) == mirror
+    assert (cache.created, cache.fetched) == (1, 0)
+
+    next_run = MirrorCache(tmp_path / "mirrors")
+    next_run.ensure_mirror(url)
+    assert (next_run.created, next_run.fetched, next_run.maintained) == (0, 1, 0)
+    assert Repo(mirror).commit("main").hexsha == new_sha
+    assert _branches(mirror) == ["refs/heads/main"]
+
+
+def test_maintenance_runs_when_due(tmp_path: Path):
+    _, url = _remote(tmp_path)
+    MirrorCache(tmp_path / "mirrors").ensure_mirror(url)
+    cache = MirrorCache(tmp_path / "mirrors", maintenance_interval=0)
+    mirror = cache.ensure_mirror(url)
+    assert cache.maintained == 1
+    assert (mirror / "objects/info/commit-graph").exists()
+
+
+def test_ensure_repo_clones_with_reference_to_mirror(tmp_path: Path):
+    work, url = _remote(tmp_path)
+    cache = MirrorCache(tmp_path / "mirrors")
+    dest = Destination(name="dest", repo_url=url, dest_path_relative="dest")
+
+    repo = ensure_repo(dest, tmp_path / "run/dest", mirror_cache=cache)
+
+    alternates = Path(repo.git_dir) / "objects/info/alternates"
+    assert alternates.read_text().strip() == str((cache.mirror_path(url) / "objects").resolve())
+    assert repo.remotes.origin.url == url
+    assert repo.head.commit.hexsha == work.head.commit.hexsha
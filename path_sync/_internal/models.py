@@ -2,12 +2,15 @@ from __future__ import annotations
 
 import fnmatch
 import glob as glob_mod
+import os
 import re
+import sys
 from enum import StrEnum
+from functools import lru_cache
 from pathlib import Path
 from typing import ClassVar, NamedTuple
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, field_serializer, model_validator
 
 LOG_FORMAT = "%(asctime)s %(levelname)s %(message)s"
 
@@ -30,6 +33,31 @@ def _default_exclude_dirs() -> set[str]:
     return set(DEFAULT_EXCLUDE_DIRS)
 
 
+class PathMatcher:
+    """fnmatch patterns combined into one precompiled regex, plus a set of excluded directory names."""
+
+    def __init__(self, patterns: frozenset[str], dir_names: frozenset[str] = frozenset()) -> None:
+        self.dir_names = frozenset(sys.intern(name) for name in dir_names)
+        regex = "|".join(fnmatch.translate(os.path.normcase(pat)) for pat in sorted(patterns))
+        self._match = re.compile(regex).match if patterns else None
+
+    def matches(self, text: str) -> bool:
+        return self._match is not None and self._match(os.path.normcase(text)) is not None
+
+    def is_excluded(self, path: Path) -> bool:
+        return not self.dir_names.isdisjoint(path.parts) or self.matches(path.name)
+
+
+@lru_cache(maxsize=256)
+def compile_matcher(patterns: frozenset[str], dir_names: frozenset[str] = frozenset()) -> PathMatcher:
+    return PathMatcher(patterns, dir_names)
+
+
+@lru_cache(maxsize=256)
+def _normalize_extensions(extensions: frozenset[str]) -> frozenset[str]:
+    return frozenset(ext.lower() if ext.startswith(".") else f".{ext.lower()}" for ext in extensions)
+
+
 class MergeMethod(StrEnum):
     SQUASH = "squash"
     MERGE = "merge"
@@ -49,6 +77,45 @@ class SyncMode(StrEnum):
     SCAFFOLD = "scaffold"
 
 
+class SourceFiles(StrEnum):
+    """How source files are enumerated: a filesystem walk, or the git index (ignored trees are never visited)."""
+
+    WALK = "walk"
+    TRACKED = "tracked"
+    UNIGNORED = "unignored"  # tracked + untracked files that are not gitignored
+
+
+class CloneFilter(StrEnum):
+    NONE = "none"
+    BLOBLESS = "blobless"  # --filter=blob:none, file contents fetched on demand
+    TREELESS = "treeless"  # --filter=tree:0, trees and file contents fetched on demand
+
+
+class CloneConfig(BaseModel):
+    """How a destination missing from the work dir is cloned; the defaults clone the full history."""
+
+    depth: int = Field(default=0, ge=0)
+    filter: CloneFilter = CloneFilter.NONE
+    single_branch: bool = False
+
+    @property
+    def is_reduced(self) -> bool:
+        return self.depth > 0 or self.filter != CloneFilter.NONE or self.single_branch
+
+    def with_overrides(
+        self, depth: int = 0, filter: CloneFilter | None = None, single_branch: bool = False
+    ) -> CloneConfig:
+        """CLI values replace the configured ones when set."""
+        update: dict[str, object] = {}
+        if depth:
+            update["depth"] = depth
+        if filter is not None:
+            update["filter"] = filter
+        if single_branch:
+            update["single_branch"] = True
+        return self.model_copy(update=update)
+
+
 class OnFailStrategy(StrEnum):
     SKIP = "skip"
     FAIL = "fail"
@@ -69,6 +136,7 @@ class VerifyStep(BaseModel):
 class VerifyConfig(BaseModel):
     on_fail: OnFailStrategy = OnFailStrategy.WARN
     steps: list[VerifyStep] = Field(default_factory=list)
+    sparse_paths: list[str] = Field(default_factory=list)
 
 
 class PathMapping(BaseModel):
@@ -77,18 +145,38 @@ class PathMapping(BaseModel):
     sync_mode: SyncMode = SyncMode.SYNC
     exclude_dirs: set[str] = Field(default_factory=_default_exclude_dirs)
     exclude_file_patterns: set[str] = Field(default_factory=set)
+    text_extensions: set[str] = Field(default_factory=set)
+    binary_extensions: set[str] = Field(default_factory=set)
     wrap: bool | None = None
 
+    @field_serializer("exclude_dirs", "exclude_file_patterns", "text_extensions", "binary_extensions", when_used="json")
+    def _sorted_set(self, value: set[str]) -> list[str]:
+        # stable output for dumped configs and plans
+        return sorted(value)
+
     def should_wrap(self, config_default: bool) -> bool:
         return self.wrap if self.wrap is not None else config_default
 
     def resolved_dest_path(self) -> str:
         return self.dest_path or self.src_path
 
+    def exclude_matcher(self) -> PathMatcher:
+        """Compiled exclude check, fetch once per mapping before iterating files."""
+        return compile_matcher(frozenset(self.exclude_file_patterns), frozenset(self.exclude_dirs))
+
     def is_excluded(self, path: Path) -> bool:
-        if self.exclude_dirs & set(path.parts):
+        return self.exclude_matcher().is_excluded(path)
+
+    def binary_hint(self, path: Path) -> bool | None:
+        """True/False when the extension is listed in binary_extensions/text_extensions, None to sniff the content."""
+        suffix = path.suffix.lower()
+        if not suffix:
+            return None
+        if suffix in _normalize_extensions(frozenset(self.binary_extensions)):
             return True
-        return any(fnmatch.fnmatch(path.name, pat) for pat in self.exclude_file_patterns)
+        if suffix in _normalize_extensions(frozenset(self.text_extensions)):
+            return False
+        return None
 
     def expand_dest_paths(self, repo_root: Path) -> list[Path]:
         dest_path = self.resolved_dest_path()
@@ -195,12 +283,22 @@ class Destination(BaseModel):
     skip_file_patterns: set[str] = Field(default_factory=set)
     include_groups: list[str] = Field(default_factory=list)
     verify: VerifyConfig | None = None
+    clone: CloneConfig = Field(default_factory=CloneConfig)
+    sparse: bool = False
+
+    @field_serializer("skip_file_patterns", when_used="json")
+    def _sorted_set(self, value: set[str]) -> list[str]:
+        return sorted(value)
 
     def resolved_copy_branch(self, config_name: str) -> str:
         return self.copy_branch or f"sync/{config_name}"
 
+    def skip_matcher(self) -> PathMatcher:
+        """Compiled skip_file_patterns check, fetch once per destination before iterating files."""
+        return compile_matcher(frozenset(self.skip_file_patterns))
+
     def is_skipped(self, dest_key: str) -> bool:
-        return any(fnmatch.fnmatch(dest_key, pat) for pat in self.skip_file_patterns)
+        return self.skip_matcher().matches(dest_key)
 
     def resolve_verify(self, fallback: VerifyConfig | None) -> VerifyConfig:
         return self.verify if self.verify is not None else (fallback or VerifyConfig())
@@ -223,6 +321,7 @@ class SrcConfig(BaseModel):
     auto_merge: AutoMergeConfig | None = None
     keep_pr_on_no_changes: bool = False
     force_resync: bool = False
+    source_files: SourceFiles = SourceFiles.WALK
 
     @model_validator(mode="after")
     def _validate_include_groups(self) -> SrcConfig:
@@ -1,3 +1,5 @@
+from pathlib import Path
+
 import pytest
 
 from path_sync._internal.models import (
@@ -139,3 +141,12 @@ def test_format_body_roundtrip_custom_template():
     meta = parse_sync_metadata(body)
     assert meta
     assert meta.ts == "2026-01-01T00:00:00+00:00"
+
+
+def test_path_mapping_binary_hint():
+    mapping = PathMapping(src_path="assets", text_extensions={"svg"}, binary_extensions={".DAT", "bin"})
+    assert mapping.binary_hint(Path("assets/a.dat")) is True
+    assert mapping.binary_hint(Path("assets/b.bin")) is True
+    assert mapping.binary_hint(Path("assets/logo.SVG")) is False
+    assert mapping.binary_hint(Path("assets/readme.md")) is None
+    assert mapping.binary_hint(Path("assets/Makefile")) is None
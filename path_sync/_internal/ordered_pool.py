@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import logging
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TypeVar
+
+from path_sync._internal.log_capture import buffer_thread_logs, replay_logs
+
+T = TypeVar("T")
+
+_TaskOutcome = tuple[T | None, list[logging.LogRecord], Exception | None]
+
+
+def _run_buffered(task: Callable[[], T]) -> _TaskOutcome[T]:
+    with buffer_thread_logs() as records:
+        try:
+            return task(), records, None
+        except Exception as e:  # noqa: BLE001 - re-raised by _finish in task order
+            return None, records, e
+
+
+def _finish(future: Future[_TaskOutcome[T]]) -> T:
+    result, records, error = future.result()
+    replay_logs(records)
+    if error is not None:
+        raise error
+    return result  # pyright: ignore[reportReturnType]
+
+
+def run_ordered(tasks: Iterable[Callable[[], T]], jobs: int, max_pending: int = 0) -> Iterator[T]:
+    """Run tasks on up to `jobs` threads, yielding their results in task order.
+
+    At most `max_pending` tasks (default 2 * jobs) are submitted ahead of the result being consumed,
+    which bounds the memory held by in-flight tasks. Log records of a task are buffered in its worker
+    and replayed in the calling thread when its result is yielded, so the log reads exactly like a
+    sequential run. The first failure in task order is raised, tasks not started yet are cancelled.
+    With jobs <= 1 tasks run inline.
+    """
+    if jobs <= 1:
+        for task in tasks:
+            yield task()
+        return
+    max_pending = max_pending or 2 * jobs
+    pending: deque[Future[_TaskOutcome[T]]] = deque()
+    with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="path-sync-file") as executor:
+        try:
+            for task in tasks:
+                pending.append(executor.submit(_run_buffered, task))
+                if len(pending) >= max_pending:
+                    yield _finish(pending.popleft())
+            while pending:
+                yield _finish(pending.popleft())
+        finally:
+            for future in pending:
+                future.cancel()
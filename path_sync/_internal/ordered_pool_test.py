@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+
+import pytest
+
+from path_sync._internal.log_capture import capture_log
+from path_sync._internal.ordered_pool import run_ordered
+
+logger = logging.getLogger("path_sync.ordered_pool_test")
+
+
+def _task(i: int):
+    def run() -> int:
+        time.sleep(0.002 * (i % 3))
+        logger.info(f"task {i} start")
+        logger.info(f"task {i} done")
+        return i * 10
+
+    return run
+
+
+def test_run_ordered_keeps_task_order_for_results_and_logs():
+    with capture_log("ordered") as read_log:
+        results = list(run_ordered([_task(i) for i in range(12)], jobs=4))
+        log = read_log()
+
+    assert results == [i * 10 for i in range(12)]
+    expected = "".join(f"task {i} start\ntask {i} done\n" for i in range(12))
+    assert log == expected
+
+
+def test_run_ordered_bounds_pending_tasks():
+    lock = threading.Lock()
+    started = 0
+    consumed = 0
+    max_ahead = 0
+
+    def make(i: int):
+        def run() -> int:
+            nonlocal started, max_ahead
+            with lock:
+                started += 1
+                max_ahead = max(max_ahead, started - consumed)
+            return i
+
+        return run
+
+    for _ in run_ordered((make(i) for i in range(50)), jobs=2, max_pending=3):
+        with lock:
+            consumed += 1
+    assert max_ahead <= 3
+
+
+def test_run_ordered_raises_first_failure_in_task_order():
+    def fail(message: str, delay: float):
+        def run() -> int:
+            time.sleep(delay)
+            raise ValueError(message)
+
+        return run
+
+    with pytest.raises(ValueError, match="first"):
+        list(run_ordered([_task(0), fail("first", 0.02), fail("second", 0)], jobs=3))
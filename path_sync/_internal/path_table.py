@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import sys
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+
+
+class PathTable:
+    """Set of destination-relative posix paths, kept as interned strings in one sorted list.
+
+    A sync of 100k files otherwise holds a `Path` per file only to compare it with the orphan candidates;
+    keys are interned (shared by all destinations of a run) and `Path` objects are only built for
+    files that are touched. Keys are appended unsorted and sorted once on the first lookup, a lookup is a bisect.
+    """
+
+    __slots__ = ("_keys", "_sorted")
+
+    def __init__(self, keys: Iterable[str] = ()) -> None:
+        self._keys: list[str] = []
+        self._sorted = True
+        for key in keys:
+            self.add(key)
+
+    def add(self, key: str) -> None:
+        if self._sorted and self._keys and key <= self._keys[-1]:
+            self._sorted = False
+        self._keys.append(sys.intern(key))
+
+    def _sorted_keys(self) -> list[str]:
+        if not self._sorted:
+            self._keys = sorted(set(self._keys))
+            self._sorted = True
+        return self._keys
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+        keys = self._sorted_keys()
+        i = bisect_left(keys, key)
+        return i < len(keys) and keys[i] == key
+
+    def __len__(self) -> int:
+        return len(self._sorted_keys())
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._sorted_keys())
+
+    def __bool__(self) -> bool:
+        return bool(self._keys)
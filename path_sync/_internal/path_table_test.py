@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import sys
+
+from path_sync._internal.path_table import PathTable
+
+
+def test_path_table_membership_and_sorted_iteration():
+    table = PathTable(["b/c.py", "a.py", "b/a.py", "a.py"])
+    assert list(table) == ["a.py", "b/a.py", "b/c.py"]
+    assert len(table) == 3
+    assert "b/a.py" in table
+    assert "b" not in table
+    assert "z.py" not in table
+    table.add("0.py")
+    assert "0.py" in table
+    assert next(iter(table)) == "0.py"
+
+
+def test_path_table_interns_keys():
+    first, second = PathTable(), PathTable()
+    for table in (first, second):
+        table.add(b"docs/a.md".decode())  # a new str object per add
+    assert next(iter(first)) is next(iter(second)) is sys.intern("docs/a.md")
+
+
+def test_empty_path_table():
+    table = PathTable()
+    assert not table
+    assert "a.py" not in table
+    assert list(table) == []
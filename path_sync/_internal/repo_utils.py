@@ -7,7 +7,8 @@ from pathlib import Path
 from git import Repo
 
 from path_sync._internal import git_ops, prompt_utils
-from path_sync._internal.models import Destination
+from path_sync._internal.mirror_cache import MirrorCache
+from path_sync._internal.models import CloneConfig, Destination
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +21,19 @@ def resolve_repo_path(dest: Destination, src_root: Path, work_dir: str) -> Path:
     raise ValueError(f"No dest_path_relative for {dest.name}, use --work-dir")
 
 
-def ensure_repo(dest: Destination, repo_path: Path, dry_run: bool = False) -> Repo:
+def ensure_repo(
+    dest: Destination,
+    repo_path: Path,
+    dry_run: bool = False,
+    clone: CloneConfig | None = None,
+    mirror_cache: MirrorCache | None = None,
+    sparse: bool = False,
+) -> Repo:
+    """Open the destination repo at repo_path, cloning it (with clone, default: dest.clone) when missing.
+
+    With a mirror_cache the clone references the refreshed local mirror of dest.repo_url.
+    A sparse clone starts with only the root files checked out.
+    """
     if repo_path.exists():
         if git_ops.is_git_repo(repo_path):
             return git_ops.get_repo(repo_path)
@@ -34,4 +47,5 @@ def ensure_repo(dest: Destination, repo_path: Path, dry_run: bool = False) -> Re
         raise ValueError(f"Destination repo not found: {repo_path}. Clone it first or run without --dry-run.")
     if not dest.repo_url:
         raise ValueError(f"Dest {dest.name} not found at {repo_path} and no repo_url configured")
-    return git_ops.clone_repo(dest.repo_url, repo_path)
+    reference = mirror_cache.ensure_mirror(dest.repo_url) if mirror_cache is not None else None
+    return git_ops.clone_repo(dest.repo_url, repo_path, clone or dest.clone, reference, sparse)
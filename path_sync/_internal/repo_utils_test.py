@@ -39,7 +39,7 @@ def test_ensure_repo_clones_when_missing(dest: Destination, tmp_path: Path):
         git_ops.clone_repo.return_value = mock_repo
         result = ensure_repo(dest, repo_path)
         assert result is mock_repo
-        git_ops.clone_repo.assert_called_once_with(dest.repo_url, repo_path)
+        git_ops.clone_repo.assert_called_once_with(dest.repo_url, repo_path, dest.clone, None, False)
 
 
 def test_ensure_repo_dry_run_raises_when_missing(dest: Destination, tmp_path: Path):
@@ -0,0 +1,60 @@
+"""Cone-mode sparse checkout of destinations: only the directories a sync reads and writes are checked out."""
+
+from __future__ import annotations
+
+import posixpath
+from collections.abc import Iterable, Sequence
+
+from path_sync._internal.models import PathMapping
+from path_sync._internal.src_scanner import SourceEntry, normalize_rel_path
+
+# the synced manifest lives here
+ALWAYS_CHECKED_OUT = (".github",)
+
+
+def mapping_dest_dir(mapping: PathMapping, entries: Sequence[SourceEntry]) -> str | None:
+    """Destination directory a mapping writes into ("" for root files only), None when it can write anywhere.
+
+    Mirrors `MappingPattern`: a glob writes below `dest_path` or its literal prefix, a single file next to
+    its dest path and a directory (or a missing source) into its dest path.
+    """
+    src_path = normalize_rel_path(mapping.src_path)
+    if "*" in src_path:
+        glob_prefix = src_path.split("*")[0]
+        base = glob_prefix.rstrip("/") if glob_prefix.endswith("/") else posixpath.dirname(glob_prefix)
+        dest_dir = normalize_rel_path(mapping.dest_path or base)
+        spans_dirs = "/" in src_path[len(glob_prefix) :] or "**" in src_path
+        return None if not dest_dir and spans_dirs else dest_dir
+    dest_path = normalize_rel_path(mapping.dest_path or src_path)
+    if len(entries) == 1 and entries[0].dest_key == dest_path:
+        return posixpath.dirname(dest_path)
+    return dest_path
+
+
+def minimal_cone(dirs: Iterable[str]) -> list[str]:
+    """Sorted directories without those below another one (a cone includes everything below its directories).
+
+    Root files are always checked out, "" is dropped.
+    """
+    kept: set[str] = set()
+    for directory in sorted({d.strip("/") for d in dirs} - {""}, key=lambda d: d.count("/")):
+        parts = directory.split("/")
+        if not any("/".join(parts[:i]) in kept for i in range(1, len(parts))):
+            kept.add(directory)
+    return sorted(kept)
+
+
+def cone_dirs(
+    mapped: Iterable[tuple[PathMapping, Sequence[SourceEntry]]], extra: Iterable[str] = ()
+) -> list[str] | None:
+    """Directories to check out for the mappings of a destination plus extra, None if the full tree is needed."""
+    dirs = [*ALWAYS_CHECKED_OUT, *extra]
+    for mapping, entries in mapped:
+        if (dest_dir := mapping_dest_dir(mapping, entries)) is None:
+            return None
+        dirs.append(dest_dir)
+    return minimal_cone(dirs)
+
+
+def parent_dirs(keys: Iterable[str]) -> set[str]:
+    return {posixpath.dirname(key) for key in keys}
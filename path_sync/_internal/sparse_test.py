@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from path_sync._internal.models import PathMapping
+from path_sync._internal.sparse import cone_dirs, mapping_dest_dir, minimal_cone
+from path_sync._internal.src_scanner import SourceEntry
+
+
+def _entry(dest_key: str) -> SourceEntry:
+    return SourceEntry(Path("/src") / dest_key, dest_key, 1, 0)
+
+
+@pytest.mark.parametrize(
+    ("mapping", "entries", "expected"),
+    [
+        (PathMapping(src_path="templates/justfile", dest_path="justfile"), [_entry("justfile")], ""),
+        (
+            PathMapping(src_path="ci/lint.yml", dest_path=".github/workflows/lint.yml"),
+            [_entry(".github/workflows/lint.yml")],
+            ".github/workflows",
+        ),
+        (PathMapping(src_path="scripts/"), [_entry("scripts/a.sh"), _entry("scripts/sub/b.sh")], "scripts"),
+        (PathMapping(src_path="scripts", dest_path="tools/scripts"), [], "tools/scripts"),
+        (PathMapping(src_path=".cursor/**/*.mdc"), [], ".cursor"),
+        (PathMapping(src_path="docs/*.md", dest_path="site"), [], "site"),
+        (PathMapping(src_path="*.md"), [], ""),
+        (PathMapping(src_path="**/*.py"), [], None),
+        (PathMapping(src_path="*/config.yaml"), [], None),
+        (PathMapping(src_path="./justfile"), [_entry("justfile")], ""),
+        (PathMapping(src_path="./docs", dest_path="./site/"), [_entry("site/a.md")], "site"),
+    ],
+)
+def test_mapping_dest_dir(mapping: PathMapping, entries: list[SourceEntry], expected: str | None):
+    assert mapping_dest_dir(mapping, entries) == expected
+
+
+def test_minimal_cone_drops_nested_and_root():
+    assert minimal_cone(["a/b", "a", "a-b/c", "", "x/y/", "x/y/z"]) == ["a", "a-b/c", "x/y"]
+
+
+def test_cone_dirs_adds_manifest_dir_and_extra_paths():
+    mapped = [(PathMapping(src_path="scripts/"), [_entry("scripts/a.sh")])]
+    assert cone_dirs(mapped, ["tests/fixtures"]) == [".github", "scripts", "tests/fixtures"]
+    assert cone_dirs([*mapped, (PathMapping(src_path="**/*.py"), [])]) is None
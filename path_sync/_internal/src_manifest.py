@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+
+from path_sync._internal.dir_cache import DirCache
+from path_sync._internal.models import Destination, PathMapping, SrcConfig
+from path_sync._internal.src_scanner import SourceEntry, scan_listing, scan_sources
+
+
+def iter_mapping_entries(mapping: PathMapping, src_root: Path) -> Iterator[SourceEntry]:
+    for match in scan_sources(src_root, [mapping]):
+        yield match.entry
+
+
+class SourceManifest:
+    """Source files per PathMapping, expanded once per run and shared by all destinations.
+
+    All mappings known up front (`config.paths` and the `path_groups` used by the selected destinations)
+    are matched in a single walk of the source tree; other mappings are expanded on first use.
+    With a `listing` of (relative path, size), e.g. from a git tree, it is matched instead of the filesystem.
+    A `dir_cache` reuses the listings of unchanged source directories from earlier runs.
+    """
+
+    def __init__(
+        self,
+        src_root: Path,
+        listing: Sequence[tuple[str, int | None]] | None = None,
+        dir_cache: DirCache | None = None,
+    ) -> None:
+        self.src_root = src_root
+        self.listing = listing
+        self.dir_cache = dir_cache
+        self._entries: dict[int, tuple[PathMapping, list[SourceEntry]]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def build(
+        cls,
+        config: SrcConfig,
+        src_root: Path,
+        destinations: Sequence[Destination] | None = None,
+        listing: Sequence[tuple[str, int | None]] | None = None,
+        dir_cache: DirCache | None = None,
+    ) -> SourceManifest:
+        manifest = cls(src_root, listing, dir_cache)
+        groups = dict.fromkeys(g for dest in destinations or [] for g in dest.include_groups)
+        mappings = config.paths + [m for g in groups for m in config.path_groups[g]]
+        manifest.add_scan(mappings)
+        return manifest
+
+    def add_scan(self, mappings: Sequence[PathMapping]) -> None:
+        """Expand mappings that are not cached yet, consuming one shared scan stream."""
+        with self._lock:
+            todo = list({id(m): m for m in mappings if id(m) not in self._entries}.values())
+            if not todo:
+                return
+            # keyed by identity: the mapping is kept alive in the value so the id is never reused
+            results: list[list[SourceEntry]] = [[] for _ in todo]
+            if self.listing is None:
+                matches = scan_sources(self.src_root, todo, self.dir_cache)
+            else:
+                matches = scan_listing(self.src_root, self.listing, todo)
+            for match in matches:
+                results[match.mapping_index].append(match.entry)
+            for mapping, entries in zip(todo, results, strict=True):
+                self._entries[id(mapping)] = (mapping, entries)
+
+    def add_entries(self, mapping: PathMapping, entries: list[SourceEntry]) -> None:
+        """Use already known entries for mapping (e.g. from a copy plan) instead of scanning."""
+        with self._lock:
+            self._entries[id(mapping)] = (mapping, entries)
+
+    def entries(self, mapping: PathMapping) -> list[SourceEntry]:
+        if (cached := self._entries.get(id(mapping))) is None:
+            self.add_scan([mapping])
+            cached = self._entries[id(mapping)]
+        return cached[1]
+
+    def resolve(self, config: SrcConfig, dest: Destination) -> list[tuple[PathMapping, list[SourceEntry]]]:
+        mappings = config.resolve_paths(dest)
+        self.add_scan(mappings)
+        return [(mapping, self.entries(mapping)) for mapping in mappings]
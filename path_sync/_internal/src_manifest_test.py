@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+from path_sync._internal import src_manifest
+from path_sync._internal.models import Destination, PathMapping, SrcConfig
+from path_sync._internal.src_manifest import SourceManifest, iter_mapping_entries
+from path_sync._internal.src_scanner import scan_sources
+
+
+def _write(path: Path, content: str = "x") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+def test_iter_mapping_entries_dir_glob_and_file(tmp_path: Path):
+    _write(tmp_path / "scripts/a.py")
+    _write(tmp_path / "scripts/__pycache__/a.pyc")
+    _write(tmp_path / ".cursor/rules/b.mdc", "abc")
+    _write(tmp_path / "justfile")
+
+    dir_entries = list(iter_mapping_entries(PathMapping(src_path="scripts", dest_path="tools"), tmp_path))
+    assert [e.dest_key for e in dir_entries] == ["tools/a.py"]
+
+    glob_entries = list(iter_mapping_entries(PathMapping(src_path=".cursor/**/*.mdc"), tmp_path))
+    assert [(e.dest_key, e.size) for e in glob_entries] == [(".cursor/rules/b.mdc", 3)]
+
+    file_entries = list(iter_mapping_entries(PathMapping(src_path="justfile"), tmp_path))
+    assert [e.src_path for e in file_entries] == [tmp_path / "justfile"]
+
+
+def test_manifest_expands_each_mapping_once(tmp_path: Path):
+    _write(tmp_path / "common.py")
+    _write(tmp_path / "extra.py")
+    config = SrcConfig(
+        name="test",
+        paths=[PathMapping(src_path="common.py")],
+        path_groups={"extra": [PathMapping(src_path="extra.py")], "unused": [PathMapping(src_path="unused.py")]},
+        destinations=[
+            Destination(name="d1", dest_path_relative="d1"),
+            Destination(name="d2", dest_path_relative="d2", include_groups=["extra"]),
+            Destination(name="d3", dest_path_relative="d3", include_groups=["extra"]),
+        ],
+    )
+
+    with patch.object(src_manifest, "scan_sources", wraps=scan_sources) as mock_scan:
+        manifest = SourceManifest.build(config, tmp_path)
+        assert mock_scan.call_count == 1
+        resolved = [manifest.resolve(config, dest) for dest in config.destinations]
+        assert mock_scan.call_count == 2
+
+    assert [[e.dest_key for _, entries in r for e in entries] for r in resolved] == [
+        ["common.py"],
+        ["common.py", "extra.py"],
+        ["common.py", "extra.py"],
+    ]
+
+
+def test_manifest_scans_selected_destination_groups_in_one_pass(tmp_path: Path):
+    _write(tmp_path / "common.py")
+    _write(tmp_path / "extra.py")
+    config = SrcConfig(
+        name="test",
+        paths=[PathMapping(src_path="common.py")],
+        path_groups={"extra": [PathMapping(src_path="extra.py")]},
+        destinations=[Destination(name="d1", dest_path_relative="d1", include_groups=["extra"])],
+    )
+
+    with patch.object(src_manifest, "scan_sources", wraps=scan_sources) as mock_scan:
+        manifest = SourceManifest.build(config, tmp_path, config.destinations)
+        resolved = manifest.resolve(config, config.destinations[0])
+        assert mock_scan.call_count == 1
+    assert [e.dest_key for _, entries in resolved for e in entries] == ["common.py", "extra.py"]
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import io
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager
+from pathlib import Path
+from typing import BinaryIO, Protocol
+
+from git import Repo
+
+from path_sync._internal import git_ops
+from path_sync._internal.file_utils import (
+    DEFAULT_STREAM_THRESHOLD,
+    read_stream_text_or_none,
+    read_text_or_none,
+    stream_copy_file,
+    stream_write_file,
+)
+from path_sync._internal.git_exec import GIT_STATS, CountingGit
+
+logger = logging.getLogger(__name__)
+
+_SYMLINK_MODE = "120000"
+
+
+class SourceReader(Protocol):
+    """Where source file content comes from, source paths are `src_root / <repo relative path>`."""
+
+    def size(self, path: Path) -> int: ...
+
+    def read_bytes(self, path: Path) -> bytes: ...
+
+    def open(self, path: Path) -> AbstractContextManager[BinaryIO]:
+        """Binary stream of the content, read in chunks by the caller."""
+        ...
+
+    def read_text(self, path: Path, binary_hint: bool | None = None) -> str | None:
+        """Text content, None for binary files (see `read_text_or_none`)."""
+        ...
+
+    def copy_to(self, path: Path, dest: Path) -> None:
+        """Write the content to dest atomically without holding it in memory, dest's parent must exist."""
+        ...
+
+
+class FileSourceReader:
+    """Reads the working tree of the source repo."""
+
+    def size(self, path: Path) -> int:
+        return os.stat(path).st_size
+
+    def read_bytes(self, path: Path) -> bytes:
+        return path.read_bytes()
+
+    def open(self, path: Path) -> AbstractContextManager[BinaryIO]:
+        return path.open("rb")
+
+    def read_text(self, path: Path, binary_hint: bool | None = None) -> str | None:
+        return read_text_or_none(path, binary_hint)
+
+    def copy_to(self, path: Path, dest: Path) -> None:
+        stream_copy_file(path, dest)
+
+
+FILE_READER = FileSourceReader()
+
+
+class GitTreeReader:
+    """Reads blobs of one commit straight from the object database, no checkout needed.
+
+    Small blobs go through a single long-lived `git cat-file --batch` process,
+    blobs of at least stream_threshold bytes are streamed from it in chunks.
+    """
+
+    def __init__(self, repo: Repo, src_root: Path, ref: str, stream_threshold: int = DEFAULT_STREAM_THRESHOLD) -> None:
+        self.ref = ref
+        self.stream_threshold = stream_threshold
+        self._blobs: dict[Path, git_ops.TreeEntry] = {}
+        self.paths: list[tuple[str, int]] = []
+        # ls-tree paths are relative to the repo root, src_root may be a subdirectory of it
+        prefix = git_ops.worktree_prefix(repo, src_root)
+        for entry in git_ops.list_tree(repo, ref):
+            if not entry.path.startswith(prefix):
+                continue
+            if entry.mode == _SYMLINK_MODE:
+                logger.warning(f"Skipping symlink in {ref}: {entry.path}")
+                continue
+            rel_path = entry.path.removeprefix(prefix)
+            self._blobs[src_root / rel_path] = entry
+            self.paths.append((rel_path, entry.size))
+        # GitPython's persistent cat-file commands are not thread safe: own Git instance + lock
+        self._git = CountingGit(repo.git_dir)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._blobs)
+
+    def _blob(self, path: Path) -> git_ops.TreeEntry:
+        try:
+            return self._blobs[path]
+        except KeyError:
+            raise FileNotFoundError(f"{path} not in {self.ref}") from None
+
+    def size(self, path: Path) -> int:
+        return self._blob(path).size
+
+    def read_bytes(self, path: Path) -> bytes:
+        blob = self._blob(path)
+        start = time.perf_counter()
+        with self._lock:
+            _, _, _, data = self._git.get_object_data(blob.sha)
+        GIT_STATS.add_batch_read(time.perf_counter() - start)
+        return data
+
+    @contextmanager
+    def _stream(self, blob: git_ops.TreeEntry) -> Iterator[BinaryIO]:
+        with self._lock:
+            start = time.perf_counter()
+            _, _, _, stream = self._git.stream_object_data(blob.sha)
+            GIT_STATS.add_batch_read(time.perf_counter() - start)
+            try:
+                yield stream  # pyright: ignore[reportReturnType]
+            finally:
+                # the batch process must be drained before the next request
+                while stream.read(1024 * 1024):
+                    pass
+
+    def open(self, path: Path) -> AbstractContextManager[BinaryIO]:
+        blob = self._blob(path)
+        if blob.size >= self.stream_threshold:
+            return self._stream(blob)
+        return io.BytesIO(self.read_bytes(path))
+
+    def read_text(self, path: Path, binary_hint: bool | None = None) -> str | None:
+        if binary_hint:
+            return None
+        with self.open(path) as f:
+            return read_stream_text_or_none(f, binary_hint)
+
+    def copy_to(self, path: Path, dest: Path) -> None:
+        with self.open(path) as f:
+            stream_write_file(f, dest)
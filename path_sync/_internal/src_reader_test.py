@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from git import Repo
+
+from path_sync._internal.src_reader import GitTreeReader
+
+
+def _commit_tree(root: Path) -> Repo:
+    repo = Repo.init(root)
+    (root / "docs").mkdir()
+    (root / "docs/readme.md").write_text("committed\n")
+    (root / "logo.bin").write_bytes(bytes(range(256)) * 40)
+    os.symlink("docs/readme.md", root / "link.md")
+    repo.git.add("-A")
+    repo.index.commit("init")
+    return repo
+
+
+def test_git_tree_reader_reads_commit_not_working_tree(tmp_path: Path):
+    repo = _commit_tree(tmp_path)
+    (tmp_path / "docs/readme.md").write_text("uncommitted\n")
+    (tmp_path / "new.md").write_text("untracked")
+
+    reader = GitTreeReader(repo, tmp_path, "HEAD")
+
+    assert sorted(rel for rel, _ in reader.paths) == ["docs/readme.md", "logo.bin"]
+    assert reader.read_text(tmp_path / "docs/readme.md") == "committed\n"
+    assert reader.read_text(tmp_path / "logo.bin") is None
+    assert reader.size(tmp_path / "logo.bin") == 10240
+
+
+def test_git_tree_reader_streams_large_blobs(tmp_path: Path):
+    repo = _commit_tree(tmp_path / "src")
+    reader = GitTreeReader(repo, tmp_path / "src", "HEAD", stream_threshold=1024)
+    src = tmp_path / "src/logo.bin"
+    dest = tmp_path / "dest/logo.bin"
+    dest.parent.mkdir()
+
+    reader.copy_to(src, dest)
+    assert dest.read_bytes() == src.read_bytes()
+    # the shared cat-file process stays usable after streaming
+    assert reader.read_text(tmp_path / "src/docs/readme.md") == "committed\n"
+
+
+def test_git_tree_reader_src_root_subdirectory(tmp_path: Path):
+    repo = _commit_tree(tmp_path)
+    src_root = tmp_path / "docs"
+
+    reader = GitTreeReader(repo, src_root, "HEAD")
+
+    assert reader.paths == [("readme.md", len("committed\n"))]
+    assert reader.read_text(src_root / "readme.md") == "committed\n"
@@ -0,0 +1,325 @@
+"""Single-pass source scanner: walks the source tree once and matches every PathMapping in the same pass."""
+
+from __future__ import annotations
+
+import logging
+import os
+import posixpath
+import re
+import stat
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass
+from enum import StrEnum
+from pathlib import Path
+from typing import NamedTuple
+
+from path_sync._internal.dir_cache import DirCache, DirEntryLike, scandir_sorted
+from path_sync._internal.models import PathMapping, PathMatcher
+
+logger = logging.getLogger(__name__)
+
+
+class SourceEntry(NamedTuple):
+    src_path: Path
+    dest_key: str
+    size: int
+    mtime_ns: int
+
+
+class ScanMatch(NamedTuple):
+    mapping_index: int
+    entry: SourceEntry
+
+
+class PatternKind(StrEnum):
+    GLOB = "glob"
+    DIR = "dir"
+    FILE = "file"
+    MISSING = "missing"
+
+
+def _translate_bracket(part: str, start: int) -> tuple[str, int]:
+    """Translate the `[...]` set starting after `[` at `start`; returns the regex and the index after `]`."""
+    j, n = start, len(part)
+    if j < n and part[j] == "!":
+        j += 1
+    if j < n and part[j] == "]":
+        j += 1
+    while j < n and part[j] != "]":
+        j += 1
+    if j >= n:
+        return "\\[", start
+    stuff = part[start:j].replace("\\", "\\\\")
+    if stuff.startswith("!"):
+        stuff = "^/" + stuff[1:]
+    elif stuff.startswith("^"):
+        stuff = "\\" + stuff
+    return f"[{stuff}]", j + 1
+
+
+def _translate_component(part: str) -> str:
+    """Translate one glob path component to a regex that never crosses `/`."""
+    i, n = 0, len(part)
+    res: list[str] = []
+    while i < n:
+        c = part[i]
+        i += 1
+        if c == "*":
+            res.append("[^/]*")
+        elif c == "?":
+            res.append("[^/]")
+        elif c == "[":
+            translated, i = _translate_bracket(part, i)
+            res.append(translated)
+        else:
+            res.append(re.escape(c))
+    return "".join(res)
+
+
+def glob_to_regex(pattern: str) -> re.Pattern[str]:
+    """Compile a recursive glob (relative, `/`-separated) with `glob.glob` semantics.
+
+    Wildcards do not match names starting with `.` unless the pattern component does, and `**` skips hidden dirs.
+    """
+    parts = pattern.split("/")
+    regex: list[str] = []
+    for i, part in enumerate(parts):
+        last = i == len(parts) - 1
+        if part == "**":
+            regex.append(r"[^/.][^/]*(?:/[^/.][^/]*)*" if last else r"(?:[^/.][^/]*/)*")
+            continue
+        if not any(c in part for c in "*?["):
+            regex.append(re.escape(part))
+        else:
+            hidden_guard = "" if part.startswith(".") else r"(?!\.)"
+            regex.append(hidden_guard + _translate_component(part))
+        if not last:
+            regex.append("/")
+    return re.compile("".join(regex))
+
+
+def normalize_rel_path(rel: str) -> str:
+    """Relative posix path without `./`, duplicate or surrounding slashes ("" for the root), like `Path` parts."""
+    rel = rel.strip("/")
+    normalized = posixpath.normpath(rel) if rel else ""
+    return "" if normalized == "." else normalized
+
+
+def _dest_prefix(dest_path: str) -> str:
+    return f"{dest_path}/" if dest_path else ""
+
+
+@dataclass
+class MappingPattern:
+    """A PathMapping compiled for matching relative source paths."""
+
+    index: int
+    mapping: PathMapping
+    kind: PatternKind
+    base: str
+    dest_path: str
+    dest_prefix: str
+    matcher: PathMatcher
+    regex: re.Pattern[str] | None = None
+    blocked: bool = False
+
+    @classmethod
+    def compile(
+        cls, index: int, mapping: PathMapping, src_root: Path, kind_of: Callable[[str], PatternKind] | None = None
+    ) -> MappingPattern:
+        """kind_of classifies a literal src_path (default: from the filesystem below src_root)."""
+        src_path = normalize_rel_path(mapping.src_path)
+        matcher = mapping.exclude_matcher()
+        if "*" in src_path:
+            glob_prefix = src_path.split("*")[0]
+            base = glob_prefix.rstrip("/") if glob_prefix.endswith("/") else os.path.dirname(glob_prefix)
+            kind = PatternKind.GLOB
+            dest_path = normalize_rel_path(mapping.dest_path or base)
+            dest_prefix = _dest_prefix(dest_path)
+            regex = glob_to_regex(src_path)
+        else:
+            base = src_path
+            kind = (kind_of or _fs_kind_of(src_root))(src_path)
+            # dest keys must match the normalized paths listed from the destination (e.g. `./justfile` -> `justfile`)
+            dest_path = normalize_rel_path(mapping.dest_path or src_path)
+            dest_prefix = _dest_prefix(dest_path) if kind == PatternKind.DIR else ""
+            regex = None
+        # excluded dir names anywhere above the scanned files exclude the whole mapping (single files are never excluded)
+        blocked = kind != PatternKind.FILE and not matcher.dir_names.isdisjoint((*src_root.parts, *Path(base).parts))
+        return cls(index, mapping, kind, base, dest_path, dest_prefix, matcher, regex, blocked)
+
+    def dest_key(self, rel: str, name: str) -> str | None:
+        """Return the dest_key for a file below `base` (dirs already pruned), or None if it doesn't match."""
+        if self.matcher.matches(name):
+            return None
+        if self.kind == PatternKind.DIR:
+            return self.dest_prefix + rel[len(self.base) + 1 :]
+        if self.regex is not None and self.regex.fullmatch(rel):
+            sub = rel[len(self.base) + 1 :] if self.base else rel
+            return self.dest_prefix + sub
+        return None
+
+    def is_below(self, rel_dir: str) -> bool:
+        return not self.base or rel_dir == self.base or rel_dir.startswith(f"{self.base}/")
+
+    def is_pending_under(self, rel_dir: str) -> bool:
+        return self.base.startswith(f"{rel_dir}/") if rel_dir else bool(self.base)
+
+
+def _fs_kind_of(src_root: Path) -> Callable[[str], PatternKind]:
+    def kind_of(src_path: str) -> PatternKind:
+        full = src_root / src_path
+        return PatternKind.DIR if full.is_dir() else PatternKind.FILE if full.is_file() else PatternKind.MISSING
+
+    return kind_of
+
+
+def _file_entry(src_root: Path, rel: str, dest_key: str, st: os.stat_result) -> SourceEntry:
+    return SourceEntry(src_root / rel, dest_key, st.st_size, st.st_mtime_ns)
+
+
+def _scan_file_pattern(pattern: MappingPattern, src_root: Path) -> Iterator[ScanMatch]:
+    try:
+        st = os.stat(src_root / pattern.base)
+    except OSError:
+        return
+    if stat.S_ISREG(st.st_mode):
+        entry = _file_entry(src_root, pattern.base, pattern.dest_path, st)
+        yield ScanMatch(pattern.index, entry)
+
+
+def _walk(
+    src_root: Path,
+    rel_dir: str,
+    active: list[MappingPattern],
+    pending: list[MappingPattern],
+    scandir: Callable[[Path], list[DirEntryLike]],
+) -> Iterator[ScanMatch]:
+    try:
+        entries = scandir(src_root / rel_dir if rel_dir else src_root)
+    except OSError:
+        return
+    for entry in entries:
+        rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+        starting = [p for p in pending if p.base == rel]
+        child_pending = [p for p in pending if p.is_pending_under(rel)]
+        if entry.is_dir(follow_symlinks=False):
+            child_active = [p for p in active if entry.name not in p.matcher.dir_names] + starting
+            if child_active or child_pending:
+                yield from _walk(src_root, rel, child_active, child_pending, scandir)
+        elif (starting or child_pending) and entry.is_dir():
+            # symlinked dirs are only followed on the way to a mapping's base, like rglob on a symlinked src_path
+            yield from _walk(src_root, rel, starting, child_pending, scandir)
+        elif active and entry.is_file():
+            st: os.stat_result | None = None
+            for pattern in active:
+                if (dest_key := pattern.dest_key(rel, entry.name)) is None:
+                    continue
+                st = st or entry.stat()
+                yield ScanMatch(pattern.index, _file_entry(src_root, rel, dest_key, st))
+
+
+def scan_sources(
+    src_root: Path, mappings: Sequence[PathMapping], dir_cache: DirCache | None = None
+) -> Iterator[ScanMatch]:
+    """Yield matches for all mappings lazily from one walk of src_root.
+
+    Directories listed in a mapping's exclude_dirs are pruned before descending,
+    only subtrees below some mapping's base directory are visited, and entries are visited in sorted order.
+    With a dir_cache, listings of unchanged directories are reused.
+    """
+    patterns = [MappingPattern.compile(i, m, src_root) for i, m in enumerate(mappings)]
+    matched: set[int] = set()
+    tree_patterns: list[MappingPattern] = []
+    for pattern in patterns:
+        if pattern.kind == PatternKind.FILE:
+            for match in _scan_file_pattern(pattern, src_root):
+                matched.add(match.mapping_index)
+                yield match
+        elif pattern.kind != PatternKind.MISSING and not pattern.blocked:
+            tree_patterns.append(pattern)
+
+    if tree_patterns:
+        active = [p for p in tree_patterns if not p.base]
+        pending = [p for p in tree_patterns if p.base]
+        scandir = dir_cache.scandir if dir_cache is not None else scandir_sorted
+        for match in _walk(src_root, "", active, pending, scandir):
+            matched.add(match.mapping_index)
+            yield match
+
+    _warn_unmatched(patterns, matched)
+
+
+def _warn_unmatched(patterns: list[MappingPattern], matched: set[int]) -> None:
+    for pattern in patterns:
+        if pattern.index in matched:
+            continue
+        if pattern.kind == PatternKind.GLOB:
+            logger.warning(f"Glob matched no files: {pattern.mapping.src_path}")
+        elif pattern.kind == PatternKind.MISSING:
+            logger.warning(f"Source not found: {pattern.mapping.src_path}")
+
+
+def scan_listing(
+    src_root: Path, paths: Sequence[tuple[str, int | None]], mappings: Sequence[PathMapping]
+) -> Iterator[ScanMatch]:
+    """Like scan_sources, but match a listing of (relative path, size) instead of walking the filesystem.
+
+    Used for sources read from a git tree (entries get mtime_ns=0) or listed from the git index:
+    a None size is stat'ed when the path matches, paths that are no regular file (anymore) are skipped.
+    """
+    files = {rel: size for rel, size in paths}
+    dirs = {parent for rel in files for parent in _parents(rel)}
+
+    def kind_of(src_path: str) -> PatternKind:
+        return PatternKind.DIR if src_path in dirs else PatternKind.FILE if src_path in files else PatternKind.MISSING
+
+    patterns = [MappingPattern.compile(i, m, src_root, kind_of) for i, m in enumerate(mappings)]
+    matched: set[int] = set()
+    for match in _match_listing(src_root, files, patterns):
+        matched.add(match.mapping_index)
+        yield match
+    _warn_unmatched(patterns, matched)
+
+
+def _match_listing(src_root: Path, files: dict[str, int | None], patterns: list[MappingPattern]) -> Iterator[ScanMatch]:
+    for pattern in patterns:
+        if pattern.kind == PatternKind.FILE:
+            entry = _listed_entry(src_root, pattern.base, pattern.dest_path, files[pattern.base])
+            if entry is not None:
+                yield ScanMatch(pattern.index, entry)
+
+    tree_patterns = [p for p in patterns if p.kind in (PatternKind.DIR, PatternKind.GLOB) and not p.blocked]
+    if not tree_patterns:
+        return
+    # same order as the filesystem walk: sorted per directory level
+    for rel in sorted(files, key=lambda r: r.split("/")):
+        rel_dir, _, name = rel.rpartition("/")
+        for pattern in tree_patterns:
+            if not pattern.is_below(rel_dir) or _has_excluded_dir(pattern, rel_dir):
+                continue
+            if (dest_key := pattern.dest_key(rel, name)) is None:
+                continue
+            if (entry := _listed_entry(src_root, rel, dest_key, files[rel])) is not None:
+                yield ScanMatch(pattern.index, entry)
+
+
+def _listed_entry(src_root: Path, rel: str, dest_key: str, size: int | None) -> SourceEntry | None:
+    if size is not None:
+        return SourceEntry(src_root / rel, dest_key, size, 0)
+    try:
+        st = os.stat(src_root / rel)
+    except OSError:
+        return None  # e.g. tracked but deleted in the working tree
+    return _file_entry(src_root, rel, dest_key, st) if stat.S_ISREG(st.st_mode) else None
+
+
+def _parents(rel: str) -> Iterator[str]:
+    while "/" in rel:
+        rel = rel.rpartition("/")[0]
+        yield rel
+
+
+def _has_excluded_dir(pattern: MappingPattern, rel_dir: str) -> bool:
+    below = rel_dir[len(pattern.base) + 1 :] if pattern.base else rel_dir
+    return bool(below) and not pattern.matcher.dir_names.isdisjoint(below.split("/"))
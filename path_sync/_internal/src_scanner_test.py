@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import glob
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from path_sync._internal import src_scanner
+from path_sync._internal.models import PathMapping
+from path_sync._internal.src_scanner import glob_to_regex, scan_listing, scan_sources
+
+FILES = [
+    "a.md",
+    ".hidden.md",
+    "docs/index.md",
+    "docs/.draft.md",
+    "docs/guide/usage.md",
+    "docs/.private/secret.md",
+    "docs/[x]/odd.md",
+    ".cursor/rules/b.mdc",
+    ".cursor/rules/nested/c.mdc",
+]
+
+
+def _write_tree(root: Path, files: list[str]) -> None:
+    for rel in files:
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(rel)
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    ["*.md", "**/*.md", "docs/**/*.md", "docs/*.md", "docs/**", ".cursor/**/*.mdc", "docs/g?ide/*.md", "[ab].md"],
+)
+def test_glob_to_regex_matches_glob_glob(tmp_path: Path, pattern: str):
+    _write_tree(tmp_path, FILES)
+    expected = sorted(
+        Path(p).relative_to(tmp_path).as_posix()
+        for p in glob.glob(str(tmp_path / pattern), recursive=True)
+        if os.path.isfile(p)
+    )
+    regex = glob_to_regex(pattern)
+    actual = sorted(rel for rel in FILES if regex.fullmatch(rel))
+    assert actual == expected
+
+
+def test_scan_sources_prunes_excluded_dirs(tmp_path: Path):
+    _write_tree(tmp_path, ["pkg/a.py", "pkg/__pycache__/a.pyc", "pkg/sub/b.py", "pkg/sub/__pycache__/b.pyc"])
+    mapping = PathMapping(src_path="pkg", exclude_file_patterns={"*.txt"})
+
+    with patch.object(src_scanner.os, "scandir", wraps=os.scandir) as mock_scandir:
+        keys = [m.entry.dest_key for m in scan_sources(tmp_path, [mapping])]
+
+    assert keys == ["pkg/a.py", "pkg/sub/b.py"]
+    visited = {Path(call.args[0]).relative_to(tmp_path).as_posix() for call in mock_scandir.call_args_list}
+    assert visited == {".", "pkg", "pkg/sub"}
+
+
+def test_scan_sources_single_walk_for_all_mappings(tmp_path: Path):
+    _write_tree(tmp_path, FILES + ["justfile", "unrelated/big/file.bin"])
+    mappings = [
+        PathMapping(src_path="docs", dest_path="site"),
+        PathMapping(src_path=".cursor/**/*.mdc"),
+        PathMapping(src_path="justfile"),
+        PathMapping(src_path="missing/*.md"),
+    ]
+
+    with patch.object(src_scanner.os, "scandir", wraps=os.scandir) as mock_scandir:
+        matches = list(scan_sources(tmp_path, mappings))
+
+    by_index: dict[int, list[str]] = {}
+    for match in matches:
+        by_index.setdefault(match.mapping_index, []).append(match.entry.dest_key)
+    assert by_index == {
+        0: ["site/.draft.md", "site/.private/secret.md", "site/[x]/odd.md", "site/guide/usage.md", "site/index.md"],
+        1: [".cursor/rules/b.mdc", ".cursor/rules/nested/c.mdc"],
+        2: ["justfile"],
+    }
+    visited = [Path(call.args[0]).relative_to(tmp_path).as_posix() for call in mock_scandir.call_args_list]
+    assert len(visited) == len(set(visited))
+    assert "unrelated" not in visited
+
+
+def test_scan_listing_matches_filesystem_scan(tmp_path: Path):
+    files = FILES + ["justfile", "pkg/a.py", "pkg/__pycache__/a.pyc", "pkg/sub/b.py"]
+    _write_tree(tmp_path, files)
+    mappings = [
+        PathMapping(src_path="docs", dest_path="site"),
+        PathMapping(src_path="**/*.md", exclude_file_patterns={"index.*"}),
+        PathMapping(src_path="pkg"),
+        PathMapping(src_path="justfile"),
+        PathMapping(src_path="missing"),
+    ]
+    listing = [(rel, len(rel)) for rel in files]
+
+    def keys(matches):
+        # per mapping order is the same, interleaving between mappings may differ
+        return sorted((m.mapping_index, m.entry.src_path, m.entry.dest_key, m.entry.size) for m in matches)
+
+    assert keys(scan_listing(tmp_path, listing, mappings)) == keys(scan_sources(tmp_path, mappings))
+
+
+@pytest.mark.parametrize(
+    ("src_path", "normalized"),
+    [("./docs", "docs"), ("./.cursor/**/*.mdc", ".cursor/**/*.mdc"), ("docs/", "docs"), (".//docs", "docs")],
+)
+def test_scan_normalizes_dot_slash_src_path(tmp_path: Path, src_path: str, normalized: str):
+    _write_tree(tmp_path, FILES)
+
+    def keys(mapping: PathMapping, use_listing: bool) -> list[tuple[str, str]]:
+        if use_listing:
+            matches = scan_listing(tmp_path, [(rel, len(rel)) for rel in FILES], [mapping])
+        else:
+            matches = scan_sources(tmp_path, [mapping])
+        return sorted((m.entry.src_path.relative_to(tmp_path).as_posix(), m.entry.dest_key) for m in matches)
+
+    expected = keys(PathMapping(src_path=normalized), use_listing=False)
+    assert expected
+    assert keys(PathMapping(src_path=src_path), use_listing=False) == expected
+    assert keys(PathMapping(src_path=src_path), use_listing=True) == expected
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+from collections.abc import Iterable
+from collections.abc import Set as AbstractSet
+from pathlib import Path
+
+import yaml
+from pydantic import BaseModel, Field, ValidationError
+
+from path_sync._internal.file_utils import ensure_parents_write_text
+from path_sync._internal.yaml_utils import dump_yaml_model, load_yaml_model
+
+logger = logging.getLogger(__name__)
+
+SYNCED_MANIFEST_EXT = ".synced.yaml"
+SYNCED_MANIFEST_COMMENT = "# Generated by path-sync copy, do not edit\n"
+
+
+class SyncedManifest(BaseModel):
+    """Destination paths written by one config, stored in the destination repo.
+
+    `files` maps the destination path (relative, posix) to the sha256 of its content.
+    `src_sha` is the source commit the files were last changed from, the base for `copy --incremental`.
+    `config_digest` identifies the config (and destination) settings of the last sync: when they change
+    `copy --incremental` runs a full sync, wherever the config was loaded from.
+    """
+
+    config_name: str
+    src_sha: str = ""
+    config_digest: str = ""
+    files: dict[str, str] = Field(default_factory=dict)
+
+
+def resolve_synced_manifest_path(dest_root: Path, config_name: str) -> Path:
+    return dest_root / ".github" / f"{config_name}{SYNCED_MANIFEST_EXT}"
+
+
+def load_synced_manifest(dest_root: Path, config_name: str) -> SyncedManifest | None:
+    """Return None when the manifest is missing or unreadable, callers then fall back to a header scan."""
+    path = resolve_synced_manifest_path(dest_root, config_name)
+    if not path.exists():
+        return None
+    try:
+        manifest = load_yaml_model(path, SyncedManifest)
+    except (yaml.YAMLError, ValidationError, OSError, UnicodeDecodeError) as e:
+        logger.warning(f"Ignoring corrupted synced manifest {path}: {e}")
+        return None
+    if manifest.config_name != config_name:
+        logger.warning(f"Ignoring synced manifest {path}: config_name={manifest.config_name!r}")
+        return None
+    return manifest
+
+
+def file_sha256(path: Path) -> str:
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def build_synced_manifest(
+    dest_root: Path,
+    config_name: str,
+    synced_keys: Iterable[str],
+    previous: SyncedManifest | None,
+    written_keys: AbstractSet[str] = frozenset(),
+    keep_missing: bool = False,
+    src_sha: str = "",
+    config_digest: str = "",
+) -> SyncedManifest:
+    """Build the manifest for synced_keys (destination paths relative to dest_root).
+
+    Args:
+        written_keys: Keys written this run, only those (and keys missing in previous) are hashed,
+            the other hashes are reused from previous.
+        keep_missing: Keep previous entries that were not synced this run (orphans left in place).
+        src_sha: Source commit of this run, only recorded when files changed (or there is no previous sha)
+            so that runs without changes leave the manifest untouched.
+        config_digest: Digest of the config settings of this run, always recorded.
+    """
+    old_files = previous.files if previous else {}
+    files: dict[str, str] = {}
+    for key in synced_keys:
+        if key not in written_keys and key in old_files:
+            files[key] = old_files[key]
+        elif (path := dest_root / key).is_file():
+            files[key] = file_sha256(path)
+    if keep_missing:
+        for key, digest in old_files.items():
+            files.setdefault(key, digest)
+    previous_sha = previous.src_sha if previous else ""
+    if files != old_files or not previous_sha:
+        previous_sha = src_sha
+    return SyncedManifest(
+        config_name=config_name,
+        src_sha=previous_sha,
+        config_digest=config_digest,
+        files=dict(sorted(files.items())),
+    )
+
+
+def write_synced_manifest(dest_root: Path, manifest: SyncedManifest) -> bool:
+    """Write the manifest if its content changed. Returns True if the file was written."""
+    path = resolve_synced_manifest_path(dest_root, manifest.config_name)
+    content = SYNCED_MANIFEST_COMMENT + dump_yaml_model(manifest)
+    if path.exists() and path.read_text() == content:
+        return False
+    ensure_parents_write_text(path, content)
+    logger.info(f"Wrote synced manifest: {path}")
+    return True
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+from path_sync._internal.synced_manifest import (
+    SyncedManifest,
+    build_synced_manifest,
+    file_sha256,
+    load_synced_manifest,
+    resolve_synced_manifest_path,
+    write_synced_manifest,
+)
+
+CONFIG_NAME = "test-config"
+
+
+def test_load_missing_manifest_returns_none(tmp_path: Path):
+    assert load_synced_manifest(tmp_path, CONFIG_NAME) is None
+
+
+def test_load_corrupted_manifest_returns_none(tmp_path: Path):
+    path = resolve_synced_manifest_path(tmp_path, CONFIG_NAME)
+    path.parent.mkdir(parents=True)
+    path.write_text("files: [not, a, dict")
+    assert load_synced_manifest(tmp_path, CONFIG_NAME) is None
+
+
+def test_manifest_roundtrip_and_idempotent_write(tmp_path: Path):
+    synced = tmp_path / "scripts" / "a.py"
+    synced.parent.mkdir()
+    synced.write_text("print('a')")
+
+    manifest = build_synced_manifest(tmp_path, CONFIG_NAME, ["scripts/a.py"], previous=None)
+    assert manifest.files == {"scripts/a.py": file_sha256(synced)}
+
+    assert write_synced_manifest(tmp_path, manifest)
+    assert not write_synced_manifest(tmp_path, manifest)
+    assert load_synced_manifest(tmp_path, CONFIG_NAME) == manifest
+
+
+def test_build_manifest_reuses_hashes_and_keeps_missing(tmp_path: Path):
+    synced = tmp_path / "a.py"
+    synced.write_text("changed")
+    previous = SyncedManifest(config_name=CONFIG_NAME, files={"a.py": "old", "gone.py": "old-gone"})
+
+    manifest = build_synced_manifest(tmp_path, CONFIG_NAME, ["a.py"], previous, keep_missing=True)
+
+    assert manifest.files == {"a.py": "old", "gone.py": "old-gone"}
+
+
+def test_build_manifest_records_src_sha_only_on_change(tmp_path: Path):
+    file = tmp_path / "a.py"
+    file.write_text("a")
+    first = build_synced_manifest(tmp_path, CONFIG_NAME, ["a.py"], None, src_sha="sha1")
+    assert first.src_sha == "sha1"
+
+    unchanged = build_synced_manifest(tmp_path, CONFIG_NAME, ["a.py"], first, src_sha="sha2")
+    assert unchanged == first
+
+    file.write_text("a2")
+    changed = build_synced_manifest(tmp_path, CONFIG_NAME, ["a.py"], first, {"a.py"}, src_sha="sha3")
+    assert changed.src_sha == "sha3"
+
+    new_config = build_synced_manifest(tmp_path, CONFIG_NAME, ["a.py"], changed, src_sha="sha4", config_digest="d2")
+    assert (new_config.src_sha, new_config.config_digest) == ("sha3", "d2")
+
+
+def test_build_manifest_hashes_only_written_and_new_keys(tmp_path: Path):
+    for name in ["a.py", "b.py", "new.py"]:
+        (tmp_path / name).write_text(name)
+    previous = SyncedManifest(config_name=CONFIG_NAME, files={"a.py": "old-a", "b.py": "old-b"})
+
+    with patch(f"{build_synced_manifest.__module__}.file_sha256", wraps=file_sha256) as mock_hash:
+        manifest = build_synced_manifest(tmp_path, CONFIG_NAME, ["a.py", "b.py", "new.py"], previous, {"a.py"})
+
+    assert sorted(call.args[0].name for call in mock_hash.call_args_list) == ["a.py", "new.py"]
+    assert manifest.files["b.py"] == "old-b"
+    assert manifest.files["a.py"] == file_sha256(tmp_path / "a.py")
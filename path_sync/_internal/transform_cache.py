@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import NamedTuple
+
+from path_sync import sections
+from path_sync._internal import header
+from path_sync._internal.models import SyncMode
+from path_sync._internal.src_reader import FILE_READER, SourceReader
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class TransformKey(NamedTuple):
+    src_path: Path
+    dest_key: str
+    should_wrap: bool
+    sync_mode: SyncMode
+    binary_hint: bool | None = None
+
+
+@dataclass
+class SourceTransform:
+    """Destination-independent result of reading and preparing one source file.
+
+    `content` is the header-stripped text, None for binary files.
+    For SYNC files with a known comment prefix, `section_content` is the text that gets merged as sections
+    (the source itself when it has sections, the wrapped variant when wrapping) and `sections` its parsed form.
+    For REPLACE/SCAFFOLD files, `rendered` holds the final bytes written to every destination.
+    """
+
+    content: str | None
+    section_content: str | None = None
+    src_sections: list[sections.Section] | None = None
+    rendered: bytes | None = None
+    _merge_digest: str | None = None
+
+    def merge_digest(self) -> str:
+        """sha256 of the text a SYNC merge consumes, prefixed by whether it is merged as sections."""
+        if self._merge_digest is None:
+            text = self.section_content if self.section_content is not None else self.content or ""
+            kind = "sections" if self.src_sections is not None else "plain"
+            self._merge_digest = f"{kind}:{hashlib.sha256(text.encode()).hexdigest()}"
+        return self._merge_digest
+
+    @property
+    def is_binary(self) -> bool:
+        return self.content is None
+
+    @property
+    def size(self) -> int:
+        total = len(self.content or "") + len(self.rendered or b"")
+        if self.section_content is not None and self.section_content is not self.content:
+            total += len(self.section_content)
+        if self.src_sections:
+            total += sum(len(s.content) for s in self.src_sections)
+        return total
+
+
+def build_transform(key: TransformKey, dest_path: Path, reader: SourceReader = FILE_READER) -> SourceTransform:
+    text = reader.read_text(key.src_path, key.binary_hint)
+    if text is None:
+        return SourceTransform(content=None)
+    content = header.remove_header(text)
+
+    if key.sync_mode != SyncMode.SYNC:
+        return SourceTransform(content=content, rendered=content.encode())
+    if not header.has_known_comment_prefix(dest_path):
+        return SourceTransform(content=content)
+    if sections.has_sections(content, dest_path):
+        section_content = content
+    elif key.should_wrap:
+        section_content = sections.wrap_in_synced_section(content, dest_path)
+    else:
+        return SourceTransform(content=content)
+    return SourceTransform(
+        content=content,
+        section_content=section_content,
+        src_sections=sections.parse_sections(section_content, dest_path),
+    )
+
+
+class TransformCache:
+    """Run-scoped LRU cache of SourceTransform, bounded by the approximate size of the cached text."""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, reader: SourceReader = FILE_READER) -> None:
+        self.max_bytes = max_bytes
+        self.reader = reader
+        self._entries: OrderedDict[TransformKey, SourceTransform] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: TransformKey, dest_path: Path) -> SourceTransform:
+        with self._lock:
+            if (cached := self._entries.get(key)) is not None:
+                self._entries.move_to_end(key)
+                return cached
+        transform = build_transform(key, dest_path, self.reader)
+        self._put(key, transform)
+        return transform
+
+    def _put(self, key: TransformKey, transform: SourceTransform) -> None:
+        size = transform.size
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = transform
+            self._size += size
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.size
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+from path_sync._internal.header import add_header
+from path_sync._internal.models import SyncMode
+from path_sync._internal.transform_cache import TransformCache, TransformKey, build_transform
+
+
+def test_build_transform_replace_renders_bytes_without_header(tmp_path: Path):
+    src = tmp_path / "LICENSE"
+    src.write_text(add_header("MIT", tmp_path / "x.py", "other"))
+    transform = build_transform(TransformKey(src, "LICENSE", False, SyncMode.REPLACE), tmp_path / "LICENSE")
+    assert transform.content == "MIT"
+    assert transform.rendered == b"MIT"
+
+
+def test_build_transform_wraps_and_parses_sections(tmp_path: Path):
+    src = tmp_path / "file.py"
+    src.write_text("print('hi')")
+    transform = build_transform(TransformKey(src, "file.py", True, SyncMode.SYNC), tmp_path / "file.py")
+    assert transform.section_content and "DO_NOT_EDIT: path-sync synced" in transform.section_content
+    assert [s.id for s in transform.src_sections or []] == ["synced"]
+
+
+def test_build_transform_binary(tmp_path: Path):
+    src = tmp_path / "logo.png"
+    src.write_bytes(b"\x89PNG\xff\xfe")
+    assert build_transform(TransformKey(src, "logo.png", False, SyncMode.SYNC), src).is_binary
+
+
+def test_transform_cache_reads_source_once(tmp_path: Path):
+    src = tmp_path / "file.py"
+    src.write_text("content")
+    key = TransformKey(src, "file.py", False, SyncMode.SYNC)
+    cache = TransformCache()
+    with patch.object(Path, "open", autospec=True, side_effect=Path.open) as mock_read:
+        first = cache.get(key, tmp_path / "dest1" / "file.py")
+        second = cache.get(key, tmp_path / "dest2" / "file.py")
+    assert first is second
+    assert mock_read.call_count == 1
+
+
+def test_build_transform_sniffs_prefix_and_honors_hints(tmp_path: Path):
+    src = tmp_path / "data.txt"
+    src.write_bytes(b"abc\0" + b"x" * 100_000)
+    with patch.object(Path, "open", autospec=True, side_effect=Path.open) as mock_open:
+        assert build_transform(TransformKey(src, "data.txt", False, SyncMode.SYNC), src).is_binary
+    assert mock_open.call_count == 1
+
+    text = tmp_path / "notes.md"
+    text.write_bytes(b"line1\r\nline2")
+    with patch.object(Path, "open", side_effect=AssertionError("opened")):
+        assert build_transform(TransformKey(text, "notes.md", False, SyncMode.SYNC, True), text).is_binary
+    assert build_transform(TransformKey(text, "notes.md", False, SyncMode.SYNC), text).content == "line1\nline2"
+
+
+def test_transform_cache_evicts_least_recently_used(tmp_path: Path):
+    keys = []
+    for name in ["a", "b", "c"]:
+        src = tmp_path / f"{name}.txt"
+        src.write_text(name * 10)
+        keys.append(TransformKey(src, src.name, False, SyncMode.REPLACE))
+    cache = TransformCache(max_bytes=45)
+    for key in keys:
+        cache.get(key, key.src_path)
+    assert len(cache) == 2
+    assert keys[0] not in cache._entries
@@ -10,8 +10,11 @@ T = TypeVar("T", bound=BaseModel)
 
 
 def load_yaml_model(path: Path, model_type: type[T]) -> T:
-    data = yaml.safe_load(path.read_text())
-    return model_type.model_validate(data)
+    return parse_yaml_model(path.read_text(), model_type)
+
+
+def parse_yaml_model(text: str, model_type: type[T]) -> T:
+    return model_type.model_validate(yaml.safe_load(text))
 
 
 def dump_yaml_model(model: BaseModel) -> str:
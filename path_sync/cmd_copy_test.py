@@ -3,28 +3,48 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 from git import Repo
+from typer.testing import CliRunner
 
+from path_sync.__main__ import app
 from path_sync._internal import git_ops
+from path_sync._internal.auto_merge import PRRef
 from path_sync._internal.cmd_copy import (
+    EXIT_CHANGES,
+    EXIT_NO_CHANGES,
     CopyOptions,
+    CopyRun,
+    DestSync,
     _cleanup_orphans,
     _close_stale_pr,
+    _copy_file,
+    _file_tasks,
+    _run_copy,
+    _run_file_tasks,
     _skip_already_synced,
-    _sync_path,
+    _sync_destinations,
 )
+from path_sync._internal.copy_plan import load_plan
+from path_sync._internal.file_utils import CompareStats, stream_copy_file
 from path_sync._internal.header import add_header, has_header
+from path_sync._internal.log_capture import capture_log
+from path_sync._internal.merge_cache import MergeCache
 from path_sync._internal.models import (
     CommitConfig,
     Destination,
     OnFailStrategy,
     PathMapping,
+    SourceFiles,
     SrcConfig,
     SyncMode,
     VerifyConfig,
     VerifyStep,
 )
+from path_sync._internal.path_table import PathTable
 from path_sync._internal.repo_utils import ensure_repo
+from path_sync._internal.src_manifest import SourceManifest
+from path_sync._internal.synced_manifest import SyncedManifest, load_synced_manifest
 from path_sync._internal.verify import VerifyStatus, run_verify_steps
+from path_sync._internal.yaml_utils import dump_yaml_model
 
 CONFIG_NAME = "test-config"
 
@@ -34,6 +54,21 @@ def _make_dest(**kwargs) -> Destination:
     return Destination(**(defaults | kwargs))  # pyright: ignore[reportArgumentType]
 
 
+def _sync_mapping(
+    mapping: PathMapping,
+    src_root: Path,
+    dest_root: Path,
+    dest: Destination,
+    written: list[Path] | None = None,
+    **settings,
+) -> tuple[int, PathTable]:
+    """Run the file tasks of one mapping like `_sync_paths` does, returns the changed file count and synced keys."""
+    sync = DestSync(dest, src_root, dest_root, CONFIG_NAME, **settings)
+    synced = PathTable()
+    tasks = _file_tasks(mapping, None, sync, synced)
+    return _run_file_tasks(tasks, sync.file_jobs, written), synced
+
+
 def test_sync_single_file(tmp_path):
     src_root = tmp_path / "src"
     dest_root = tmp_path / "dest"
@@ -43,10 +78,10 @@ def test_sync_single_file(tmp_path):
     (src_root / "file.py").write_text("content")
 
     mapping = PathMapping(src_path="file.py", dest_path="out.py")
-    changes, synced = _sync_path(mapping, src_root, dest_root, _make_dest(), CONFIG_NAME, False, False)
+    changes, synced = _sync_mapping(mapping, src_root, dest_root, _make_dest())
 
     assert changes == 1
-    assert dest_root / "out.py" in synced
+    assert "out.py" in synced
     result = (dest_root / "out.py").read_text()
     assert has_header(result)
     assert f"path-sync copy -n {CONFIG_NAME}" in result
@@ -62,7 +97,7 @@ def test_sync_skips_opted_out_file(tmp_path):
     (dest_root / "file.py").write_text("local content without header")
 
     mapping = PathMapping(src_path="file.py")
-    changes, _ = _sync_path(mapping, src_root, dest_root, _make_dest(), CONFIG_NAME, False, False)
+    changes, _ = _sync_mapping(mapping, src_root, dest_root, _make_dest())
 
     assert changes == 0
     assert (dest_root / "file.py").read_text() == "local content without header"
@@ -79,7 +114,7 @@ def test_force_overwrite_adds_header_when_content_matches(tmp_path):
     (dest_root / "file.py").write_text(content)  # No header, same content
 
     mapping = PathMapping(src_path="file.py")
-    changes, _ = _sync_path(mapping, src_root, dest_root, _make_dest(), CONFIG_NAME, False, True)
+    changes, _ = _sync_mapping(mapping, src_root, dest_root, _make_dest(), force_overwrite=True)
 
     assert changes == 1
     result = (dest_root / "file.py").read_text()
@@ -99,7 +134,7 @@ def test_cleanup_orphans(tmp_path):
     other = dest_root / "other.py"
     other.write_text(add_header("other content", other, "other-config"))
 
-    synced: set = set()  # No files synced
+    synced = PathTable()  # No files synced
     deleted = _cleanup_orphans(dest_root, CONFIG_NAME, synced, dry_run=False)
 
     assert deleted == 1
@@ -107,6 +142,47 @@ def test_cleanup_orphans(tmp_path):
     assert other.exists()
 
 
+def test_cleanup_orphans_uses_synced_manifest(tmp_path: Path):
+    orphan = tmp_path / "orphan.py"
+    orphan.write_text(add_header("orphan", orphan, CONFIG_NAME))
+    opted_out = tmp_path / "opted_out.py"
+    opted_out.write_text("header removed")
+    not_in_manifest = tmp_path / "unlisted.py"
+    not_in_manifest.write_text(add_header("unlisted", not_in_manifest, CONFIG_NAME))
+    manifest = SyncedManifest(config_name=CONFIG_NAME, files={"orphan.py": "", "opted_out.py": ""})
+
+    with patch(f"{COPY_MODULE}._find_files_with_config") as mock_scan:
+        deleted = _cleanup_orphans(tmp_path, CONFIG_NAME, PathTable(), dry_run=False, synced_manifest=manifest)
+        mock_scan.assert_not_called()
+
+    assert deleted == 1
+    assert not orphan.exists()
+    assert opted_out.exists()
+    assert not_in_manifest.exists()
+
+
+def test_cleanup_orphans_uses_git_index(tmp_repo: Path):
+    repo = Repo(tmp_repo)
+    (tmp_repo / ".gitignore").write_text("node_modules/\n")
+    tracked = tmp_repo / "tracked.py"
+    tracked.write_text(add_header("tracked", tracked, CONFIG_NAME))
+    repo.index.add([".gitignore", "tracked.py"])
+    repo.index.commit("add files")
+
+    untracked = tmp_repo / "untracked.py"
+    untracked.write_text(add_header("untracked", untracked, CONFIG_NAME))
+    ignored = tmp_repo / "node_modules" / "pkg" / "ignored.py"
+    ignored.parent.mkdir(parents=True)
+    ignored.write_text(add_header("ignored", ignored, CONFIG_NAME))
+
+    deleted = _cleanup_orphans(tmp_repo, CONFIG_NAME, PathTable(), dry_run=False)
+
+    assert deleted == 2
+    assert not tracked.exists()
+    assert not untracked.exists()
+    assert ignored.exists()
+
+
 def test_sync_with_sections_replaces_managed(tmp_path):
     src_root = tmp_path / "src"
     dest_root = tmp_path / "dest"
@@ -132,7 +208,7 @@ old recipe
     dest_file.write_text(dest_content)
 
     mapping = PathMapping(src_path="file.sh")
-    changes, _ = _sync_path(mapping, src_root, dest_root, _make_dest(), CONFIG_NAME, False, False)
+    changes, _ = _sync_mapping(mapping, src_root, dest_root, _make_dest())
 
     assert changes == 1
     result = (dest_root / "file.sh").read_text()
@@ -141,6 +217,39 @@ old recipe
     assert "# my custom stuff" in result
 
 
+def test_sync_sections_merge_cache_skips_unchanged_merge(tmp_path):
+    src_root = tmp_path / "src"
+    dest_root = tmp_path / "dest"
+    src_root.mkdir()
+    dest_root.mkdir()
+    (src_root / "file.sh").write_text(
+        "# === DO_NOT_EDIT: path-sync standard ===\nrecipe\n# === OK_EDIT: path-sync standard ==="
+    )
+    mapping = PathMapping(src_path="file.sh")
+    merge_cache = MergeCache.load(CONFIG_NAME, tmp_path / "cache")
+
+    def sync() -> int:
+        changes, _ = _sync_mapping(mapping, src_root, dest_root, _make_dest(), merge_cache=merge_cache)
+        return changes
+
+    assert sync() == 1
+    with (dest_root / "file.sh").open("a") as f:
+        f.write("\n# my custom stuff")
+    assert sync() == 0
+    assert (merge_cache.hits, len(merge_cache)) == (0, 1)
+
+    with patch("path_sync._internal.cmd_copy.sections.replace_sections") as mock_replace:
+        assert sync() == 0
+    mock_replace.assert_not_called()
+    assert merge_cache.hits == 1
+
+    (src_root / "file.sh").write_text(
+        "# === DO_NOT_EDIT: path-sync standard ===\nnew recipe\n# === OK_EDIT: path-sync standard ==="
+    )
+    assert sync() == 1
+    assert "new recipe" in (dest_root / "file.sh").read_text()
+
+
 def test_sync_with_sections_skip(tmp_path):
     src_root = tmp_path / "src"
     dest_root = tmp_path / "dest"
@@ -166,7 +275,7 @@ keep this
 
     dest = _make_dest(skip_sections={"file.sh": ["standard"]})
     mapping = PathMapping(src_path="file.sh")
-    changes, _ = _sync_path(mapping, src_root, dest_root, dest, CONFIG_NAME, False, False)
+    changes, _ = _sync_mapping(mapping, src_root, dest_root, dest)
 
     assert changes == 0
     assert "keep this" in (dest_root / "file.sh").read_text()
@@ -202,10 +311,10 @@ def test_source_with_header_no_duplicate(tmp_path):
     src_file.write_text(src_content_with_header)
 
     mapping = PathMapping(src_path="file.py")
-    changes, synced = _sync_path(mapping, src_root, dest_root, _make_dest(), CONFIG_NAME, False, False)
+    changes, synced = _sync_mapping(mapping, src_root, dest_root, _make_dest())
 
     assert changes == 1
-    assert dest_root / "file.py" in synced
+    assert "file.py" in synced
     result = (dest_root / "file.py").read_text()
 
     # Should have exactly one header line with CONFIG_NAME, not two headers
@@ -225,7 +334,7 @@ def test_file_mode_replace_no_header(tmp_path):
     (dest_root / "LICENSE").write_text("old license")
 
     mapping = PathMapping(src_path="LICENSE", sync_mode=SyncMode.REPLACE)
-    changes, _ = _sync_path(mapping, src_root, dest_root, _make_dest(), CONFIG_NAME, False, False)
+    changes, _ = _sync_mapping(mapping, src_root, dest_root, _make_dest())
 
     assert changes == 1
     result = (dest_root / "LICENSE").read_text()
@@ -243,11 +352,47 @@ def test_file_mode_replace_skips_unchanged(tmp_path):
     (dest_root / "LICENSE").write_text("MIT License")
 
     mapping = PathMapping(src_path="LICENSE", sync_mode=SyncMode.REPLACE)
-    changes, _ = _sync_path(mapping, src_root, dest_root, _make_dest(), CONFIG_NAME, False, False)
+    changes, _ = _sync_mapping(mapping, src_root, dest_root, _make_dest())
 
     assert changes == 0
 
 
+def test_binary_file_size_mismatch_skips_dest_read(tmp_path):
+    src_root = tmp_path / "src"
+    dest_root = tmp_path / "dest"
+    src_root.mkdir()
+    dest_root.mkdir()
+
+    (src_root / "font.bin").write_bytes(b"\xff\xfe" * 100)
+    (dest_root / "font.bin").write_bytes(b"\xff\xfe" * 300)
+
+    mapping = PathMapping(src_path="font.bin")
+    stats = CompareStats()
+    changes, _ = _sync_mapping(mapping, src_root, dest_root, _make_dest(), stats=stats)
+
+    assert changes == 1
+    assert stats.bytes_skipped == 600
+    assert (dest_root / "font.bin").read_bytes() == b"\xff\xfe" * 100
+    changes, _ = _sync_mapping(mapping, src_root, dest_root, _make_dest(), stats=stats)
+    assert changes == 0
+
+
+def test_binary_file_streamed_above_threshold(tmp_path):
+    src_root = tmp_path / "src"
+    dest_root = tmp_path / "dest"
+    src_root.mkdir()
+    dest_root.mkdir()
+    (src_root / "asset.bin").write_bytes(b"\xff" * 64)
+
+    mapping = PathMapping(src_path="asset.bin", dest_path="assets/asset.bin")
+    with patch("path_sync._internal.src_reader.stream_copy_file", wraps=stream_copy_file) as mock_stream:
+        changes, _ = _sync_mapping(mapping, src_root, dest_root, _make_dest(), stream_threshold=64)
+
+    assert changes == 1
+    mock_stream.assert_called_once_with(src_root / "asset.bin", dest_root / "assets/asset.bin")
+    assert (dest_root / "assets/asset.bin").read_bytes() == b"\xff" * 64
+
+
 def test_file_mode_scaffold_creates_new(tmp_path):
     src_root = tmp_path / "src"
     dest_root = tmp_path / "dest"
@@ -257,7 +402,7 @@ def test_file_mode_scaffold_creates_new(tmp_path):
     (src_root / ".gitignore").write_text("*.pyc")
 
     mapping = PathMapping(src_path=".gitignore", sync_mode=SyncMode.SCAFFOLD)
-    changes, _ = _sync_path(mapping, src_root, dest_root, _make_dest(), CONFIG_NAME, False, False)
+    changes, _ = _sync_mapping(mapping, src_root, dest_root, _make_dest())
 
     assert changes == 1
     result = (dest_root / ".gitignore").read_text()
@@ -275,10 +420,12 @@ def test_file_mode_scaffold_skips_existing(tmp_path):
     (dest_root / ".gitignore").write_text("user customized")
 
     mapping = PathMapping(src_path=".gitignore", sync_mode=SyncMode.SCAFFOLD)
-    changes, _ = _sync_path(mapping, src_root, dest_root, _make_dest(), CONFIG_NAME, False, False)
+    with patch("path_sync._internal.file_state.build_transform") as transform_mock:
+        changes, _ = _sync_mapping(mapping, src_root, dest_root, _make_dest())
 
     assert changes == 0
     assert (dest_root / ".gitignore").read_text() == "user customized"
+    transform_mock.assert_not_called()
 
 
 def test_sync_new_file_respects_skip_sections(tmp_path):
@@ -299,7 +446,7 @@ skip this
 
     dest = _make_dest(skip_sections={"file.sh": ["skipped"]})
     mapping = PathMapping(src_path="file.sh")
-    changes, _ = _sync_path(mapping, src_root, dest_root, dest, CONFIG_NAME, False, False)
+    changes, _ = _sync_mapping(mapping, src_root, dest_root, dest)
 
     assert changes == 1
     result = (dest_root / "file.sh").read_text()
@@ -401,9 +548,7 @@ def test_wrap_synced_files_wraps_content_in_section(tmp_path):
     (src_root / "file.py").write_text("def hello(): pass")
 
     mapping = PathMapping(src_path="file.py")
-    changes, _ = _sync_path(
-        mapping, src_root, dest_root, _make_dest(), CONFIG_NAME, False, False, wrap_synced_files=True
-    )
+    changes, _ = _sync_mapping(mapping, src_root, dest_root, _make_dest(), wrap_synced_files=True)
 
     assert changes == 1
     result = (dest_root / "file.py").read_text()
@@ -421,9 +566,7 @@ def test_wrap_per_path_override_disables(tmp_path):
     (src_root / "file.py").write_text("content")
 
     mapping = PathMapping(src_path="file.py", wrap=False)
-    changes, _ = _sync_path(
-        mapping, src_root, dest_root, _make_dest(), CONFIG_NAME, False, False, wrap_synced_files=True
-    )
+    changes, _ = _sync_mapping(mapping, src_root, dest_root, _make_dest(), wrap_synced_files=True)
 
     assert changes == 1
     result = (dest_root / "file.py").read_text()
@@ -452,9 +595,7 @@ managed content v1
     dest_file.write_text(dest_content)
 
     mapping = PathMapping(src_path="file.py")
-    changes, _ = _sync_path(
-        mapping, src_root, dest_root, _make_dest(), CONFIG_NAME, False, False, wrap_synced_files=True
-    )
+    changes, _ = _sync_mapping(mapping, src_root, dest_root, _make_dest(), wrap_synced_files=True)
 
     assert changes == 1
     result = (dest_root / "file.py").read_text()
@@ -477,9 +618,7 @@ already has sections
     (src_root / "file.sh").write_text(src_content)
 
     mapping = PathMapping(src_path="file.sh")
-    changes, _ = _sync_path(
-        mapping, src_root, dest_root, _make_dest(), CONFIG_NAME, False, False, wrap_synced_files=True
-    )
+    changes, _ = _sync_mapping(mapping, src_root, dest_root, _make_dest(), wrap_synced_files=True)
 
     assert changes == 1
     result = (dest_root / "file.sh").read_text()
@@ -523,7 +662,7 @@ dest-recipe:
     (dest_root / "justfile").write_text(dest_content)
 
     mapping = PathMapping(src_path="justfile")
-    changes, _ = _sync_path(mapping, src_root, dest_root, _make_dest(), CONFIG_NAME, False, False)
+    changes, _ = _sync_mapping(mapping, src_root, dest_root, _make_dest())
 
     assert changes == 1
     result = (dest_root / "justfile").read_text()
@@ -586,3 +725,295 @@ def test_skip_already_synced_checks_by_default(tmp_path: Path):
         mock_git.get_pr_body.return_value = body
         result = _skip_already_synced("dest", tmp_path, "sync/test", "2026-01-01T00:00:00", opts, config)
         assert result
+
+
+def test_sync_destinations_parallel_keeps_config_order(tmp_path: Path):
+    dests = [_make_dest(name=f"dest{i}") for i in range(4)]
+    config = _make_src_config(destinations=dests)
+    opts = CopyOptions(jobs=3, no_prompt=True)
+
+    copy_run = CopyRun(SourceManifest(tmp_path))
+
+    def fake_sync(config, dest, src_root, run, *args):
+        assert run is copy_run
+        index = int(dest.name.removeprefix("dest"))
+        return index, PRRef(dest_name=dest.name, repo_path=tmp_path, branch_or_url=dest.name) if index else None
+
+    with patch(f"{COPY_MODULE}._sync_destination", side_effect=fake_sync):
+        results = _sync_destinations(config, dests, tmp_path, copy_run, "sha", "ts", "url", opts)
+
+    assert [changes for changes, _ in results] == [0, 1, 2, 3]
+    assert [ref.dest_name for _, ref in results if ref] == ["dest1", "dest2", "dest3"]
+
+
+def test_sync_destinations_parallel_raises_first_failure_in_config_order(tmp_path: Path):
+    dests = [_make_dest(name=f"dest{i}") for i in range(3)]
+    config = _make_src_config(destinations=dests)
+    opts = CopyOptions(jobs=3, no_prompt=True)
+
+    def fake_sync(config, dest, *args):
+        if dest.name != "dest0":
+            raise ValueError(dest.name)
+        return 0, None
+
+    with (
+        patch(f"{COPY_MODULE}._sync_destination", side_effect=fake_sync),
+        pytest.raises(ValueError, match="dest1"),
+    ):
+        _sync_destinations(config, dests, tmp_path, CopyRun(SourceManifest(tmp_path)), "sha", "ts", "url", opts)
+
+
+def _commit_all(repo: Repo, message: str) -> None:
+    repo.git.add("-A")
+    repo.index.commit(message)
+
+
+def test_run_copy_incremental_only_syncs_changed_files(tmp_path: Path):
+    src_root = tmp_path / "src"
+    src_root.mkdir()
+    src_repo = Repo.init(src_root)
+    for name in ["a.md", "b.md", "c.md"]:
+        (src_root / "docs" / name).parent.mkdir(exist_ok=True)
+        (src_root / "docs" / name).write_text(f"{name} v1")
+    _commit_all(src_repo, "init")
+    dest_root = tmp_path / "dest"
+    dest_root.mkdir()
+    Repo.init(dest_root)
+    config = _make_src_config(
+        paths=[PathMapping(src_path="docs")], destinations=[_make_dest(dest_path_relative="../dest")]
+    )
+    opts = CopyOptions(skip_commit=True, no_checkout=True, no_prompt=True, incremental=True, no_cache=True)
+
+    assert _run_copy(config, src_root, "", opts) == 4  # 3 files + synced manifest
+    manifest = load_synced_manifest(dest_root, "test")
+    assert manifest and manifest.src_sha == src_repo.head.commit.hexsha
+
+    (src_root / "docs/b.md").write_text("b.md v2")
+    _commit_all(src_repo, "change b")
+    with (
+        patch(f"{COPY_MODULE}._copy_file", wraps=_copy_file) as mock_copy,
+        patch(f"{COPY_MODULE}._cleanup_orphans", wraps=_cleanup_orphans) as mock_cleanup,
+    ):
+        assert _run_copy(config, src_root, "", opts) == 2  # b.md + manifest src_sha/hash
+    assert [c.args[0].name for c in mock_copy.call_args_list] == ["b.md"]
+    mock_cleanup.assert_not_called()
+    assert "b.md v2" in (dest_root / "docs/b.md").read_text()
+
+    (src_root / "docs/a.md").unlink()
+    _commit_all(src_repo, "remove a")
+    with patch(f"{COPY_MODULE}._copy_file", wraps=_copy_file) as mock_copy:
+        assert _run_copy(config, src_root, "", opts) == 2  # orphan + manifest
+    mock_copy.assert_not_called()
+    assert not (dest_root / "docs/a.md").exists()
+    assert (dest_root / "docs/c.md").exists()
+
+
+def test_copy_incremental_full_sync_when_config_path_changes(tmp_path: Path):
+    src_root = tmp_path / "src"
+    (src_root / "configs").mkdir(parents=True)
+    src_repo = Repo.init(src_root)
+    for rel in ["docs/a.md", "extra/b.md"]:
+        (src_root / rel).parent.mkdir(exist_ok=True)
+        (src_root / rel).write_text(rel)
+    config_path = src_root / "configs/my.yaml"
+    dest = _make_dest(dest_path_relative="../dest")
+    config_path.write_text(dump_yaml_model(_make_src_config(paths=[PathMapping(src_path="docs")], destinations=[dest])))
+    _commit_all(src_repo, "init")
+    dest_root = tmp_path / "dest"
+    dest_root.mkdir()
+    Repo.init(dest_root)
+    args = ["copy", "--config-path", str(config_path), "--src-root", str(src_root), "--incremental"]
+    args += ["--skip-commit", "--no-checkout", "--no-prompt", "--detailed-exit-code"]
+
+    assert CliRunner().invoke(app, args).exit_code == EXIT_CHANGES
+    assert CliRunner().invoke(app, args).exit_code == EXIT_NO_CHANGES
+    mappings = [PathMapping(src_path="docs"), PathMapping(src_path="extra")]
+    config_path.write_text(dump_yaml_model(_make_src_config(paths=mappings, destinations=[dest])))
+    _commit_all(src_repo, "add mapping")
+
+    assert CliRunner().invoke(app, args).exit_code == EXIT_CHANGES
+    assert (dest_root / "extra/b.md").exists()
+
+
+def test_run_copy_dot_slash_mappings_keep_synced_files(tmp_path: Path):
+    src_root = tmp_path / "src"
+    (src_root / "docs").mkdir(parents=True)
+    src_repo = Repo.init(src_root)
+    (src_root / "justfile").write_text("default:\n")
+    (src_root / "docs/a.md").write_text("a")
+    _commit_all(src_repo, "init")
+    dest_root = tmp_path / "dest"
+    dest_root.mkdir()
+    Repo.init(dest_root)
+    config = _make_src_config(
+        paths=[PathMapping(src_path="./justfile"), PathMapping(src_path="./docs", dest_path="./site/")],
+        destinations=[_make_dest(dest_path_relative="../dest")],
+    )
+    opts = CopyOptions(skip_commit=True, no_checkout=True, no_prompt=True, no_cache=True)
+
+    assert _run_copy(config, src_root, "", opts) == 3  # 2 files + synced manifest
+    assert _run_copy(config, src_root, "", opts) == 0
+
+    assert (dest_root / "justfile").exists()
+    assert (dest_root / "site/a.md").exists()
+    manifest = load_synced_manifest(dest_root, "test")
+    assert manifest and sorted(manifest.files) == ["justfile", "site/a.md"]
+
+
+def test_run_copy_src_ref_reads_commit_not_working_tree(tmp_path: Path):
+    src_root = tmp_path / "src"
+    (src_root / "docs").mkdir(parents=True)
+    src_repo = Repo.init(src_root)
+    (src_root / "docs/a.md").write_text("a committed")
+    (src_root / "docs/b.bin").write_bytes(b"\x00\x01" * 100)
+    _commit_all(src_repo, "init")
+    (src_root / "docs/a.md").write_text("a uncommitted")
+    (src_root / "docs/new.md").write_text("untracked")
+    dest_root = tmp_path / "dest"
+    dest_root.mkdir()
+    Repo.init(dest_root)
+    config = _make_src_config(
+        paths=[PathMapping(src_path="docs")], destinations=[_make_dest(dest_path_relative="../dest")]
+    )
+    opts = CopyOptions(skip_commit=True, no_checkout=True, no_prompt=True, no_cache=True, src_ref="HEAD")
+
+    assert _run_copy(config, src_root, "", opts) == 3  # 2 files + synced manifest
+    assert "a committed" in (dest_root / "docs/a.md").read_text()
+    assert (dest_root / "docs/b.bin").read_bytes() == b"\x00\x01" * 100
+    assert not (dest_root / "docs/new.md").exists()
+    manifest = load_synced_manifest(dest_root, "test")
+    assert manifest and manifest.src_sha == src_repo.head.commit.hexsha
+
+
+def test_run_copy_plan_out_then_plan_in(tmp_path: Path):
+    src_root = tmp_path / "src"
+    (src_root / "docs").mkdir(parents=True)
+    src_repo = Repo.init(src_root)
+    (src_root / "docs/a.md").write_text("a")
+    (src_root / "docs/b.md").write_text("b")
+    _commit_all(src_repo, "init")
+    dest_root = tmp_path / "dest"
+    (dest_root / "docs").mkdir(parents=True)
+    Repo.init(dest_root)
+    (dest_root / "docs/b.md").write_text(add_header("b", Path("b.md"), "test"))
+    config = _make_src_config(
+        paths=[PathMapping(src_path="docs")], destinations=[_make_dest(dest_path_relative="../dest")]
+    )
+    plan_path = tmp_path / "plan.json"
+    opts = CopyOptions(skip_commit=True, no_checkout=True, no_prompt=True, no_cache=True)
+
+    _run_copy(config, src_root, "", opts.model_copy(update={"dry_run": True, "plan_out": str(plan_path)}))
+    plan = load_plan(plan_path)
+    assert plan.src_sha == src_repo.head.commit.hexsha
+    assert plan.destination("test").writes == ["docs/a.md"]
+    assert not (dest_root / "docs/a.md").exists()
+
+    with patch("path_sync._internal.src_manifest.scan_sources") as mock_scan:
+        assert _run_copy(plan.config, src_root, "", opts, plan) == 2  # a.md + synced manifest
+    mock_scan.assert_not_called()
+    assert "a" in (dest_root / "docs/a.md").read_text()
+
+    (src_root / "docs/a.md").write_text("a v2")
+    _commit_all(src_repo, "change a")
+    with pytest.raises(ValueError, match="Plan was computed for source"):
+        _run_copy(plan.config, src_root, "", opts, plan)
+
+
+def test_sync_mapping_file_jobs_matches_sequential_run(tmp_path: Path):
+    src_root = tmp_path / "src"
+    (src_root / "docs/sub").mkdir(parents=True)
+    for i in range(20):
+        (src_root / ("docs/sub" if i % 2 else "docs") / f"f{i:02}.md").write_text(f"file {i}\n")
+    (src_root / "docs/logo.bin").write_bytes(b"\x00\xff" * 50)
+    mapping = PathMapping(src_path="docs")
+
+    def sync(dest_name: str, file_jobs: int) -> tuple[int, list[Path], str]:
+        dest_root = tmp_path / dest_name
+        dest_root.mkdir()
+        written: list[Path] = []
+        with capture_log(dest_name) as read_log:
+            changes, _ = _sync_mapping(
+                mapping,
+                src_root,
+                dest_root,
+                _make_dest(),
+                written=written,
+                file_jobs=file_jobs,
+            )
+            log = read_log().replace(str(dest_root), "<dest>")
+        return changes, [p.relative_to(dest_root) for p in written], log
+
+    sequential = sync("seq", 1)
+    parallel = sync("par", 4)
+    assert sequential[0] == 21
+    assert sequential[2].count("Wrote") == 21
+    assert parallel == sequential
+    assert (tmp_path / "par/docs/sub/f19.md").read_text() == (tmp_path / "seq/docs/sub/f19.md").read_text()
+
+
+@pytest.mark.parametrize(
+    ("source_files", "expected"),
+    [
+        (SourceFiles.WALK, ["a.md", "dist/out.md", "new.md"]),
+        (SourceFiles.TRACKED, ["a.md"]),
+        (SourceFiles.UNIGNORED, ["a.md", "new.md"]),
+    ],
+)
+def test_run_copy_source_files_mode(tmp_path: Path, source_files: SourceFiles, expected: list[str]):
+    src_root = tmp_path / "src"
+    (src_root / "docs").mkdir(parents=True)
+    src_repo = Repo.init(src_root)
+    (src_root / ".gitignore").write_text("dist/\n")
+    (src_root / "docs/a.md").write_text("a")
+    (src_root / "docs/deleted.md").write_text("gone")
+    _commit_all(src_repo, "init")
+    (src_root / "docs/deleted.md").unlink()
+    (src_root / "docs/dist").mkdir()
+    (src_root / "docs/dist/out.md").write_text("build output")
+    (src_root / "docs/new.md").write_text("new")
+    dest_root = tmp_path / "dest"
+    dest_root.mkdir()
+    Repo.init(dest_root)
+    config = _make_src_config(
+        paths=[PathMapping(src_path="docs")], destinations=[_make_dest(dest_path_relative="../dest")]
+    )
+    opts = CopyOptions(skip_commit=True, no_checkout=True, no_prompt=True, no_cache=True, source_files=source_files)
+
+    _run_copy(config, src_root, "", opts)
+
+    synced = sorted(p.relative_to(dest_root / "docs").as_posix() for p in (dest_root / "docs").rglob("*.md"))
+    assert synced == expected
+
+
+def test_run_copy_sparse_checks_out_mapped_dirs_and_finds_removed_mapping_orphans(tmp_path: Path):
+    src_root = tmp_path / "src"
+    src_repo = Repo.init(src_root)
+    for rel in ["docs/a.md", "legacy/old.md"]:
+        (src_root / rel).parent.mkdir(parents=True, exist_ok=True)
+        (src_root / rel).write_text(rel)
+    _commit_all(src_repo, "init")
+    dest_root = tmp_path / "dest"
+    (dest_root / "big").mkdir(parents=True)
+    dest_repo = Repo.init(dest_root, initial_branch="main")
+    (dest_root / "big/data.txt").write_text("not synced")
+    config = _make_src_config(
+        paths=[PathMapping(src_path="docs"), PathMapping(src_path="legacy")],
+        destinations=[_make_dest(dest_path_relative="../dest")],
+    )
+    opts = CopyOptions(skip_commit=True, no_checkout=True, no_prompt=True, no_cache=True)
+    _run_copy(config, src_root, "", opts)
+    _commit_all(dest_repo, "first sync")
+    remote = Repo.clone_from(str(dest_root), str(tmp_path / "remote.git"), bare=True)
+
+    dest = _make_dest(repo_url=Path(remote.git_dir).as_uri(), sparse=True)
+    config = _make_src_config(paths=[PathMapping(src_path="docs")], destinations=[dest])
+    work_dir = tmp_path / "work"
+    opts = CopyOptions(skip_commit=True, no_prompt=True, no_cache=True, work_dir=str(work_dir))
+    assert _run_copy(config, src_root, "", opts) == 2  # orphan + manifest
+
+    clone = work_dir / dest.name
+    assert Repo(clone).git.sparse_checkout("list").split() == [".github", "docs", "legacy"]
+    assert not (clone / "big").exists()
+    assert (clone / "docs/a.md").exists()
+    assert not (clone / "legacy/old.md").exists()
+    assert Repo(clone).git.status("--porcelain").split() == ["M", ".github/test.synced.yaml", "D", "legacy/old.md"]
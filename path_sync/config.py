@@ -5,6 +5,7 @@ from path_sync._internal.models import HeaderConfig as _HeaderConfig
 from path_sync._internal.models import MergeMethod as _MergeMethod
 from path_sync._internal.models import PathMapping as _PathMapping
 from path_sync._internal.models import PRDefaults as _PRDefaults
+from path_sync._internal.models import SourceFiles as _SourceFiles
 from path_sync._internal.models import SrcConfig as _SrcConfig
 from path_sync._internal.models import SyncMode as _SyncMode
 
@@ -14,5 +15,6 @@ HeaderConfig = _HeaderConfig
 MergeMethod = _MergeMethod
 PRDefaults = _PRDefaults
 PathMapping = _PathMapping
+SourceFiles = _SourceFiles
 SrcConfig = _SrcConfig
 SyncMode = _SyncMode
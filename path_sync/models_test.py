@@ -1,5 +1,8 @@
+import fnmatch
 from pathlib import Path
 
+import pytest
+
 from path_sync._internal.models import (
     Destination,
     PathMapping,
@@ -7,6 +10,7 @@ from path_sync._internal.models import (
     SrcConfig,
     VerifyConfig,
     VerifyStep,
+    compile_matcher,
     find_repo_root,
     resolve_config_path,
 )
@@ -104,6 +108,22 @@ def test_path_mapping_is_excluded():
     assert not mapping.is_excluded(Path("src/models_test.py"))
 
 
+@pytest.mark.parametrize(
+    "name",
+    ["a.pyc", "test_a.py", "a.py", "[x].txt", "x.txt", ".DS_Store", "dir/a.pyc", "A.PYC"],
+)
+def test_compiled_matcher_agrees_with_fnmatch(name: str):
+    patterns = frozenset({"*.pyc", "test_*.py", "[[]x].txt", ".DS_Store"})
+    expected = any(fnmatch.fnmatch(name, pat) for pat in patterns)
+    assert compile_matcher(patterns).matches(name) == expected
+
+
+def test_compiled_matcher_reused_per_mapping():
+    mapping = PathMapping(src_path="src/", exclude_file_patterns={"*.pyc"})
+    assert mapping.exclude_matcher() is mapping.exclude_matcher()
+    assert not compile_matcher(frozenset()).matches("anything")
+
+
 def test_destination_resolve_verify():
     fallback = VerifyConfig(steps=[VerifyStep(run="just test")])
     override = VerifyConfig(steps=[VerifyStep(run="just lint")])